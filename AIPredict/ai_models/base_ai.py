@@ -3,13 +3,19 @@ AI 模型基类
 用于调用真实的 AI API 进行交易决策
 """
 from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
 from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 import logging
+import httpx
 
 logger = logging.getLogger(__name__)
 
+# AI API 连接池配置（长连接复用，避免每次调用重新进行 TCP/TLS 握手）
+_HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=600)
+
 
 class TradingDecision(Enum):
     """交易决策"""
@@ -51,12 +57,30 @@ class AITradingModel(ABC):
         self.total_trades = 0
         self.winning_trades = 0
         
-        # AI 响应记录
-        self.ai_responses: List[Dict] = []
+        # AI 响应记录（最近 100 条）
+        self.ai_responses: deque = deque(maxlen=100)
+        
+        # 复用的 HTTP 客户端（首次调用时创建）
+        self._http_client: Optional[httpx.AsyncClient] = None
         
         # 从 Redis 加载历史响应
         self._load_responses_from_redis()
     
+    def _get_http_client(self, timeout: float = 30.0, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """获取复用的 HTTP 客户端（保持长连接）"""
+        if self._http_client is None or self._http_client.is_closed:
+            client_kwargs = {"timeout": timeout, "limits": _HTTP_LIMITS}
+            if proxy:
+                client_kwargs["proxy"] = proxy
+            self._http_client = httpx.AsyncClient(**client_kwargs)
+        return self._http_client
+    
+    async def close_session(self):
+        """关闭 HTTP 客户端"""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
+    
     @abstractmethod
     async def analyze_market(
         self,
@@ -64,7 +88,8 @@ class AITradingModel(ABC):
         market_data: Dict,
         orderbook: Dict,
         recent_trades: List[Dict],
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> tuple[TradingDecision, float, str]:
         """
         分析市场并做出交易决策
@@ -74,6 +99,7 @@ class AITradingModel(ABC):
             market_data: 市场数据（价格、成交量等）
             orderbook: 订单簿数据
             recent_trades: 最近的交易记录
+            kline_history: K线历史（已格式化的提示词文本）
             
         Returns:
             (决策, 置信度, 理由说明)
@@ -334,7 +360,7 @@ REASONING: [your analysis reasoning, 50-100 words]
             if redis_manager.is_connected():
                 responses = redis_manager.get_ai_responses(self.model_name, limit=100)
                 if responses:
-                    self.ai_responses = responses
+                    self.ai_responses.extend(responses)
                     logger.info(f"✅ 从 Redis 加载 {self.model_name} 的历史响应: {len(responses)} 条")
                 else:
                     logger.info(f"📭 {self.model_name} 没有历史响应")
@@ -361,11 +387,7 @@ REASONING: [your analysis reasoning, 50-100 words]
             "raw_response": raw_response
         }
         
-        self.ai_responses.append(response)
-        
-        # 只保留最近 100 条
-        if len(self.ai_responses) > 100:
-            self.ai_responses = self.ai_responses[-100:]
+        self.ai_responses.append(response)  # deque 自动只保留最近 100 条
         
         # 保存到 Redis
         try:
@@ -391,6 +413,6 @@ REASONING: [your analysis reasoning, 50-100 words]
             "winning_trades": self.winning_trades,
             "win_rate": win_rate,
             "active_positions": len(self.positions),
-            "recent_decisions": self.ai_responses[-5:] if self.ai_responses else []
+            "recent_decisions": list(islice(reversed(self.ai_responses), 5))[::-1]
         }
 
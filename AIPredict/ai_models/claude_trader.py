@@ -2,7 +2,6 @@
 Claude AI 交易模型
 使用 Anthropic Claude API
 """
-import httpx
 from typing import Dict, List, Optional
 from .base_ai import AITradingModel, TradingDecision
 
@@ -32,7 +31,8 @@ class ClaudeTrader(AITradingModel):
         market_data: Dict,
         orderbook: Dict,
         recent_trades: List[Dict],
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> tuple[TradingDecision, float, str]:
         """
         使用 Claude 分析市场
@@ -42,6 +42,7 @@ class ClaudeTrader(AITradingModel):
             market_data: 市场数据
             orderbook: 订单簿
             recent_trades: 最近交易
+            kline_history: K线历史（已格式化的提示词文本）
             
         Returns:
             (决策, 置信度, 理由)
@@ -50,30 +51,30 @@ class ClaudeTrader(AITradingModel):
         position_info = self.positions.get(coin)
         
         # 创建提示词
-        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info)
+        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info, kline_history=kline_history)
         
         try:
             # 调用 Claude API
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "x-api-key": self.api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "max_tokens": 500,
-                        "temperature": 0.7,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
-                )
+            client = self._get_http_client(timeout=30.0)
+            response = await client.post(
+                self.api_url,
+                headers={
+                    "x-api-key": self.api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json"
+                },
+                json={
+                    "model": self.model,
+                    "max_tokens": 500,
+                    "temperature": 0.7,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                }
+            )
             
             if response.status_code == 200:
                 result = response.json()
@@ -35,7 +35,8 @@ class GeminiTrader(AITradingModel):
         market_data: Dict,
         orderbook: Dict,
         recent_trades: List[Dict],
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> tuple[TradingDecision, float, str]:
         """
         使用 Gemini 分析市场
@@ -45,53 +46,54 @@ class GeminiTrader(AITradingModel):
             market_data: 市场数据
             orderbook: 订单簿
             recent_trades: 最近交易
+            kline_history: K线历史（已格式化的提示词文本）
             
         Returns:
             (决策, 置信度, 理由)
         """
         position_info = self.positions.get(coin)
-        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info)
+        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info, kline_history=kline_history)
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.api_url}?key={self.api_key}",
-                    headers={
-                        "Content-Type": "application/json"
+            client = self._get_http_client(timeout=30.0)
+            response = await client.post(
+                f"{self.api_url}?key={self.api_key}",
+                headers={
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "contents": [{
+                        "role": "user",
+                        "parts": [{
+                            "text": prompt
+                        }]
+                    }],
+                    "generationConfig": {
+                        "temperature": 0.7,
+                        "maxOutputTokens": 4096,
+                        "topP": 0.8,
+                        "topK": 40
                     },
-                    json={
-                        "contents": [{
-                            "role": "user",
-                            "parts": [{
-                                "text": prompt
-                            }]
-                        }],
-                        "generationConfig": {
-                            "temperature": 0.7,
-                            "maxOutputTokens": 4096,
-                            "topP": 0.8,
-                            "topK": 40
+                    "safetySettings": [
+                        {
+                            "category": "HARM_CATEGORY_HARASSMENT",
+                            "threshold": "BLOCK_NONE"
                         },
-                        "safetySettings": [
-                            {
-                                "category": "HARM_CATEGORY_HARASSMENT",
-                                "threshold": "BLOCK_NONE"
-                            },
-                            {
-                                "category": "HARM_CATEGORY_HATE_SPEECH",
-                                "threshold": "BLOCK_NONE"
-                            },
-                            {
-                                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                                "threshold": "BLOCK_NONE"
-                            },
-                            {
-                                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                                "threshold": "BLOCK_NONE"
-                            }
-                        ]
-                    }
-                )
+                        {
+                            "category": "HARM_CATEGORY_HATE_SPEECH",
+                            "threshold": "BLOCK_NONE"
+                        },
+                        {
+                            "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+                            "threshold": "BLOCK_NONE"
+                        },
+                        {
+                            "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+                            "threshold": "BLOCK_NONE"
+                        }
+                    ]
+                }
+            )
             
             if response.status_code == 200:
                 result = response.json()
@@ -2,7 +2,6 @@
 GPT AI 交易模型
 使用 OpenAI GPT API
 """
-import httpx
 from typing import Dict, List, Optional
 from .base_ai import AITradingModel, TradingDecision
 
@@ -32,7 +31,8 @@ class GPTTrader(AITradingModel):
         market_data: Dict,
         orderbook: Dict,
         recent_trades: List[Dict],
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> tuple[TradingDecision, float, str]:
         """
         使用 GPT 分析市场
@@ -42,36 +42,37 @@ class GPTTrader(AITradingModel):
             market_data: 市场数据
             orderbook: 订单簿
             recent_trades: 最近交易
+            kline_history: K线历史（已格式化的提示词文本）
             
         Returns:
             (决策, 置信度, 理由)
         """
         position_info = self.positions.get(coin)
-        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info)
+        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info, kline_history=kline_history)
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "你是一个专业的加密货币合约交易分析师。"
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "max_completion_tokens": 2000
-                    }
-                )
+            client = self._get_http_client(timeout=30.0)
+            response = await client.post(
+                self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "你是一个专业的加密货币合约交易分析师。"
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    "max_completion_tokens": 2000
+                }
+            )
             
             if response.status_code == 200:
                 result = response.json()
@@ -32,7 +32,8 @@ class GrokTrader(AITradingModel):
         market_data: Dict,
         orderbook: Dict,
         recent_trades: List[Dict],
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> tuple[TradingDecision, float, str]:
         """
         使用 Grok 分析市场
@@ -42,12 +43,13 @@ class GrokTrader(AITradingModel):
             market_data: 市场数据
             orderbook: 订单簿
             recent_trades: 最近交易
+            kline_history: K线历史（已格式化的提示词文本）
             
         Returns:
             (决策, 置信度, 理由)
         """
         position_info = self.positions.get(coin)
-        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info)
+        prompt = self.create_market_prompt(coin, market_data, orderbook, position_info, kline_history=kline_history)
         
         # 添加重试机制
         max_retries = 3
@@ -56,33 +58,29 @@ class GrokTrader(AITradingModel):
                 # 配置代理
                 import os
                 proxy = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
-                client_kwargs = {"timeout": 45.0}
-                if proxy:
-                    client_kwargs["proxy"] = proxy
-                
-                async with httpx.AsyncClient(**client_kwargs) as client:
-                    response = await client.post(
-                        self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {
-                                    "role": "system",
-                                    "content": "你是一个专业的加密货币合约交易分析师。"
-                                },
-                                {
-                                    "role": "user",
-                                    "content": prompt
-                                }
-                            ],
-                            "temperature": 0.7,
-                            "max_tokens": 500
-                        }
-                    )
+                client = self._get_http_client(timeout=45.0, proxy=proxy)
+                response = await client.post(
+                    self.api_url,
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": self.model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "你是一个专业的加密货币合约交易分析师。"
+                            },
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ],
+                        "temperature": 0.7,
+                        "max_tokens": 500
+                    }
+                )
                 
                 if response.status_code == 200:
                     result = response.json()
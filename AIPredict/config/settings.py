@@ -1,6 +1,7 @@
 """
 配置管理模块
 """
+from functools import lru_cache
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -99,6 +100,7 @@ class Settings(BaseSettings):
     news_take_profit_pct: float = 0.05  # 止盈比例 5%
     news_min_margin_pct: float = 0.30  # 最小保证金比例 30%
     news_max_margin_pct: float = 1.00  # 最大保证金比例 100%
+    alpha_hunter_concurrency: int = 16  # Alpha Hunter 新闻触发时同时执行交易的用户数上限
     
     # DEX交易配置（多链）
     base_chain_enabled: bool = False  # 是否启用Base链
@@ -146,13 +148,14 @@ def is_symbol_allowed(symbol: str) -> bool:
     return symbol.upper() in allowed
 
 
+@lru_cache(maxsize=1)
 def get_enabled_platforms():
-    """获取启用的交易平台列表"""
+    """获取启用的交易平台列表（运行期间不变，结果缓存为不可变元组）"""
     if not settings.enabled_platforms:
-        return ["hyperliquid"]  # 默认只启用 Hyperliquid
+        return ("hyperliquid",)  # 默认只启用 Hyperliquid
     
     platforms = [p.strip().lower() for p in settings.enabled_platforms.split(',')]
-    return [p for p in platforms if p]  # 过滤空字符串
+    return tuple(p for p in platforms if p)  # 过滤空字符串
 
 
 def is_platform_enabled(platform: str) -> bool:
@@ -3,7 +3,22 @@ AI共识交易系统 - 多平台对比版
 支持同时在 Hyperliquid 和 Aster 平台上交易，对比收益
 """
 import asyncio
+import atexit
+import hashlib
+import json
 import logging
+import logging.handlers
+import queue
+import re
+import time
+import traceback
+import aiohttp
+import eth_account
+from eth_account.messages import encode_typed_data
+from eth_utils import keccak, to_checksum_address
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
@@ -19,8 +34,10 @@ from trading.aster.client import AsterClient
 from trading.multi_platform_trader import MultiPlatformTrader
 from utils.symbol_filter import symbol_filter
 from trading.kline_manager import KlineManager
-from ai_models.base_ai import TradingDecision
+from ai_models.base_ai import AITradingModel, TradingDecision
 from utils.redis_manager import redis_manager
+from utils.singleflight import SingleFlight
+from utils.ttl_cache import TTLCache
 
 # 消息驱动交易系统
 from news_trading.news_handler import news_handler
@@ -34,24 +51,61 @@ from news_trading.message_listeners.upbit_listing_listener import create_upbit_l
 from news_trading.message_listeners.coinbase_listener import create_coinbase_listener
 from news_trading.message_listeners.base_listener import ListingMessage
 from news_trading.config import is_supported_coin
+from news_trading.coin_profiles import ProjectType, ProjectStage, TradingPlatform, NewsSource
+from news_trading.logo_config import get_platform_logo, get_news_source_logo, get_ai_model_logo
 from config.settings import get_news_trading_ais
 
 # Alpha Hunter 系统
 from news_trading.alpha_hunter import alpha_hunter
 
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response, BackgroundTasks
+from pydantic import BaseModel, Field
 from fastapi.responses import StreamingResponse
 from fastapi.responses import FileResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
 
+# 所有接口默认优先使用 orjson 序列化，未安装时回退到标准 JSONResponse
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
+
+def _encode_json(payload) -> bytes:
+    """将接口数据预先序列化为 JSON 字节（优先 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8")
+
+
+# 可选：coincurve（libsecp256k1）加速签名恢复，未安装时使用 eth_account
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# 日志格式化与输出交给后台线程，事件循环只负责入队（出错高峰时不阻塞其他交易者）
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # 静态文件路由 - 提供logo图片访问
 from fastapi.staticfiles import StaticFiles
@@ -62,6 +116,130 @@ news_listeners = []
 news_listener_tasks = []
 
 
+# 相同行情快照下 AI 决策的缓存时间（秒）
+_AI_DECISION_CACHE_TTL = 60
+
+# 决策记录中保留的 AI 理由长度（完整响应已由 AI 模型写入 Redis 响应历史）
+_MAX_REASONING_LENGTH = 500
+
+# 各 AI 服务商的并发调用上限（避免所有参与者同时请求触发服务商限流）
+_AI_PROVIDER_CONCURRENCY = {"Claude": 2, "GPT": 3}
+_AI_DEFAULT_CONCURRENCY = 3
+_ai_provider_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# 参与者决策日志分隔线
+_SECTION_LINE = "─" * 80
+
+# 排行榜预先排序的指标（每轮决策后排好，接口直接切片返回）
+_LEADERBOARD_METRICS = ("total_pnl", "roi_percentage", "win_rate", "total_trades")
+
+
+@dataclass(slots=True)
+class GroupDecisionRecord:
+    """组共识决策记录"""
+    time: str                   # ISO 时间
+    decision: str               # 共识决策
+    confidence: float           # 信心度
+    summary: str                # 共识总结
+    ai_votes: list              # 各 AI 原始投票
+    price: float                # 决策时价格
+
+
+@dataclass(slots=True)
+class IndividualDecisionRecord:
+    """独立AI交易者决策记录"""
+    time: str                   # ISO 时间
+    decision: str               # 决策
+    confidence: float           # 信心度
+    reasoning: str              # AI 理由
+    price: float                # 决策时价格
+
+
+@dataclass(slots=True)
+class GroupDecisionEntry:
+    """全局决策历史中的组决策（用于前端展示）"""
+    time: str                   # 展示时间
+    group: str                  # 组名
+    direction: str              # 共识方向
+    confidence: float           # 信心度
+    votes: int                  # 支持共识的票数
+    total_ais: int              # 有效投票的 AI 数量
+    price: float                # 决策时价格
+    platforms: list             # 平台执行结果
+    ai_votes: list              # 格式化后的 AI 投票
+    summary: str                # 共识总结
+
+
+@dataclass(slots=True)
+class IndividualDecisionEntry:
+    """全局决策历史中的独立AI决策（用于前端展示）"""
+    time: str                   # 展示时间
+    trader: str                 # 交易者名称
+    ai_name: str                # AI 名称
+    direction: str              # 决策方向
+    confidence: float           # 信心度
+    price: float                # 决策时价格
+    reasoning: str              # AI 理由
+    type: str = "individual"    # 决策类型
+
+
+def _get_provider_semaphore(ai_name: str) -> asyncio.Semaphore:
+    """获取指定 AI 服务商的并发信号量"""
+    semaphore = _ai_provider_semaphores.get(ai_name)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_AI_PROVIDER_CONCURRENCY.get(ai_name, _AI_DEFAULT_CONCURRENCY))
+        _ai_provider_semaphores[ai_name] = semaphore
+    return semaphore
+
+
+def _trades_since(trades: List[Dict], start_time: datetime) -> List[Dict]:
+    """返回 start_time 之后的交易（交易按时间顺序追加，按 time_ms 二分定位起点；时间无效的交易不返回）"""
+    start_ms = int(start_time.timestamp() * 1000)
+    start = bisect_left(trades, start_ms, key=lambda trade: trade.get("time_ms", 0))
+    return [trade for trade in trades[start:] if not trade.get("time_invalid")]
+
+
+async def _analyze_with_cache(
+    ai_trader,
+    ai_name: str,
+    coin: str,
+    market_data: Dict,
+    orderbook: Dict,
+    recent_trades: List,
+    position_info: Optional[Dict],
+    kline_history: Optional[str]
+) -> Tuple[TradingDecision, float, str]:
+    """调用 AI 分析市场；同一 AI 在相同行情快照下的决策短期内直接复用 Redis 缓存，理由在此统一截断"""
+    position_side = position_info.get('side') if position_info else None
+    key = hashlib.blake2b(
+        f"{ai_name}|{coin}|{round(market_data.get('price', 0), 2)}|{position_side}|{kline_history}".encode(),
+        digest_size=16
+    ).hexdigest()
+    
+    # Redis 客户端是同步的，放到线程中执行，避免阻塞事件循环
+    cached = await asyncio.to_thread(redis_manager.get_ai_decision, key)
+    if cached is not None:
+        logger.info(f"♻️ {ai_name} 复用缓存决策（行情快照未变化）")
+        return TradingDecision(cached["decision"]), cached["confidence"], cached["reasoning"]
+    
+    async with _get_provider_semaphore(ai_name):
+        decision, confidence, reasoning = await ai_trader.analyze_market(
+            coin, market_data, orderbook, recent_trades, position_info,
+            kline_history=kline_history
+        )
+    reasoning = (reasoning or "")[:_MAX_REASONING_LENGTH]
+    
+    # 只缓存成功的分析：各 AI 在接口失败/异常时返回信心度为 0 的 HOLD，缓存它会让后续调用无法重试
+    if isinstance(decision, TradingDecision) and confidence > 0:
+        await asyncio.to_thread(
+            redis_manager.save_ai_decision,
+            key,
+            {"decision": decision.value, "confidence": confidence, "reasoning": reasoning},
+            ttl=_AI_DECISION_CACHE_TTL
+        )
+    return decision, confidence, reasoning
+
+
 class IndividualAITrader:
     """独立AI交易者 - 单个AI独立决策和交易"""
     
@@ -77,7 +255,6 @@ class IndividualAITrader:
         self.name = name
         self.ai_trader = ai_trader
         self.ai_name = ai_trader.__class__.__name__.replace('Trader', '')
-        self.kline_manager = KlineManager(max_klines=16)
         self.start_time = datetime.now()
         
         # 创建多平台交易管理器
@@ -91,11 +268,14 @@ class IndividualAITrader:
         # Hyperliquid 同时作为交易平台和数据源
         self.data_source_client = client
         
+        # 第一个平台交易者（平台在初始化后不再变化，读取持仓信息时直接复用）
+        self.first_trader = next(iter(self.multi_trader.platform_traders.values()), None)
+        
         # 保存用于获取市场数据的客户端
         if self.data_source_client:
             self.primary_client = self.data_source_client
         else:
-            self.primary_client = list(self.multi_trader.platform_traders.values())[0].client if self.multi_trader.platform_traders else None
+            self.primary_client = self.first_trader.client if self.first_trader else None
         
         # 统计数据
         self.stats = {
@@ -103,39 +283,44 @@ class IndividualAITrader:
             "ai_name": self.ai_name,
             "type": "individual",
             "platforms": {},
-            "decisions": [],
+            "decisions": deque(maxlen=100),  # 最近100条决策（最新在前）
             "platform_comparison": {}
         }
     
-    async def initialize(self):
+    async def initialize(self, accounts: Optional[Dict[str, Dict]] = None):
         """初始化交易者"""
         # 独立AI交易者使用独立的初始余额配置（200 USDT）
         await self.multi_trader.initialize_all(settings.individual_ai_initial_balance, self.name)
         
-        # 同步各平台持仓
-        for platform_name, trader in self.multi_trader.platform_traders.items():
-            await self._sync_existing_positions(trader)
+        # 并发同步各平台持仓（各平台互不影响）
+        await asyncio.gather(
+            *(self._sync_existing_positions(trader, accounts) for trader in self.multi_trader.platform_traders.values()),
+            return_exceptions=True
+        )
     
-    async def _sync_existing_positions(self, trader):
-        """同步平台持仓"""
+    async def _sync_existing_positions(self, trader, accounts: Optional[Dict[str, Dict]] = None):
+        """同步平台持仓（优先使用 ConsensusArena 批量预取的账户信息）"""
         try:
             logger.info(f"[{trader.name}] 🔄 正在同步现有持仓...")
-            account = await trader.client.get_account_info()
+            account = accounts.get(trader.client.address) if accounts else None
+            if account is None:
+                account = await trader.client.get_account_info()
             positions = account.get('assetPositions', [])
+            sync_time = datetime.now()
             
             synced_count = 0
             for pos in positions:
                 try:
-                    if 'position' not in pos:
+                    position = pos.get('position')
+                    if not position:
                         continue
                     
-                    coin = pos['position']['coin']
-                    size = float(pos['position']['szi'])
-                    
+                    size = float(position['szi'])
                     if size == 0:
                         continue
                     
-                    entry_px = float(pos['position']['entryPx'])
+                    coin = position['coin']
+                    entry_px = float(position['entryPx'])
                     is_long = size > 0
                     abs_size = abs(size)
                     
@@ -143,7 +328,7 @@ class IndividualAITrader:
                         'side': 'long' if is_long else 'short',
                         'entry_price': entry_px,
                         'size': abs_size,
-                        'entry_time': datetime.now(),
+                        'entry_time': sync_time,
                         'confidence': 0,
                         'reasoning': '系统启动时同步的历史持仓',
                         'order_id': 'synced'
@@ -170,27 +355,20 @@ class IndividualAITrader:
         market_data: Dict, 
         orderbook: Dict, 
         recent_trades: List,
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> Tuple[Optional[TradingDecision], float, str]:
-        """获取AI决策（无需共识）"""
-        kline_history_data = self.kline_manager.format_for_prompt(max_rows=16)
+        """获取AI决策（无需共识），kline_history 为 ConsensusArena 本轮格式化的全局K线"""
+        kline_history_data = kline_history
         
         try:
             logger.info(f"[{self.name}] 🤖 正在获取 {self.ai_name} 的决策...")
             
-            # 注入K线数据
-            original_create_prompt = self.ai_trader.create_market_prompt
-            def wrapped_prompt(c, m, o, p=None, kline_history=None):
-                return original_create_prompt(c, m, o, p, kline_history=kline_history_data)
-            self.ai_trader.create_market_prompt = wrapped_prompt
-            
-            decision, confidence, reasoning = await self.ai_trader.analyze_market(
-                coin, market_data, orderbook, recent_trades, position_info
+            decision, confidence, reasoning = await _analyze_with_cache(
+                self.ai_trader, self.ai_name, coin, market_data, orderbook, recent_trades,
+                position_info, kline_history_data
             )
             
-            # 恢复原始方法
-            self.ai_trader.create_market_prompt = original_create_prompt
-            
             logger.info(f"[{self.name}]    {self.ai_name}: {decision} (信心: {confidence:.1f}%)")
             
             return decision, confidence, reasoning
@@ -206,11 +384,16 @@ class IndividualAITrader:
         confidence: float, 
         reasoning: str, 
         current_price: float
-    ):
-        """在所有平台上执行决策"""
+    ) -> bool:
+        """
+        在所有平台上执行决策
+        
+        Returns:
+            是否有任一平台执行了交易
+        """
         if decision == TradingDecision.HOLD:
             logger.debug(f"[{self.name}] 💤 AI 建议观望，不执行交易")
-            return
+            return False
         
         logger.info(f"[{self.name}] 🚀 在所有平台上执行决策: {decision}")
         results = await self.multi_trader.execute_decision_all(
@@ -222,6 +405,7 @@ class IndividualAITrader:
                 logger.info(f"[{platform_name}] ✅ 交易已执行")
             else:
                 logger.info(f"[{platform_name}] ⚠️  交易未执行")
+        return any(results.values())
     
     async def update_stats(self):
         """更新统计数据"""
@@ -236,10 +420,25 @@ class IndividualAITrader:
             self.stats["platforms"][platform_name] = trader.stats
 
 
+# AI 决策 -> 投票方向
+_DECISION_BUCKET = {
+    TradingDecision.STRONG_BUY: TradingDecision.BUY,
+    TradingDecision.BUY: TradingDecision.BUY,
+    TradingDecision.SELL: TradingDecision.SELL,
+    TradingDecision.STRONG_SELL: TradingDecision.SELL,
+    TradingDecision.HOLD: TradingDecision.HOLD,
+}
+_DIRECTION_NAMES = {
+    TradingDecision.BUY: "Buy",
+    TradingDecision.SELL: "Sell",
+    TradingDecision.HOLD: "Hold",
+}
+
+
 class AIGroup:
     """AI组 - 多平台版本"""
     
-    def __init__(self, name: str, ai_traders: List, private_key: str):
+    def __init__(self, name: str, ai_traders: List, private_key: str, enabled_platforms: Optional[Tuple[str, ...]] = None):
         """
         初始化 AI 组
         
@@ -247,17 +446,18 @@ class AIGroup:
             name: 组名
             ai_traders: AI 交易者列表
             private_key: 私钥
+            enabled_platforms: 启用的交易平台（默认读取配置）
         """
         self.name = name
         self.ai_traders = ai_traders
-        self.kline_manager = KlineManager(max_klines=16)
         self.start_time = datetime.now()
         
         # 创建多平台交易管理器
         self.multi_trader = MultiPlatformTrader()
         
         # 🎯 AI共识组（Alpha/Beta）：在两个平台下单
-        enabled_platforms = get_enabled_platforms()
+        if enabled_platforms is None:
+            enabled_platforms = get_enabled_platforms()
         logger.info(f"[{name}] AI共识组 - 在以下平台交易: {enabled_platforms}")
         
         for platform in enabled_platforms:
@@ -276,49 +476,57 @@ class AIGroup:
         else:
             self.data_source_client = None
         
+        # 第一个平台交易者（平台在初始化后不再变化，读取持仓信息时直接复用）
+        self.first_trader = next(iter(self.multi_trader.platform_traders.values()), None)
+        
         # 保存用于获取市场数据的客户端
         if self.data_source_client:
             self.primary_client = self.data_source_client
         else:
-            self.primary_client = list(self.multi_trader.platform_traders.values())[0].client if self.multi_trader.platform_traders else None
+            self.primary_client = self.first_trader.client if self.first_trader else None
         
         # 统计数据
         self.stats = {
             "group_name": name,
             "platforms": {},
-            "consensus_decisions": [],
+            "consensus_decisions": deque(maxlen=100),  # 最近100条共识决策（最新在前）
             "platform_comparison": {}
         }
     
-    async def initialize(self):
+    async def initialize(self, accounts: Optional[Dict[str, Dict]] = None):
         """初始化组"""
         # 传入组名，用于从Redis恢复交易记录
         await self.multi_trader.initialize_all(settings.ai_initial_balance, self.name)
         
-        # 同步各平台持仓
-        for platform_name, trader in self.multi_trader.platform_traders.items():
-            await self._sync_existing_positions(trader)
+        # 并发同步各平台持仓（各平台互不影响）
+        await asyncio.gather(
+            *(self._sync_existing_positions(trader, accounts) for trader in self.multi_trader.platform_traders.values()),
+            return_exceptions=True
+        )
     
-    async def _sync_existing_positions(self, trader):
-        """同步平台持仓"""
+    async def _sync_existing_positions(self, trader, accounts: Optional[Dict[str, Dict]] = None):
+        """同步平台持仓（优先使用 ConsensusArena 批量预取的账户信息）"""
         try:
             logger.info(f"[{trader.name}] 🔄 正在同步现有持仓...")
-            account = await trader.client.get_account_info()
+            account = accounts.get(trader.client.address) if accounts else None
+            if account is None:
+                account = await trader.client.get_account_info()
             positions = account.get('assetPositions', [])
+            sync_time = datetime.now()
             
             synced_count = 0
             for pos in positions:
                 try:
-                    if 'position' not in pos:
+                    position = pos.get('position')
+                    if not position:
                         continue
                     
-                    coin = pos['position']['coin']
-                    size = float(pos['position']['szi'])
-                    
+                    size = float(position['szi'])
                     if size == 0:
                         continue
                     
-                    entry_px = float(pos['position']['entryPx'])
+                    coin = position['coin']
+                    entry_px = float(position['entryPx'])
                     is_long = size > 0
                     abs_size = abs(size)
                     
@@ -326,7 +534,7 @@ class AIGroup:
                         'side': 'long' if is_long else 'short',
                         'entry_price': entry_px,
                         'size': abs_size,
-                        'entry_time': datetime.now(),
+                        'entry_time': sync_time,
                         'confidence': 0,
                         'reasoning': '系统启动时同步的历史持仓',
                         'order_id': 'synced'
@@ -353,27 +561,22 @@ class AIGroup:
         market_data: Dict, 
         orderbook: Dict, 
         recent_trades: List,
-        position_info: Optional[Dict] = None
+        position_info: Optional[Dict] = None,
+        kline_history: Optional[str] = None
     ) -> Tuple[Optional[TradingDecision], float, str, List[Dict]]:
-        """获取组内共识决策"""
-        kline_history_data = self.kline_manager.format_for_prompt(max_rows=16)
+        """获取组内共识决策，kline_history 为 ConsensusArena 本轮格式化的全局K线"""
+        kline_history_data = kline_history
         
         async def get_ai_decision(ai_trader):
             try:
                 ai_name = ai_trader.__class__.__name__.replace('Trader', '')
                 logger.info(f"[{self.name}] 🤖 正在获取 {ai_name} 的决策...")
                 
-                original_create_prompt = ai_trader.create_market_prompt
-                def wrapped_prompt(c, m, o, p=None, kline_history=None):
-                    return original_create_prompt(c, m, o, p, kline_history=kline_history_data)
-                ai_trader.create_market_prompt = wrapped_prompt
-                
-                decision, confidence, reasoning = await ai_trader.analyze_market(
-                    coin, market_data, orderbook, recent_trades, position_info
+                decision, confidence, reasoning = await _analyze_with_cache(
+                    ai_trader, ai_name, coin, market_data, orderbook, recent_trades,
+                    position_info, kline_history_data
                 )
                 
-                ai_trader.create_market_prompt = original_create_prompt
-                
                 logger.info(f"[{self.name}]    {ai_name}: {decision} (信心: {confidence:.1f}%)")
                 
                 return {
@@ -395,31 +598,18 @@ class AIGroup:
         if not ai_decisions:
             return None, 0, "所有AI决策失败", []
         
-        # 统计投票
-        buy_votes = []
-        sell_votes = []
-        hold_votes = []
-        
+        # 统计投票（单次遍历分桶；平票时按 Buy > Sell > Hold 的顺序取胜）
+        buckets = {TradingDecision.BUY: [], TradingDecision.SELL: [], TradingDecision.HOLD: []}
         for d in ai_decisions:
-            if d['decision'] in [TradingDecision.BUY, TradingDecision.STRONG_BUY]:
-                buy_votes.append(d)
-            elif d['decision'] in [TradingDecision.SELL, TradingDecision.STRONG_SELL]:
-                sell_votes.append(d)
-            else:
-                hold_votes.append(d)
+            buckets[_DECISION_BUCKET.get(d['decision'], TradingDecision.HOLD)].append(d)
         
-        buy_count = len(buy_votes)
-        sell_count = len(sell_votes)
-        hold_count = len(hold_votes)
+        buy_count = len(buckets[TradingDecision.BUY])
+        sell_count = len(buckets[TradingDecision.SELL])
+        hold_count = len(buckets[TradingDecision.HOLD])
         
-        vote_counts = [
-            (buy_count, TradingDecision.BUY, buy_votes, "Buy"),
-            (sell_count, TradingDecision.SELL, sell_votes, "Sell"),
-            (hold_count, TradingDecision.HOLD, hold_votes, "Hold")
-        ]
-        vote_counts.sort(key=lambda x: x[0], reverse=True)
-        
-        vote_count, consensus_decision, supporting_ais, direction_name = vote_counts[0]
+        consensus_decision, supporting_ais = max(buckets.items(), key=lambda kv: len(kv[1]))
+        vote_count = len(supporting_ais)
+        direction_name = _DIRECTION_NAMES[consensus_decision]
         
         if supporting_ais:
             avg_confidence = sum(d['confidence'] for d in supporting_ais) / len(supporting_ais)
@@ -446,11 +636,16 @@ class AIGroup:
         confidence: float, 
         reasoning: str, 
         current_price: float
-    ):
-        """在所有平台上执行决策"""
+    ) -> bool:
+        """
+        在所有平台上执行决策
+        
+        Returns:
+            是否有任一平台执行了交易
+        """
         if decision == TradingDecision.HOLD:
             logger.debug(f"[{self.name}] 💤 AI 建议观望，不执行交易")
-            return
+            return False
         
         logger.info(f"[{self.name}] 🚀 在所有平台上执行决策: {decision}")
         results = await self.multi_trader.execute_decision_all(
@@ -462,6 +657,7 @@ class AIGroup:
                 logger.info(f"[{platform_name}] ✅ 交易已执行")
             else:
                 logger.info(f"[{platform_name}] ⚠️  交易未执行")
+        return any(results.values())
     
     async def update_stats(self):
         """更新统计数据"""
@@ -484,8 +680,23 @@ class ConsensusArena:
         self.individual_traders: List[IndividualAITrader] = []
         self.running = False
         self.update_interval = settings.consensus_interval
-        self.decision_history = []  # 决策历史记录（全局）
+        self.decision_history = deque(maxlen=100)  # 决策历史记录（全局，最新在前，保留最近100条）
         self.balance_history = []   # 余额历史记录（全局）
+        self.kline_manager = KlineManager(max_klines=16)  # 全局K线（所有组与独立交易者共用同一行情）
+        self._ai_instance_cache: Dict[str, AITradingModel] = {}  # AI实例缓存（组与独立交易者共用同一模型实例）
+        self.market_data_client = None  # 行情客户端（初始化时选定一次，所有参与者共用）
+        
+        # 前端轮询接口的缓存数据（每轮决策结束后重建，固定结构的接口直接缓存序列化后的 JSON）
+        self.cached_status_json: Optional[bytes] = None
+        self.cached_platform_comparison_json: Optional[bytes] = None
+        self.cached_leaderboard: Optional[List[Dict]] = None
+        self.cached_leaderboards: Dict[str, List[Dict]] = {}  # {指标: 已排序并带排名的排行榜}
+        self.cached_leaderboard_summary_json: Optional[bytes] = None
+        self.cached_balance_json: Optional[bytes] = None
+        
+        # 统计刷新（并发调用共享同一次刷新）
+        self._stats_refresh_lock = asyncio.Lock()
+        self._stats_last_refresh = 0.0
     
     async def initialize(self):
         """初始化系统"""
@@ -513,6 +724,10 @@ class ConsensusArena:
         logger.info(f"每组初始资金: ${settings.ai_initial_balance}")
         logger.info("=" * 80)
         
+        # 先创建所有组和独立交易者，再并发完成初始化（各参与者的网络初始化互不依赖）
+        groups: List[AIGroup] = []
+        individual_traders: List[Tuple[str, IndividualAITrader]] = []
+        
         # 检查是否启用共识交易
         if not settings.enable_consensus_trading:
             logger.info("\n🚫 共识交易已禁用，跳过Alpha/Beta组初始化")
@@ -520,36 +735,32 @@ class ConsensusArena:
             # 初始化 Alpha 组
             logger.info("\n📊 初始化 Alpha 组 (DeepSeek + Claude + Grok)...")
             alpha_ais = [
-                DeepSeekTrader(api_key=settings.deepseek_api_key),
-                ClaudeTrader(api_key=settings.claude_api_key),
-                GrokTrader(api_key=settings.grok_api_key)
+                self._get_or_create_ai("deepseek"),
+                self._get_or_create_ai("claude"),
+                self._get_or_create_ai("grok")
             ]
             alpha_group = AIGroup(
                 settings.group_1_name,
                 alpha_ais,
-                settings.group_1_private_key
+                settings.group_1_private_key,
+                enabled_platforms
             )
-            await alpha_group.initialize()
-            await alpha_group.update_stats()  # 更新初始统计数据
-            self.groups.append(alpha_group)
-            logger.info(f"✅ Alpha组初始化完成")
+            groups.append(alpha_group)
             
             # 初始化 Beta 组
             logger.info("\n📊 初始化 Beta 组 (GPT-4 + Gemini + Qwen)...")
             beta_ais = [
-                GPTTrader(api_key=settings.openai_api_key, model=settings.gpt_model),
-                GeminiTrader(api_key=settings.gemini_api_key),
-                QwenTrader(api_key=settings.qwen_api_key)
+                self._get_or_create_ai("gpt"),
+                self._get_or_create_ai("gemini"),
+                self._get_or_create_ai("qwen")
             ]
             beta_group = AIGroup(
                 settings.group_2_name,
                 beta_ais,
-                settings.group_2_private_key
+                settings.group_2_private_key,
+                enabled_platforms
             )
-            await beta_group.initialize()
-            await beta_group.update_stats()  # 更新初始统计数据
-            self.groups.append(beta_group)
-            logger.info(f"✅ Beta组初始化完成")
+            groups.append(beta_group)
         
         # 初始化独立AI交易者
         # 如果启用了独立交易或消息驱动交易，都需要初始化独立AI交易者
@@ -589,7 +800,7 @@ class ConsensusArena:
                     logger.info(f"\n  初始化 {ai_name}-Solo...")
                     
                     # 创建AI实例
-                    ai_instance = self._create_ai_instance(ai_name)
+                    ai_instance = self._get_or_create_ai(ai_name)
                     if not ai_instance:
                         error_msg = (
                             f"❌ 无法创建 {ai_name} AI实例\n"
@@ -608,28 +819,89 @@ class ConsensusArena:
                             ai_trader=ai_instance,
                             private_key=private_key
                         )
-                        await trader.initialize()
-                        await trader.update_stats()  # 更新初始统计数据
-                        self.individual_traders.append(trader)
-                        logger.info(f"  ✅ {ai_name}-Solo 初始化成功")
+                        individual_traders.append((ai_name, trader))
                     except Exception as e:
-                        error_msg = (
-                            f"❌ {ai_name}-Solo 初始化失败: {e}\n"
-                            f"   可能原因：\n"
-                            f"   1. 私钥格式错误\n"
-                            f"   2. 账户余额不足\n"
-                            f"   3. 网络连接问题\n"
-                            f"   请检查私钥和账户状态"
-                        )
-                        logger.error(error_msg)
-                        import traceback
-                        logger.error(traceback.format_exc())
+                        self._log_individual_init_error(ai_name, e)
                         return False
         
+        # 并发初始化所有参与者（单个失败不会取消其他参与者）
+        participants = groups + [trader for _, trader in individual_traders]
+        accounts = await self._prefetch_hyperliquid_accounts(participants)
+        results = await asyncio.gather(
+            *(self._init_participant(p, accounts) for p in participants),
+            return_exceptions=True
+        )
+        group_results = results[:len(groups)]
+        trader_results = results[len(groups):]
+        
+        for group, result in zip(groups, group_results):
+            if isinstance(result, BaseException):
+                raise result
+            self.groups.append(group)
+            logger.info(f"✅ {group.name} 组初始化完成")
+        
+        for (ai_name, trader), result in zip(individual_traders, trader_results):
+            if isinstance(result, BaseException):
+                self._log_individual_init_error(ai_name, result)
+                return False
+            self.individual_traders.append(trader)
+            logger.info(f"  ✅ {ai_name}-Solo 初始化成功")
+        
+        # 选定行情客户端（优先第一个组，只有独立交易者时使用其客户端）
+        self.market_data_client = next(
+            (p.primary_client for p in (*self.groups, *self.individual_traders) if p.primary_client),
+            None
+        )
+        
+        self._rebuild_api_caches()
+        
         total_participants = len(self.groups) + len(self.individual_traders)
         logger.info(f"\n🚀 系统初始化完成！共 {len(self.groups)} 个组 + {len(self.individual_traders)} 个独立交易者 = {total_participants} 个参与者")
         return True
     
+    async def _prefetch_hyperliquid_accounts(self, participants) -> Dict[str, Dict]:
+        """一次性批量获取所有参与者的 Hyperliquid 账户信息，供同步持仓复用"""
+        hl_clients = [
+            trader.client
+            for participant in participants
+            for trader in participant.multi_trader.platform_traders.values()
+            if isinstance(trader.client, HyperliquidClient)
+        ]
+        if not hl_clients:
+            return {}
+        return await hl_clients[0].batch_get_account_info([client.address for client in hl_clients])
+    
+    async def _init_participant(self, participant, accounts: Optional[Dict[str, Dict]] = None):
+        """初始化单个组/独立交易者并更新初始统计数据"""
+        await participant.initialize(accounts)
+        await participant.update_stats()  # 更新初始统计数据
+    
+    def _log_individual_init_error(self, ai_name: str, error: BaseException):
+        """记录独立AI交易者初始化失败信息"""
+        error_msg = (
+            f"❌ {ai_name}-Solo 初始化失败: {error}\n"
+            f"   可能原因：\n"
+            f"   1. 私钥格式错误\n"
+            f"   2. 账户余额不足\n"
+            f"   3. 网络连接问题\n"
+            f"   请检查私钥和账户状态"
+        )
+        logger.error(error_msg)
+        logger.error("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+    
+    def _get_or_create_ai(self, ai_name: str) -> Optional[AITradingModel]:
+        """获取AI实例（同一模型只创建一次，组与独立交易者共用）"""
+        key = ai_name.lower()
+        if key in ("gpt4", "gpt-4"):
+            key = "gpt"
+        
+        ai_instance = self._ai_instance_cache.get(key)
+        if ai_instance is None:
+            ai_instance = self._create_ai_instance(key)
+            if ai_instance is not None:
+                self._ai_instance_cache[key] = ai_instance
+        return ai_instance
+    
     def _create_ai_instance(self, ai_name: str):
         """根据AI名称创建AI实例"""
         ai_name_lower = ai_name.lower()
@@ -657,62 +929,70 @@ class ConsensusArena:
         while self.running:
             try:
                 loop_count += 1
+                # 本轮循环统一使用同一个时间戳（所有决策记录保持一致）
+                loop_now = datetime.now()
+                loop_iso = loop_now.isoformat()
+                loop_str = loop_now.strftime('%Y-%m-%d %H:%M:%S')
                 logger.info(f"\n{'='*80}")
-                logger.info(f"🤖 共识决策循环 #{loop_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                logger.info(f"🤖 共识决策循环 #{loop_count} - {loop_str}")
                 logger.info(f"{'='*80}")
                 
-                # 获取市场数据（使用第一个组的第一个平台客户端）
+                # 获取市场数据（使用初始化时选定的行情客户端）
                 try:
-                    primary_client = self.groups[0].primary_client
+                    primary_client = self.market_data_client
                     if not primary_client:
                         logger.error("❌ 没有可用的交易客户端")
                         await asyncio.sleep(30)
                         continue
                     
-                    market_data = await primary_client.get_market_data(trading_symbol)
+                    # 行情、订单簿、成交记录互不依赖，并发获取一次，本轮所有参与者共用
+                    market_data, orderbook_data, recent_trades = await asyncio.gather(
+                        primary_client.get_market_data(trading_symbol),
+                        primary_client.get_orderbook(trading_symbol),
+                        primary_client.get_recent_trades(trading_symbol, limit=10)
+                    )
                     current_price = market_data['price']
                     logger.info(f"💰 {trading_symbol} 价格: ${current_price:,.2f}")
                     logger.info(f"📈 24h涨跌: {market_data.get('change_24h', 0):+.2f}%")
-                    
-                    orderbook_data = await primary_client.get_orderbook(trading_symbol)
-                    recent_trades = await primary_client.get_recent_trades(trading_symbol, limit=10)
                 except Exception as e:
                     logger.error(f"❌ 获取市场数据失败: {e}")
                     await asyncio.sleep(30)
                     continue
                 
+                # 更新全局K线并格式化一次，供本轮所有参与者共用
+                self.kline_manager.update_price(
+                    price=current_price,
+                    volume=market_data.get('volume', 0)
+                )
+                kline_history_data = self.kline_manager.format_for_prompt(max_rows=16)
+                
+                # 全局决策历史的写入方法只绑定一次，各参与者协程通过闭包直接调用
+                record_decision = self.decision_history.appendleft
+                traded_participants = set()  # 本轮有成交的参与者名称
+                
                 # 并行处理各组
                 async def process_group(group):
                     try:
-                        logger.info(f"\n{'─'*80}")
-                        logger.info(f"📊 {group.name} 开始共识决策")
-                        logger.info(f"{'─'*80}")
-                        
-                        # 更新K线
-                        group.kline_manager.update_price(
-                            price=current_price,
-                            volume=market_data.get('volume', 0)
-                        )
+                        logger.info(f"\n{_SECTION_LINE}\n📊 {group.name} 开始共识决策\n{_SECTION_LINE}")
                         
                         # 获取共识决策（使用任意平台的持仓信息即可）
-                        first_trader = list(group.multi_trader.platform_traders.values())[0]
-                        position_info = first_trader.auto_trader.positions.get(trading_symbol)
+                        position_info = group.first_trader.auto_trader.positions.get(trading_symbol)
                         
                         consensus_decision, confidence, summary, ai_votes = await group.get_consensus_decision(
-                            trading_symbol, market_data, orderbook_data, recent_trades, position_info
+                            trading_symbol, market_data, orderbook_data, recent_trades, position_info,
+                            kline_history=kline_history_data
                         )
                         
                         # 记录决策
-                        decision_record = {
-                            "time": datetime.now().isoformat(),
-                            "decision": str(consensus_decision),
-                            "confidence": confidence,
-                            "summary": summary,
-                            "ai_votes": ai_votes,
-                            "price": current_price
-                        }
-                        group.stats["consensus_decisions"].insert(0, decision_record)
-                        group.stats["consensus_decisions"] = group.stats["consensus_decisions"][:100]
+                        decision_record = GroupDecisionRecord(
+                            time=loop_iso,
+                            decision=str(consensus_decision),
+                            confidence=confidence,
+                            summary=summary,
+                            ai_votes=ai_votes,
+                            price=current_price
+                        )
+                        group.stats["consensus_decisions"].appendleft(decision_record)
                         
                         # 记录到全局决策历史（用于前端展示）
                         # ai_votes 是一个列表，每个元素是 {'ai_name': xx, 'decision': xx, ...}
@@ -726,137 +1006,112 @@ class ConsensusArena:
                                     "ai_name": vote.get('ai_name', 'Unknown'),
                                     "decision": str(vote.get('decision', '')),
                                     "confidence": round(vote.get('confidence', 0), 1),
-                                    "reasoning": vote.get('reasoning', '')[:200]  # 限制长度
+                                    "reasoning": vote.get('reasoning', '')
                                 })
                         
-                        global_decision = {
-                            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            "group": group.name,
-                            "direction": str(consensus_decision),
-                            "confidence": round(confidence, 1),
-                            "votes": votes_count,
-                            "total_ais": len([v for v in ai_votes if v]),  # 过滤掉None
-                            "price": current_price,
-                            "platforms": [],
-                            "ai_votes": formatted_ai_votes,
-                            "summary": summary  # 添加共识总结
-                        }
-                        self.decision_history.insert(0, global_decision)
-                        self.decision_history = self.decision_history[:100]  # 保留最近100条
+                        global_decision = GroupDecisionEntry(
+                            time=loop_str,
+                            group=group.name,
+                            direction=str(consensus_decision),
+                            confidence=round(confidence, 1),
+                            votes=votes_count,
+                            total_ais=len([v for v in ai_votes if v]),  # 过滤掉None
+                            price=current_price,
+                            platforms=[],
+                            ai_votes=formatted_ai_votes,
+                            summary=summary  # 添加共识总结
+                        )
+                        record_decision(global_decision)
                         
                         # 在所有平台上执行决策
-                        await group.execute_decision_on_all_platforms(
+                        # 下单不受时间预算取消：SDK 调用已在线程中发往交易所，中途取消会漏记持仓
+                        if await asyncio.shield(group.execute_decision_on_all_platforms(
                             trading_symbol,
                             consensus_decision,
                             confidence,
                             summary,
                             current_price
-                        )
-                        
-                        # 更新统计
-                        await group.update_stats()
-                        
-                        # 显示平台对比
-                        if settings.platform_comparison_enabled:
-                            logger.info(f"\n[{group.name}] 📊 平台收益对比:")
-                            comparison = group.stats["platform_comparison"]
-                            for platform_stats in comparison.get("platforms", []):
-                                logger.info(f"  {platform_stats['name']}: "
-                                          f"余额=${platform_stats['balance']:.2f}, "
-                                          f"盈亏=${platform_stats['pnl']:+.2f}, "
-                                          f"ROI={platform_stats['roi']:+.2f}%, "
-                                          f"胜率={platform_stats['win_rate']:.1f}%")
+                        )):
+                            traded_participants.add(group.name)
                         
                     except Exception as e:
-                        logger.error(f"[{group.name}] ❌ 决策执行错误: {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-                
-                # 并行处理所有组（根据配置决定是否执行）
-                if settings.enable_consensus_trading and self.groups:
-                    await asyncio.gather(*[process_group(group) for group in self.groups])
-                elif not settings.enable_consensus_trading:
-                    logger.info("⏸️  共识交易已禁用，跳过Alpha/Beta组")
+                        logger.exception(f"[{group.name}] ❌ 决策执行错误: {e}")
                 
-                # 并行处理所有独立AI交易者（根据配置决定是否执行）
+                # 并行处理所有独立AI交易者
                 async def process_individual_trader(trader):
                     try:
-                        logger.info(f"\n{'─'*80}")
-                        logger.info(f"🎯 {trader.name} 开始独立决策")
-                        logger.info(f"{'─'*80}")
-                        
-                        # 更新K线
-                        trader.kline_manager.update_price(
-                            price=current_price,
-                            volume=market_data.get('volume', 0)
-                        )
+                        logger.info(f"\n{_SECTION_LINE}\n🎯 {trader.name} 开始独立决策\n{_SECTION_LINE}")
                         
                         # 获取持仓信息（使用任意平台的持仓信息即可）
-                        first_trader = list(trader.multi_trader.platform_traders.values())[0]
-                        position_info = first_trader.auto_trader.positions.get(trading_symbol)
+                        position_info = trader.first_trader.auto_trader.positions.get(trading_symbol)
                         
                         # 获取AI决策
                         decision, confidence, reasoning = await trader.get_decision(
-                            trading_symbol, market_data, orderbook_data, recent_trades, position_info
+                            trading_symbol, market_data, orderbook_data, recent_trades, position_info,
+                            kline_history=kline_history_data
                         )
                         
                         # 记录决策
-                        decision_record = {
-                            "time": datetime.now().isoformat(),
-                            "decision": str(decision),
-                            "confidence": confidence,
-                            "reasoning": reasoning,
-                            "price": current_price
-                        }
-                        trader.stats["decisions"].insert(0, decision_record)
-                        trader.stats["decisions"] = trader.stats["decisions"][:100]
+                        decision_record = IndividualDecisionRecord(
+                            time=loop_iso,
+                            decision=str(decision),
+                            confidence=confidence,
+                            reasoning=reasoning,
+                            price=current_price
+                        )
+                        trader.stats["decisions"].appendleft(decision_record)
                         
                         # 记录到全局决策历史（用于前端展示）
-                        global_decision = {
-                            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            "trader": trader.name,
-                            "ai_name": trader.ai_name,
-                            "type": "individual",
-                            "direction": str(decision),
-                            "confidence": round(confidence, 1),
-                            "price": current_price,
-                            "reasoning": reasoning[:200]  # 限制长度
-                        }
-                        self.decision_history.insert(0, global_decision)
-                        self.decision_history = self.decision_history[:100]  # 保留最近100条
+                        global_decision = IndividualDecisionEntry(
+                            time=loop_str,
+                            trader=trader.name,
+                            ai_name=trader.ai_name,
+                            direction=str(decision),
+                            confidence=round(confidence, 1),
+                            price=current_price,
+                            reasoning=reasoning
+                        )
+                        record_decision(global_decision)
                         
                         # 在所有平台上执行决策
-                        await trader.execute_decision_on_all_platforms(
+                        # 下单不受时间预算取消：SDK 调用已在线程中发往交易所，中途取消会漏记持仓
+                        if await asyncio.shield(trader.execute_decision_on_all_platforms(
                             trading_symbol,
                             decision,
                             confidence,
                             reasoning,
                             current_price
-                        )
-                        
-                        # 更新统计
-                        await trader.update_stats()
-                        
-                        # 显示平台对比
-                        if settings.platform_comparison_enabled:
-                            logger.info(f"\n[{trader.name}] 📊 平台收益对比:")
-                            comparison = trader.stats["platform_comparison"]
-                            for platform_stats in comparison.get("platforms", []):
-                                logger.info(f"  {platform_stats['name']}: "
-                                          f"余额=${platform_stats['balance']:.2f}, "
-                                          f"盈亏=${platform_stats['pnl']:+.2f}, "
-                                          f"ROI={platform_stats['roi']:+.2f}%, "
-                                          f"胜率={platform_stats['win_rate']:.1f}%")
+                        )):
+                            traded_participants.add(trader.name)
                         
                     except Exception as e:
-                        logger.error(f"[{trader.name}] ❌ 决策执行错误: {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
+                        logger.exception(f"[{trader.name}] ❌ 决策执行错误: {e}")
                 
-                if settings.enable_individual_trading and self.individual_traders:
-                    await asyncio.gather(*[process_individual_trader(trader) for trader in self.individual_traders])
-                elif not settings.enable_individual_trading:
+                # 组与独立AI交易者共用同一份行情快照，在同一个 TaskGroup 中并行执行（根据配置决定是否执行）
+                tasks = []
+                if settings.enable_consensus_trading:
+                    tasks.extend((group.name, process_group(group)) for group in self.groups)
+                else:
+                    logger.info("⏸️  共识交易已禁用，跳过Alpha/Beta组")
+                if settings.enable_individual_trading:
+                    tasks.extend((trader.name, process_individual_trader(trader)) for trader in self.individual_traders)
+                else:
                     logger.info("⏸️  独立AI交易已禁用，跳过独立AI")
+                if tasks:
+                    # 每个参与者最多占用决策周期的 80%，超时即取消 AI 决策，避免单个 AI 卡住整轮循环
+                    task_budget = self.update_interval * 0.8
+                    async with asyncio.TaskGroup() as tg:
+                        for participant_name, coro in tasks:
+                            tg.create_task(self._run_with_budget(participant_name, coro, task_budget))
+                
+                # 所有参与者执行完毕后统一并发刷新一次统计（空仓且本轮未成交的参与者余额不变，跳过）
+                await self.refresh_all_stats(ttl=0, participants=[
+                    participant for participant in (*self.groups, *self.individual_traders)
+                    if participant.name in traded_participants or participant.multi_trader.has_open_positions()
+                ])
+                if settings.platform_comparison_enabled:
+                    for participant in [*self.groups, *self.individual_traders]:
+                        self._log_platform_comparison(participant)
                 
                 # 保存余额快照到 Redis
                 try:
@@ -889,10 +1144,13 @@ class ConsensusArena:
                             })
                     
                     if accounts:
-                        redis_manager.save_balance_snapshot(accounts)
+                        await redis_manager.save_balance_snapshot(accounts)
                 except Exception as e:
                     logger.error(f"保存余额快照失败: {e}")
                 
+                # 重建前端接口缓存
+                self._rebuild_api_caches()
+                
                 logger.info(f"\n⏰ 等待 {self.update_interval} 秒后进行下一轮决策...")
                 await asyncio.sleep(self.update_interval)
             
@@ -900,15 +1158,14 @@ class ConsensusArena:
                 logger.info("⏹️  决策循环被取消")
                 break
             except Exception as e:
-                logger.error(f"❌ 决策循环错误: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.exception(f"❌ 决策循环错误: {e}")
                 await asyncio.sleep(30)
     
     async def start(self):
         """启动系统"""
         if await self.initialize():
             self.running = True
+            self._rebuild_api_caches()
             
             # 检查是否启用常规交易
             if not settings.enable_consensus_trading and not settings.enable_individual_trading:
@@ -917,13 +1174,292 @@ class ConsensusArena:
                 # 不运行decision_loop，保持系统存活但不交易
                 while self.running:
                     await asyncio.sleep(60)  # 保持存活
+                    # 消息驱动交易会改变独立交易者的持仓，定期刷新统计和接口缓存
+                    await self.refresh_all_stats()
+                    self._rebuild_api_caches()
             else:
                 logger.info("🚀 共识交易系统已启动")
                 await self.decision_loop()
     
+    async def refresh_all_stats(self, ttl: float = 1.0, participants: Optional[List] = None):
+        """
+        并发刷新所有组和独立交易者的统计数据
+        
+        Args:
+            ttl: 距上次刷新不足 ttl 秒时直接复用（并发调用共享同一次刷新）
+            participants: 只刷新指定的参与者（默认全部）
+        """
+        if participants is None:
+            participants = [*self.groups, *self.individual_traders]
+        async with self._stats_refresh_lock:
+            if time.monotonic() - self._stats_last_refresh < ttl:
+                return
+            await asyncio.gather(
+                *(participant.update_stats() for participant in participants),
+                return_exceptions=True
+            )
+            self._stats_last_refresh = time.monotonic()
+    
+    def _log_platform_comparison(self, participant):
+        """输出组/独立交易者的平台收益对比"""
+        logger.info(f"\n[{participant.name}] 📊 平台收益对比:")
+        comparison = participant.stats["platform_comparison"]
+        for platform_stats in comparison.get("platforms", []):
+            logger.info(f"  {platform_stats['name']}: "
+                      f"余额=${platform_stats['balance']:.2f}, "
+                      f"盈亏=${platform_stats['pnl']:+.2f}, "
+                      f"ROI={platform_stats['roi']:+.2f}%, "
+                      f"胜率={platform_stats['win_rate']:.1f}%")
+    
+    def _rebuild_api_caches(self):
+        """重建前端轮询接口的缓存数据（统计数据每轮决策后才变化，接口直接返回缓存）"""
+        self.cached_status_json = _encode_json(self._build_status())
+        self.cached_platform_comparison_json = _encode_json(self._build_platform_comparison())
+        self.cached_leaderboard = self._build_leaderboard()
+        self.cached_leaderboards = {metric: self._rank_leaderboard(metric) for metric in _LEADERBOARD_METRICS}
+        self.cached_leaderboard_summary_json = _encode_json(self._build_leaderboard_summary())
+        self.cached_balance_json = _encode_json(self._build_realtime_balance())
+    
+    def _build_status(self) -> Dict:
+        """构建 /api/status 数据"""
+        groups_data = []
+        for group in self.groups:
+            group_info = {
+                "type": "group",
+                "group_name": group.stats["group_name"],
+                "platforms": group.stats.get("platforms", {}),
+                "platform_comparison": group.stats.get("platform_comparison", {}),
+                "consensus_decisions": list(group.stats.get("consensus_decisions", ()))
+            }
+            groups_data.append(group_info)
+        
+        individual_traders_data = []
+        for trader in self.individual_traders:
+            # 获取平台地址信息
+            platform_addresses = {}
+            for platform_name, platform_trader in trader.multi_trader.platform_traders.items():
+                if hasattr(platform_trader.client, 'address'):
+                    platform_addresses[platform_name] = platform_trader.client.address
+            
+            trader_info = {
+                "type": "individual",
+                "trader_name": trader.stats["trader_name"],
+                "ai_name": trader.stats["ai_name"],
+                "platforms": trader.stats.get("platforms", {}),
+                "platform_comparison": trader.stats.get("platform_comparison", {}),
+                "decisions": list(trader.stats.get("decisions", ())),
+                "addresses": platform_addresses  # 添加地址信息
+            }
+            individual_traders_data.append(trader_info)
+        
+        return {
+            "status": "running" if self.running else "stopped",
+            "groups": groups_data,
+            "individual_traders": individual_traders_data,
+            "update_interval": f"{self.update_interval//60}分钟",
+            "consensus_rule": f"至少{settings.consensus_min_votes}个AI同意",
+            "enabled_platforms": get_enabled_platforms(),
+            "total_participants": len(self.groups) + len(self.individual_traders)
+        }
+    
+    def _build_platform_comparison(self) -> Dict:
+        """构建 /api/platform_comparison 数据"""
+        # 汇总所有组的多平台数据
+        platform_summary = {}
+        
+        for group in self.groups:
+            platforms = group.stats.get("platforms", {})
+            for platform_name, platform_stats in platforms.items():
+                # 提取平台简称（如 Hyperliquid 或 Aster）
+                platform_key = "Hyperliquid" if "Hyperliquid" in platform_name else "Aster"
+                
+                if platform_key not in platform_summary:
+                    platform_summary[platform_key] = {
+                        "platform": platform_key,
+                        "total_pnl": 0,
+                        "total_trades": 0,
+                        "wins": 0,
+                        "losses": 0,
+                        "initial_balance": 0,
+                        "current_balance": 0
+                    }
+                
+                summary = platform_summary[platform_key]
+                summary["total_pnl"] += platform_stats.get("total_pnl", 0)
+                summary["total_trades"] += platform_stats.get("total_trades", 0)
+                summary["wins"] += platform_stats.get("total_wins", 0)
+                summary["losses"] += platform_stats.get("total_losses", 0)
+                summary["initial_balance"] += platform_stats.get("initial_balance", 0)
+                summary["current_balance"] += platform_stats.get("current_balance", 0)
+        
+        # 计算衍生指标
+        platforms_list = []
+        for platform_data in platform_summary.values():
+            total_trades = platform_data["total_trades"]
+            win_rate = (platform_data["wins"] / total_trades * 100) if total_trades > 0 else 0
+            roi = (platform_data["total_pnl"] / platform_data["initial_balance"] * 100) if platform_data["initial_balance"] > 0 else 0
+            
+            platforms_list.append({
+                "platform": platform_data["platform"],
+                "total_pnl": platform_data["total_pnl"],
+                "current_balance": platform_data["current_balance"],
+                "initial_balance": platform_data["initial_balance"],
+                "roi_percentage": roi,
+                "win_rate": win_rate,
+                "total_trades": total_trades
+            })
+        
+        return {"platforms": platforms_list}
+    
+    def _build_leaderboard(self) -> List[Dict]:
+        """构建排行榜基础数据（未排序，排序和排名由接口按参数处理）"""
+        # 收集所有AI的统计数据
+        ai_stats = []
+        
+        # 添加组内AI（注意：组内AI是共识决策，不单独统计PnL）
+        for group in self.groups:
+            for ai_trader in group.ai_traders:
+                ai_name = ai_trader.__class__.__name__.replace('Trader', '')
+                stats = {
+                    "ai_name": ai_name,
+                    "type": "group_member",
+                    "group": group.stats["group_name"],
+                    "total_pnl": 0,
+                    "roi_percentage": 0,
+                    "win_rate": 0,
+                    "total_trades": 0
+                }
+                ai_stats.append(stats)
+        
+        # 添加独立AI交易者（有实际的交易统计）
+        for trader in self.individual_traders:
+            # 汇总该交易者所有平台的统计
+            total_pnl = 0
+            total_trades = 0
+            total_wins = 0
+            total_initial = 0
+            
+            for platform_stats in trader.stats.get("platforms", {}).values():
+                total_pnl += platform_stats.get("total_pnl", 0)
+                total_trades += platform_stats.get("total_trades", 0)
+                total_wins += platform_stats.get("total_wins", 0)
+                total_initial += platform_stats.get("initial_balance", 0)
+            
+            win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
+            roi = (total_pnl / total_initial * 100) if total_initial > 0 else 0
+            
+            stats = {
+                "ai_name": trader.ai_name,
+                "type": "individual",
+                "trader": trader.name,
+                "total_pnl": total_pnl,
+                "roi_percentage": roi,
+                "win_rate": win_rate,
+                "total_trades": total_trades
+            }
+            ai_stats.append(stats)
+        
+        return ai_stats
+    
+    def _rank_leaderboard(self, metric: str) -> List[Dict]:
+        """按指标排序排行榜并添加排名（复制缓存条目，避免修改基础数据）"""
+        ai_stats = sorted(self.cached_leaderboard, key=lambda x: x.get(metric, 0), reverse=True)
+        return [{**stats, "rank": i + 1} for i, stats in enumerate(ai_stats)]
+    
+    def _build_leaderboard_summary(self) -> Dict:
+        """构建 /leaderboard/summary 数据"""
+        total_trades = 0
+        total_pnl = 0
+        
+        # 统计组的数据
+        for group in self.groups:
+            for platform_stats in group.stats.get("platforms", {}).values():
+                total_trades += platform_stats.get("total_trades", 0)
+                total_pnl += platform_stats.get("total_pnl", 0)
+        
+        # 统计独立AI交易者的数据
+        for trader in self.individual_traders:
+            for platform_stats in trader.stats.get("platforms", {}).values():
+                total_trades += platform_stats.get("total_trades", 0)
+                total_pnl += platform_stats.get("total_pnl", 0)
+        
+        # 计算总AI数（组内AI + 独立AI）
+        group_ais = len(self.groups[0].ai_traders) * len(self.groups) if self.groups else 0
+        individual_ais = len(self.individual_traders)
+        
+        return {
+            "total_ais": group_ais + individual_ais,
+            "group_ais": group_ais,
+            "individual_ais": individual_ais,
+            "total_trades": total_trades,
+            "total_pnl": total_pnl,
+            "active_groups": len(self.groups),
+            "active_individual_traders": len(self.individual_traders)
+        }
+    
+    def _build_realtime_balance(self) -> Dict:
+        """构建 /api/realtime_balance 数据"""
+        accounts = []
+        
+        # 添加组账户
+        for group in self.groups:
+            group_name = group.stats["group_name"]
+            
+            # 获取该组所有平台的余额
+            for platform_name, platform_stats in group.stats.get("platforms", {}).items():
+                # 提取平台简称（去掉组名前缀）
+                platform_display = platform_name.replace(f"{group_name}-", "")
+                
+                account = {
+                    "type": "group",
+                    "group": group_name,
+                    "platform": platform_display,
+                    "balance": platform_stats.get("balance", 0),
+                    "initial_balance": platform_stats.get("initial_balance", 0),
+                    "pnl": platform_stats.get("pnl", 0),
+                    "roi": platform_stats.get("roi", 0),
+                    "trades": platform_stats.get("total_trades", 0)
+                }
+                accounts.append(account)
+        
+        # 添加独立AI交易者账户
+        for trader in self.individual_traders:
+            trader_name = trader.stats["trader_name"]
+            ai_name = trader.stats["ai_name"]
+            
+            # 获取该交易者所有平台的余额
+            for platform_name, platform_stats in trader.stats.get("platforms", {}).items():
+                # 提取平台简称（去掉交易者名前缀）
+                platform_display = platform_name.replace(f"{trader_name}-", "")
+                
+                account = {
+                    "type": "individual",
+                    "trader": trader_name,
+                    "ai_name": ai_name,
+                    "platform": platform_display,
+                    "balance": platform_stats.get("balance", 0),
+                    "initial_balance": platform_stats.get("initial_balance", 0),
+                    "pnl": platform_stats.get("pnl", 0),
+                    "roi": platform_stats.get("roi", 0),
+                    "trades": platform_stats.get("total_trades", 0)
+                }
+                accounts.append(account)
+        
+        return {"accounts": accounts}
+    
+    async def _run_with_budget(self, participant_name: str, coro, timeout: float):
+        """在时间预算内执行参与者的决策任务（超时或异常只影响该参与者）"""
+        try:
+            await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"[{participant_name}] ⏱️ 决策超时（>{timeout:.0f}秒），已取消本轮任务（已开始的下单继续完成）")
+        except Exception as e:
+            logger.error(f"[{participant_name}] ❌ 决策任务异常: {e}")
+    
     async def stop(self):
         """停止系统"""
         self.running = False
+        self._rebuild_api_caches()
         logger.info("🛑 共识交易系统正在停止...")
         
         # 关闭组的客户端
@@ -944,6 +1480,13 @@ class ConsensusArena:
             if hasattr(individual_trader, 'data_source_client') and individual_trader.data_source_client:
                 await individual_trader.data_source_client.close_session()
         
+        # 关闭 Aster 客户端共用的 HTTP 会话
+        await AsterClient.close_shared_session()
+        
+        # 关闭 AI 模型的 HTTP 连接
+        for ai_model in self._ai_instance_cache.values():
+            await ai_model.close_session()
+        
         logger.info("✅ 共识交易系统已停止")
 
 
@@ -951,22 +1494,70 @@ arena: Optional[ConsensusArena] = None
 alpha_hunter = None  # Alpha Hunter 实例（用于新闻交易）
 
 
+_HL_API_URL = "https://api.hyperliquid-testnet.xyz" if settings.hyperliquid_testnet else "https://api.hyperliquid.xyz"
+_HL_CHAIN = "Testnet" if settings.hyperliquid_testnet else "Mainnet"
+_HL_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def _init_shared_hl_client():
+    """创建共享的 Hyperliquid 客户端（提交币种等接口复用，避免每次请求重新初始化SDK）"""
+    try:
+        app.state.hl_client = await asyncio.to_thread(
+            HyperliquidClient, settings.hyperliquid_private_key, settings.hyperliquid_testnet
+        )
+    except Exception as e:
+        app.state.hl_client = None
+        logger.warning(f"⚠️ 共享 Hyperliquid 客户端初始化失败: {e}")
+
+
+async def _init_alpha_hunter(hunter):
+    """初始化 Alpha Hunter（新闻分析器），失败不影响其他服务启动"""
+    try:
+        await hunter.initialize()
+        logger.info("✅ Alpha Hunter 已初始化")
+    except Exception as e:
+        logger.warning(f"⚠️ Alpha Hunter 初始化失败: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     global arena, alpha_hunter
-    arena = ConsensusArena()
-    asyncio.create_task(arena.start())
     
-    # 初始化 Alpha Hunter
+    # 加载用户提交的币种（预加载依赖完整的币种列表）
+    await load_submitted_coins()
+    
+    # Hyperliquid HTTP 连接池（复用 TCP/TLS 连接，供 Alpha Hunter 注册等接口直接调用 API）
+    app.state.hl_session = aiohttp.ClientSession(
+        base_url=_HL_API_URL,
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    
     from news_trading.alpha_hunter import AlphaHunter
     alpha_hunter = AlphaHunter()
-    logger.info("✅ Alpha Hunter 已初始化")
+    
+    # 相互独立的启动步骤并发执行：币种配置预加载、共享客户端、Alpha Hunter 初始化
+    await asyncio.gather(
+        preload_coin_configs(),
+        _init_shared_hl_client(),
+        _init_alpha_hunter(alpha_hunter)
+    )
+    
+    arena = ConsensusArena()
+    asyncio.create_task(arena.start())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     if arena:
         await arena.stop()
+    
+    if alpha_hunter:
+        await alpha_hunter.shutdown()
+    
+    hl_session = getattr(app.state, "hl_session", None)
+    if hl_session is not None:
+        await hl_session.close()
 
 
 @app.get("/api/status")
@@ -975,51 +1566,10 @@ async def get_status():
     if not arena:
         return {"status": "not_started"}
     
-    # 更新所有组和交易者的统计数据（确保返回最新数据）
-    for group in arena.groups:
-        await group.update_stats()
-    for trader in arena.individual_traders:
-        await trader.update_stats()
+    if arena.cached_status_json is None:
+        arena._rebuild_api_caches()
     
-    groups_data = []
-    for group in arena.groups:
-        group_info = {
-            "type": "group",
-            "group_name": group.stats["group_name"],
-            "platforms": group.stats.get("platforms", {}),
-            "platform_comparison": group.stats.get("platform_comparison", {}),
-            "consensus_decisions": group.stats.get("consensus_decisions", [])
-        }
-        groups_data.append(group_info)
-    
-    individual_traders_data = []
-    for trader in arena.individual_traders:
-        # 获取平台地址信息
-        platform_addresses = {}
-        for platform_name, platform_trader in trader.multi_trader.platform_traders.items():
-            if hasattr(platform_trader.client, 'address'):
-                platform_addresses[platform_name] = platform_trader.client.address
-        
-        trader_info = {
-            "type": "individual",
-            "trader_name": trader.stats["trader_name"],
-            "ai_name": trader.stats["ai_name"],
-            "platforms": trader.stats.get("platforms", {}),
-            "platform_comparison": trader.stats.get("platform_comparison", {}),
-            "decisions": trader.stats.get("decisions", []),
-            "addresses": platform_addresses  # 添加地址信息
-        }
-        individual_traders_data.append(trader_info)
-    
-    return {
-        "status": "running" if arena.running else "stopped",
-        "groups": groups_data,
-        "individual_traders": individual_traders_data,
-        "update_interval": f"{arena.update_interval//60}分钟",
-        "consensus_rule": f"至少{settings.consensus_min_votes}个AI同意",
-        "enabled_platforms": get_enabled_platforms(),
-        "total_participants": len(arena.groups) + len(arena.individual_traders)
-    }
+    return Response(content=arena.cached_status_json, media_type="application/json")
 
 
 @app.get("/api/platform_comparison")
@@ -1028,52 +1578,10 @@ async def get_platform_comparison():
     if not arena:
         return {"platforms": []}
     
-    # 汇总所有组的多平台数据
-    platform_summary = {}
+    if arena.cached_platform_comparison_json is None:
+        arena._rebuild_api_caches()
     
-    for group in arena.groups:
-        platforms = group.stats.get("platforms", {})
-        for platform_name, platform_stats in platforms.items():
-            # 提取平台简称（如 Hyperliquid 或 Aster）
-            platform_key = "Hyperliquid" if "Hyperliquid" in platform_name else "Aster"
-            
-            if platform_key not in platform_summary:
-                platform_summary[platform_key] = {
-                    "platform": platform_key,
-                    "total_pnl": 0,
-                    "total_trades": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "initial_balance": 0,
-                    "current_balance": 0
-                }
-            
-            summary = platform_summary[platform_key]
-            summary["total_pnl"] += platform_stats.get("total_pnl", 0)
-            summary["total_trades"] += platform_stats.get("total_trades", 0)
-            summary["wins"] += platform_stats.get("total_wins", 0)
-            summary["losses"] += platform_stats.get("total_losses", 0)
-            summary["initial_balance"] += platform_stats.get("initial_balance", 0)
-            summary["current_balance"] += platform_stats.get("current_balance", 0)
-    
-    # 计算衍生指标
-    platforms_list = []
-    for platform_data in platform_summary.values():
-        total_trades = platform_data["total_trades"]
-        win_rate = (platform_data["wins"] / total_trades * 100) if total_trades > 0 else 0
-        roi = (platform_data["total_pnl"] / platform_data["initial_balance"] * 100) if platform_data["initial_balance"] > 0 else 0
-        
-        platforms_list.append({
-            "platform": platform_data["platform"],
-            "total_pnl": platform_data["total_pnl"],
-            "current_balance": platform_data["current_balance"],
-            "initial_balance": platform_data["initial_balance"],
-            "roi_percentage": roi,
-            "win_rate": win_rate,
-            "total_trades": total_trades
-        })
-    
-    return {"platforms": platforms_list}
+    return Response(content=arena.cached_platform_comparison_json, media_type="application/json")
 
 
 @app.get("/api/chart")
@@ -1084,23 +1592,18 @@ async def get_chart_data(
 ):
     """获取K线图数据（包含多平台交易标记）"""
     try:
-        if not arena or len(arena.groups) == 0:
+        if not arena or not arena.market_data_client:
             return {"error": "系统未启动"}
         
-        # 从第一个组的第一个平台获取K线数据
-        first_group = arena.groups[0]
-        candles = []
-        
-        if first_group.primary_client:
-            candles = await first_group.primary_client.get_candles(
-                symbol,
-                interval=interval,
-                lookback=lookback
-            )
+        # 从行情客户端获取K线数据
+        candles = await arena.market_data_client.get_candles(
+            symbol,
+            interval=interval,
+            lookback=lookback
+        )
         
         # 收集所有组的所有平台的交易标记
         trade_markers = []
-        from datetime import datetime
         
         # 1. 收集组交易（Alpha组、Beta组）
         for group in arena.groups:
@@ -1108,31 +1611,21 @@ async def get_chart_data(
             
             # 遍历该组的所有平台
             for platform_name, platform_stats in group.stats.get("platforms", {}).items():
-                for trade in platform_stats.get("trades", []):
-                    try:
-                        trade_time = datetime.fromisoformat(trade.get("time", ""))
-                        
-                        # 只显示系统启动后的交易
-                        if trade_time < group_start_time:
-                            continue
-                        
-                        timestamp_ms = int(trade_time.timestamp() * 1000)
-                        
-                        # 对于开仓用price，对于平仓用exit_price
-                        price = trade.get("price", 0) if trade.get("action") == "open" else trade.get("exit_price", 0)
-                        
-                        trade_markers.append({
-                            "time": timestamp_ms,
-                            "price": price,
-                            "group": group.stats["group_name"],
-                            "platform": platform_name,  # 添加平台信息
-                            "action": trade.get("action", ""),
-                            "side": trade.get("side", ""),
-                            "size": trade.get("size", 0),
-                            "pnl": trade.get("pnl", 0)  # 平仓交易才有pnl
-                        })
-                    except:
-                        continue
+                # 只显示系统启动后的交易
+                for trade in _trades_since(platform_stats.get("trades", []), group_start_time):
+                    # 对于开仓用price，对于平仓用exit_price
+                    price = trade.get("price", 0) if trade.get("action") == "open" else trade.get("exit_price", 0)
+                    
+                    trade_markers.append({
+                        "time": trade["time_ms"],
+                        "price": price,
+                        "group": group.stats["group_name"],
+                        "platform": platform_name,  # 添加平台信息
+                        "action": trade.get("action", ""),
+                        "side": trade.get("side", ""),
+                        "size": trade.get("size", 0),
+                        "pnl": trade.get("pnl", 0)  # 平仓交易才有pnl
+                    })
         
         # 2. 收集独立交易者的交易（DeepSeek-Solo, Claude-Solo等）
         for trader in arena.individual_traders:
@@ -1140,31 +1633,21 @@ async def get_chart_data(
             
             # 遍历该交易者的所有平台
             for platform_name, platform_stats in trader.stats.get("platforms", {}).items():
-                for trade in platform_stats.get("trades", []):
-                    try:
-                        trade_time = datetime.fromisoformat(trade.get("time", ""))
-                        
-                        # 只显示系统启动后的交易
-                        if trade_time < trader_start_time:
-                            continue
-                        
-                        timestamp_ms = int(trade_time.timestamp() * 1000)
-                        
-                        # 对于开仓用price，对于平仓用exit_price
-                        price = trade.get("price", 0) if trade.get("action") == "open" else trade.get("exit_price", 0)
-                        
-                        trade_markers.append({
-                            "time": timestamp_ms,
-                            "price": price,
-                            "group": trader.stats["trader_name"],  # 使用交易者名称（如"Grok-Solo"）
-                            "platform": platform_name,
-                            "action": trade.get("action", ""),
-                            "side": trade.get("side", ""),
-                            "size": trade.get("size", 0),
-                            "pnl": trade.get("pnl", 0)  # 平仓交易才有pnl
-                        })
-                    except:
-                        continue
+                # 只显示系统启动后的交易
+                for trade in _trades_since(platform_stats.get("trades", []), trader_start_time):
+                    # 对于开仓用price，对于平仓用exit_price
+                    price = trade.get("price", 0) if trade.get("action") == "open" else trade.get("exit_price", 0)
+                    
+                    trade_markers.append({
+                        "time": trade["time_ms"],
+                        "price": price,
+                        "group": trader.stats["trader_name"],  # 使用交易者名称（如"Grok-Solo"）
+                        "platform": platform_name,
+                        "action": trade.get("action", ""),
+                        "side": trade.get("side", ""),
+                        "size": trade.get("size", 0),
+                        "pnl": trade.get("pnl", 0)  # 平仓交易才有pnl
+                    })
         
         # 🔍 统计各平台交易数量
         hl_count = sum(1 for m in trade_markers if 'Hyperliquid' in m.get('platform', ''))
@@ -1178,9 +1661,7 @@ async def get_chart_data(
             "interval": interval
         }
     except Exception as e:
-        logger.error(f"获取K线数据失败: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"获取K线数据失败: {e}")
         return {"error": str(e)}
 
 
@@ -1190,60 +1671,14 @@ async def get_leaderboard(metric: str = "total_pnl", limit: int = 10):
     if not arena:
         return {"rankings": []}
     
-    # 收集所有AI的统计数据
-    ai_stats = []
+    if arena.cached_leaderboard is None:
+        arena._rebuild_api_caches()
     
-    # 添加组内AI（注意：组内AI是共识决策，不单独统计PnL）
-    for group in arena.groups:
-        for ai_trader in group.ai_traders:
-            ai_name = ai_trader.__class__.__name__.replace('Trader', '')
-            stats = {
-                "ai_name": ai_name,
-                "type": "group_member",
-                "group": group.stats["group_name"],
-                "total_pnl": 0,
-                "roi_percentage": 0,
-                "win_rate": 0,
-                "total_trades": 0
-            }
-            ai_stats.append(stats)
-    
-    # 添加独立AI交易者（有实际的交易统计）
-    for trader in arena.individual_traders:
-        # 汇总该交易者所有平台的统计
-        total_pnl = 0
-        total_trades = 0
-        total_wins = 0
-        total_initial = 0
-        
-        for platform_stats in trader.stats.get("platforms", {}).values():
-            total_pnl += platform_stats.get("total_pnl", 0)
-            total_trades += platform_stats.get("total_trades", 0)
-            total_wins += platform_stats.get("total_wins", 0)
-            total_initial += platform_stats.get("initial_balance", 0)
-        
-        win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
-        roi = (total_pnl / total_initial * 100) if total_initial > 0 else 0
-        
-        stats = {
-            "ai_name": trader.ai_name,
-            "type": "individual",
-            "trader": trader.name,
-            "total_pnl": total_pnl,
-            "roi_percentage": roi,
-            "win_rate": win_rate,
-            "total_trades": total_trades
-        }
-        ai_stats.append(stats)
-    
-    # 按指标排序
-    ai_stats.sort(key=lambda x: x.get(metric, 0), reverse=True)
-    
-    # 添加排名
-    for i, stats in enumerate(ai_stats[:limit]):
-        stats["rank"] = i + 1
-    
-    return {"rankings": ai_stats[:limit]}
+    # 常用指标已在每轮决策后排好序，其他指标按需排序
+    rankings = arena.cached_leaderboards.get(metric)
+    if rankings is None:
+        rankings = arena._rank_leaderboard(metric)
+    return {"rankings": rankings[:limit]}
 
 
 @app.get("/leaderboard/summary")
@@ -1252,34 +1687,10 @@ async def get_leaderboard_summary():
     if not arena:
         return {}
     
-    total_trades = 0
-    total_pnl = 0
-    
-    # 统计组的数据
-    for group in arena.groups:
-        for platform_stats in group.stats.get("platforms", {}).values():
-            total_trades += platform_stats.get("total_trades", 0)
-            total_pnl += platform_stats.get("total_pnl", 0)
-    
-    # 统计独立AI交易者的数据
-    for trader in arena.individual_traders:
-        for platform_stats in trader.stats.get("platforms", {}).values():
-            total_trades += platform_stats.get("total_trades", 0)
-            total_pnl += platform_stats.get("total_pnl", 0)
-    
-    # 计算总AI数（组内AI + 独立AI）
-    group_ais = len(arena.groups[0].ai_traders) * len(arena.groups) if arena.groups else 0
-    individual_ais = len(arena.individual_traders)
+    if arena.cached_leaderboard_summary_json is None:
+        arena._rebuild_api_caches()
     
-    return {
-        "total_ais": group_ais + individual_ais,
-        "group_ais": group_ais,
-        "individual_ais": individual_ais,
-        "total_trades": total_trades,
-        "total_pnl": total_pnl,
-        "active_groups": len(arena.groups),
-        "active_individual_traders": len(arena.individual_traders)
-    }
+    return Response(content=arena.cached_leaderboard_summary_json, media_type="application/json")
 
 
 @app.get("/strategies")
@@ -1323,60 +1734,17 @@ async def get_realtime_balance():
     if not arena:
         return {"accounts": []}
     
-    accounts = []
-    
-    # 添加组账户
-    for group in arena.groups:
-        group_name = group.stats["group_name"]
-        
-        # 获取该组所有平台的余额
-        for platform_name, platform_stats in group.stats.get("platforms", {}).items():
-            # 提取平台简称（去掉组名前缀）
-            platform_display = platform_name.replace(f"{group_name}-", "")
-            
-            account = {
-                "type": "group",
-                "group": group_name,
-                "platform": platform_display,
-                "balance": platform_stats.get("balance", 0),
-                "initial_balance": platform_stats.get("initial_balance", 0),
-                "pnl": platform_stats.get("pnl", 0),
-                "roi": platform_stats.get("roi", 0),
-                "trades": platform_stats.get("total_trades", 0)
-            }
-            accounts.append(account)
-    
-    # 添加独立AI交易者账户
-    for trader in arena.individual_traders:
-        trader_name = trader.stats["trader_name"]
-        ai_name = trader.stats["ai_name"]
-        
-        # 获取该交易者所有平台的余额
-        for platform_name, platform_stats in trader.stats.get("platforms", {}).items():
-            # 提取平台简称（去掉交易者名前缀）
-            platform_display = platform_name.replace(f"{trader_name}-", "")
-            
-            account = {
-                "type": "individual",
-                "trader": trader_name,
-                "ai_name": ai_name,
-                "platform": platform_display,
-                "balance": platform_stats.get("balance", 0),
-                "initial_balance": platform_stats.get("initial_balance", 0),
-                "pnl": platform_stats.get("pnl", 0),
-                "roi": platform_stats.get("roi", 0),
-                "trades": platform_stats.get("total_trades", 0)
-            }
-            accounts.append(account)
+    if arena.cached_balance_json is None:
+        arena._rebuild_api_caches()
     
-    return {"accounts": accounts}
+    return Response(content=arena.cached_balance_json, media_type="application/json")
 
 
 @app.get("/api/balance_history")
 async def get_balance_history(limit: int = -1):
     """获取余额历史数据（从Redis）- 默认返回所有历史数据"""
     try:
-        history = redis_manager.get_balance_history(limit=limit)
+        history = await redis_manager.get_balance_history(limit=limit)
         return {"history": history, "count": len(history)}
     except Exception as e:
         logger.error(f"获取余额历史失败: {e}")
@@ -1389,7 +1757,7 @@ async def get_decisions():
     if not arena:
         return {"decisions": []}
     
-    return {"decisions": arena.decision_history}
+    return {"decisions": list(arena.decision_history)}
 
 
 @app.get("/")
@@ -1521,7 +1889,7 @@ async def start_news_trading(request: dict = None):
         return {"error": str(e)}
 
 
-@app.get("/api/news_trading/ai_models")
+@app.get("/api/news_trading/ai_models", response_class=FastJSONResponse)
 async def get_ai_models():
     """获取AI模型列表及激活状态"""
     try:
@@ -1582,12 +1950,12 @@ async def get_ai_models():
         return {"error": str(e), "ai_models": []}
 
 
-@app.get("/api/news_trading/coins")
+@app.get("/api/news_trading/coins", response_class=FastJSONResponse)
 async def get_monitored_coins():
     """获取所有监控的币种及其档案"""
     try:
         from news_trading.coin_profiles import COIN_PROFILES, get_coin_profile
-        from news_trading.logo_config import get_coin_logo, get_platform_logo, get_news_source_logo
+        from news_trading.logo_config import get_coin_logo
         
         # 直接从COIN_PROFILES获取所有币种（包含动态添加的）
         coins = list(COIN_PROFILES.keys())
@@ -1598,21 +1966,15 @@ async def get_monitored_coins():
             # 转换枚举为字符串，并添加Logo
             profile_data = {
                 "symbol": coin,
-                "name": profile["name"],
-                "full_name": profile["full_name"],
-                "description": profile["description"],
+                "name": profile.name,
+                "full_name": profile.full_name,
+                "description": profile.description,
                 "logo": get_coin_logo(coin),
-                "background": profile["background"],
-                "upside_potential": profile["upside_potential"],
-                "trading_platforms": [
-                    {"name": p.value, "logo": get_platform_logo(p.value)} 
-                    for p in profile["trading_platforms"]
-                ],
-                "news_sources": [
-                    {"name": s.value, "logo": get_news_source_logo(s.value)} 
-                    for s in profile["news_sources"]
-                ],
-                "why_monitor": profile["why_monitor"]
+                "background": profile.background,
+                "upside_potential": profile.upside_potential,
+                "trading_platforms": [_PLATFORM_ENTRIES[p] for p in profile.trading_platforms],
+                "news_sources": [_NEWS_SOURCE_ENTRIES[s] for s in profile.news_sources],
+                "why_monitor": profile.why_monitor
             }
             profiles.append(profile_data)
         
@@ -1623,83 +1985,54 @@ async def get_monitored_coins():
         return {"error": str(e), "coins": []}
 
 
-@app.get("/api/news_trading/coins/{coin_symbol}")
-async def get_coin_profile_api(coin_symbol: str):
+@app.get("/api/news_trading/coins/{coin_symbol}", response_class=FastJSONResponse)
+async def get_coin_profile_api(coin_symbol: str, response: Response):
     """获取指定币种的详细档案"""
     try:
         from news_trading.coin_profiles import get_coin_profile
-        from news_trading.logo_config import get_coin_logo, get_platform_logo, get_news_source_logo, get_ai_model_logo
+        from news_trading.logo_config import get_coin_logo
         
         profile = get_coin_profile(coin_symbol)
+        active_ais = set(get_news_trading_ais())
         
         # 模拟预测数据（后续可从数据库读取）
-        import random
-        has_prediction = random.choice([True, False])  # 50%概率有预测
-        prediction_count = random.randint(5, 50) if has_prediction else 0
-        prediction_bullish = random.randint(40, 80) if has_prediction else 0
+        # 由币种符号哈希确定，保证同一币种的响应稳定、可被缓存
+        seed = int(hashlib.blake2b(coin_symbol.upper().encode(), digest_size=4).hexdigest(), 16)
+        has_prediction = bool(seed & 1)  # 50%概率有预测
+        prediction_count = 5 + (seed >> 1) % 46 if has_prediction else 0
+        prediction_bullish = 40 + (seed >> 7) % 41 if has_prediction else 0
         prediction_bearish = 100 - prediction_bullish if has_prediction else 0
         
+        response.headers["Cache-Control"] = "public, max-age=60"
+        
         # 转换枚举为字符串，并添加Logo
         return {
             "symbol": coin_symbol.upper(),
-            "name": profile["name"],
-            "full_name": profile["full_name"],
-            "description": profile["description"],
+            "name": profile.name,
+            "full_name": profile.full_name,
+            "description": profile.description,
             "logo": get_coin_logo(coin_symbol),
-            "twitter": profile.get("twitter", ""),
-            "background": profile["background"],
-            "project_type": profile["project_type"].value if hasattr(profile["project_type"], "value") else profile["project_type"],
-            "current_stage": profile["current_stage"].value if hasattr(profile["current_stage"], "value") else profile["current_stage"],
-            "next_stage": profile["next_stage"].value if hasattr(profile["next_stage"], "value") else profile["next_stage"],
-            "stage_progress": profile["stage_progress"],
-            "stage_links": profile.get("stage_links", {}),
-            "upside_potential": profile["upside_potential"],
+            "twitter": profile.twitter,
+            "background": profile.background,
+            # 枚举直接交给序列化器输出其值（orjson / jsonable_encoder 均支持 Enum）
+            "project_type": profile.project_type,
+            "current_stage": profile.current_stage,
+            "next_stage": profile.next_stage,
+            "stage_progress": profile.stage_progress,
+            "stage_links": profile.stage_links,
+            "upside_potential": profile.upside_potential,
             # 预测相关数据
             "has_prediction": has_prediction,
             "prediction_count": prediction_count,
             "prediction_bullish": prediction_bullish,
             "prediction_bearish": prediction_bearish,
-            "trading_platforms": [
-                {"name": p.value, "logo": get_platform_logo(p.value)} 
-                for p in profile["trading_platforms"]
-            ],
-            "news_sources": [
-                {"name": s.value, "logo": get_news_source_logo(s.value)} 
-                for s in profile["news_sources"]
-            ],
+            "trading_platforms": [_PLATFORM_ENTRIES[p] for p in profile.trading_platforms],
+            "news_sources": [_NEWS_SOURCE_ENTRIES[s] for s in profile.news_sources],
             "ai_models": [
-                {
-                    "name": "GPT-4o", 
-                    "logo": get_ai_model_logo("GPT-4o"),
-                    "active": "gpt" in get_news_trading_ais()
-                },
-                {
-                    "name": "Gemini-2.0-Flash", 
-                    "logo": get_ai_model_logo("Gemini-2.0-Flash"),
-                    "active": "gemini" in get_news_trading_ais()
-                },
-                {
-                    "name": "Grok-4-Fast", 
-                    "logo": get_ai_model_logo("Grok-4-Fast"),
-                    "active": "grok" in get_news_trading_ais()
-                },
-                {
-                    "name": "DeepSeek", 
-                    "logo": get_ai_model_logo("DeepSeek"),
-                    "active": "deepseek" in get_news_trading_ais()
-                },
-                {
-                    "name": "Claude-3.5", 
-                    "logo": get_ai_model_logo("Claude-3.5"),
-                    "active": "claude" in get_news_trading_ais()
-                },
-                {
-                    "name": "Qwen-Max", 
-                    "logo": get_ai_model_logo("Qwen-Max"),
-                    "active": "qwen" in get_news_trading_ais()
-                },
+                {**entry, "active": key in active_ais}
+                for key, entry in _AI_MODEL_TEMPLATE
             ],
-            "why_monitor": profile["why_monitor"]
+            "why_monitor": profile.why_monitor
         }
     
     except Exception as e:
@@ -1707,13 +2040,69 @@ async def get_coin_profile_api(coin_symbol: str):
         return {"error": str(e)}
 
 
+# 枚举成员 -> 序列化条目（名称 + Logo），模块加载时构建一次
+_PLATFORM_ENTRIES = {p: {"name": p.value, "logo": get_platform_logo(p.value)} for p in TradingPlatform}
+_NEWS_SOURCE_ENTRIES = {s: {"name": s.value, "logo": get_news_source_logo(s.value)} for s in NewsSource}
+
+
+# 币种档案中展示的AI模型（key 对应 NEWS_TRADING_AIS 中的名称）
+_AI_MODEL_TEMPLATE = tuple(
+    (key, {"name": name, "logo": get_ai_model_logo(name)})
+    for key, name in (
+        ("gpt", "GPT-4o"),
+        ("gemini", "Gemini-2.0-Flash"),
+        ("grok", "Grok-4-Fast"),
+        ("deepseek", "DeepSeek"),
+        ("claude", "Claude-3.5"),
+        ("qwen", "Qwen-Max"),
+    )
+)
+
+
+# 交易链接 -> 平台信息（一次正则扫描识别平台，按原有优先级分发）
+_PLATFORM_RE = re.compile(r"(uniswap|pancakeswap|raydium|hyperliquid|aster)", re.I)
+_PLATFORM_PRIORITY = ("uniswap", "pancakeswap", "raydium", "hyperliquid", "aster")
+_PLATFORM_INFO = {
+    "uniswap": {"platform": "Uniswap", "platform_short": "Uni", "logo": "/images/trade_platforms/uniswap.png"},
+    "pancakeswap": {"platform": "PancakeSwap", "platform_short": "Cake", "logo": "/images/trade_platforms/pancakeswap.png"},
+    "raydium": {"platform": "Raydium", "platform_short": "Ray", "logo": "/images/raydium.jpg"},
+    "hyperliquid": {"platform": "Hyperliquid", "platform_short": "HL", "logo": "/images/hyperliquid.png"},
+    "aster": {"platform": "Aster", "platform_short": "AS", "logo": "/images/aster.jpg"},
+}
+_DEFAULT_PLATFORM_INFO = {"platform": "Trading Platform", "platform_short": "DEX", "logo": None}
+
+
+# 新币提交预加载市场数据的并发合并器（同一币种同时只查询一次）
+_market_data_flight = SingleFlight()
+
+
+def _detect_trading_platforms(trading_link: str) -> set:
+    """识别交易链接中出现的平台关键字（小写）"""
+    return {m.lower() for m in _PLATFORM_RE.findall(trading_link)}
+
+
+async def _fetch_coin_logo(twitter_url: str, symbol: str):
+    """获取Twitter头像并登记到COIN_LOGOS（后台任务）"""
+    from news_trading.logo_fetcher import fetch_twitter_avatar
+    from news_trading.logo_config import set_coin_logo
+    
+    try:
+        logo_path = await fetch_twitter_avatar(twitter_url, symbol)
+        if logo_path:
+            logger.info(f"✅ 成功获取 {symbol} 的Twitter头像: {logo_path}")
+            # 动态添加到COIN_LOGOS字典中（同时清空get_coin_logo缓存）
+            set_coin_logo(symbol, logo_path)
+    except Exception as e:
+        logger.warning(f"⚠️ 获取Twitter头像失败: {e}")
+
+
 @app.post("/api/news_trading/submit_coin_full")
-async def submit_coin_full(request: dict):
+async def submit_coin_full(request: dict, background_tasks: BackgroundTasks):
     """接收用户提交的完整币种信息并动态创建币种配置"""
     try:
         import json
         from datetime import datetime
-        from news_trading.coin_profiles import COIN_PROFILES, ProjectType, ProjectStage, TradingPlatform, NewsSource
+        from news_trading.coin_profiles import COIN_PROFILES, CoinProfile, ProjectType, ProjectStage, TradingPlatform, NewsSource
         
         # 验证必填字段
         required_fields = ['symbol', 'name', 'project_type', 'twitter', 'trading_link']
@@ -1787,78 +2176,26 @@ async def submit_coin_full(request: dict):
         stage_name = current_stage.value  # 例如："On-chain Trading"
         
         # 检测交易平台并生成相应的链接
-        platform_info = None
-        if 'uniswap' in trading_link.lower():
-            platform_info = {
-                "platform": "Uniswap V4" if "v4" in trading_link.lower() else "Uniswap",
-                "platform_short": "Uni",
-                "url": trading_link,
-                "logo": "/images/trade_platforms/uniswap.png"
-            }
-        elif 'pancakeswap' in trading_link.lower():
-            platform_info = {
-                "platform": "PancakeSwap",
-                "platform_short": "Cake",
-                "url": trading_link,
-                "logo": "/images/trade_platforms/pancakeswap.png"
-            }
-        elif 'raydium' in trading_link.lower():
-            platform_info = {
-                "platform": "Raydium",
-                "platform_short": "Ray",
-                "url": trading_link,
-                "logo": "/images/raydium.jpg"
-            }
-        elif 'hyperliquid' in trading_link.lower():
-            platform_info = {
-                "platform": "Hyperliquid",
-                "platform_short": "HL",
-                "url": trading_link,
-                "logo": "/images/hyperliquid.png"
-            }
-        elif 'aster' in trading_link.lower():
-            platform_info = {
-                "platform": "Aster",
-                "platform_short": "AS",
-                "url": trading_link,
-                "logo": "/images/aster.jpg"
-            }
-        else:
-            # 通用链接
-            platform_info = {
-                "platform": "Trading Platform",
-                "platform_short": "DEX",
-                "url": trading_link,
-                "logo": None
-            }
+        detected_platforms = _detect_trading_platforms(trading_link)
+        platform_key = next((k for k in _PLATFORM_PRIORITY if k in detected_platforms), None)
+        platform_info = {**_PLATFORM_INFO.get(platform_key, _DEFAULT_PLATFORM_INFO), "url": trading_link}
+        if platform_key == "uniswap" and "v4" in trading_link.lower():
+            platform_info["platform"] = "Uniswap V4"
         
         if platform_info:
             new_coin_profile["stage_links"][stage_name] = [platform_info]
         
-        # 尝试获取Twitter头像作为Logo
-        from news_trading.logo_fetcher import fetch_twitter_avatar, get_default_logo
-        from news_trading.logo_config import COIN_LOGOS
-        
-        logo_path = None
+        # 在响应返回后后台获取Twitter头像作为Logo
+        # 获取完成前（或失败时）前端使用默认SVG占位符
         if request['twitter']:
-            try:
-                logo_path = await fetch_twitter_avatar(request['twitter'], symbol)
-                if logo_path:
-                    logger.info(f"✅ 成功获取 {symbol} 的Twitter头像: {logo_path}")
-                    # 动态添加到COIN_LOGOS字典中
-                    COIN_LOGOS[symbol] = logo_path
-            except Exception as e:
-                logger.warning(f"⚠️ 获取Twitter头像失败: {e}")
-        
-        # 如果没有获取到logo，会在前端使用默认SVG占位符
+            background_tasks.add_task(_fetch_coin_logo, request['twitter'], symbol)
         
         # 动态添加到COIN_PROFILES
-        COIN_PROFILES[symbol] = new_coin_profile
+        COIN_PROFILES[symbol] = CoinProfile.from_dict(new_coin_profile)
         
         # 同时添加到SUPPORTED_COINS
         from news_trading.config import SUPPORTED_COINS
-        if symbol not in SUPPORTED_COINS:
-            SUPPORTED_COINS.append(symbol)
+        SUPPORTED_COINS.add(symbol)
         
         # 保存提交记录
         submission = {
@@ -1895,17 +2232,19 @@ async def submit_coin_full(request: dict):
             logger.info(f"🔄 [{symbol}] 正在预加载精度配置和市场数据...")
             start_time = time.time()
             
-            # 预加载 Hyperliquid 精度配置（会缓存起来）
-            precision_config = PrecisionConfig.get_hyperliquid_precision(symbol)
+            # 预加载 Hyperliquid 精度配置（会缓存起来，并发请求合并为一次查询）
+            precision_config = await PrecisionConfig.get_hyperliquid_precision_async(symbol)
             
             # 预加载市场数据（包括最大杠杆）
-            if 'hyperliquid' in trading_link.lower() or 'aster' not in trading_link.lower():
+            if 'hyperliquid' in detected_platforms or 'aster' not in detected_platforms:
                 try:
-                    from trading.hyperliquid.client import HyperliquidClient
-                    from config.settings import settings
+                    hl_client = getattr(app.state, "hl_client", None)
+                    if hl_client is None:
+                        raise RuntimeError("共享 Hyperliquid 客户端未初始化")
                     
-                    hl_client = HyperliquidClient(settings.hyperliquid_private_key)
-                    market_data = hl_client.get_market_data(symbol)
+                    market_data = await _market_data_flight.do(
+                        symbol, lambda: hl_client.get_market_data(symbol)
+                    )
                     
                     preload_time = time.time() - start_time
                     logger.info(
@@ -1972,35 +2311,37 @@ async def submit_url(request: dict):
         from news_trading.message_listeners.base_listener import ListingMessage
         
         # 尝试从内容中提取币种符号
+        # 只处理第一个匹配的币种：内容只转换一次大写，命中即停止
+        # SUPPORTED_COINS 是集合，按排序后的顺序匹配，保证多币种命中时结果稳定
         from news_trading.config import SUPPORTED_COINS
-        coin_symbols = []
-        for coin in SUPPORTED_COINS:
-            if coin.upper() in content.upper():
-                coin_symbols.append(coin.upper())
+        content_upper = content.upper()
+        coin_symbol = next(
+            (coin.upper() for coin in sorted(SUPPORTED_COINS) if coin.upper() in content_upper),
+            None
+        )
         
         # 如果找到币种，创建消息并触发处理
-        if coin_symbols and news_handler:
-            for coin_symbol in coin_symbols[:1]:  # 只处理第一个匹配的币种
-                message = ListingMessage(
-                    source="user_submit",
-                    coin_symbol=coin_symbol,
-                    raw_message=f"User submitted: {content[:200]}...",
-                    timestamp=datetime.now(),
-                    url=url,
-                    reliability_score=0.7  # 用户提交可靠性中等
-                )
-                
-                # 触发处理
-                await news_handler.handle_message(message)
-                
-                logger.info(f"✅ 用户提交已触发AI分析: {coin_symbol}")
-                
-                return {
-                    "success": True,
-                    "message": "URL submitted and AI analysis triggered",
-                    "coin_symbol": coin_symbol,
-                    "url": url
-                }
+        if coin_symbol and news_handler:
+            message = ListingMessage(
+                source="user_submit",
+                coin_symbol=coin_symbol,
+                raw_message=f"User submitted: {content[:200]}...",
+                timestamp=datetime.now(),
+                url=url,
+                reliability_score=0.7  # 用户提交可靠性中等
+            )
+            
+            # 触发处理
+            await news_handler.handle_message(message)
+            
+            logger.info(f"✅ 用户提交已触发AI分析: {coin_symbol}")
+            
+            return {
+                "success": True,
+                "message": "URL submitted and AI analysis triggered",
+                "coin_symbol": coin_symbol,
+                "url": url
+            }
         
         # 如果没有找到币种，仍然记录提交
         logger.warning(f"⚠️ 用户提交的URL未识别到支持的币种: {url}")
@@ -2108,24 +2449,24 @@ async def news_trading_events(request: Request):
     """
     SSE端点 - 推送新闻交易实时事件
     """
-    from news_trading.event_manager import event_manager
+    from news_trading.event_manager import event_manager, SUBSCRIBER_QUEUE_SIZE
     import json
     
     async def event_generator():
-        # 创建订阅队列
-        queue = asyncio.Queue()
+        # 创建订阅队列（有界：积压过多时由事件管理器断开，避免拖慢广播）
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
         event_manager.add_subscriber(queue)
         
         try:
-            # 首先发送历史事件
-            history = event_manager.get_history()
-            for event in history[-10:]:  # 只发送最近10条
-                yield f"data: {json.dumps(event)}\n\n"
+            # 首先发送最近10条历史事件（已预先序列化，一次写出）
+            recent = event_manager.get_recent_sse()
+            if recent:
+                yield recent
             
             # 持续推送新事件
             while True:
-                # 检查客户端是否断开
-                if await request.is_disconnected():
+                # 检查客户端是否断开，或因积压过多已被移出订阅
+                if await request.is_disconnected() or not event_manager.is_subscribed(queue):
                     break
                 
                 try:
@@ -2181,8 +2522,7 @@ async def get_news_trading_status():
                     trades_data = r.get(trades_key)
                     
                     if trades_data:
-                        import json
-                        trades = json.loads(trades_data)
+                        trades = orjson.loads(trades_data) if orjson else json.loads(trades_data)
                         
                         for trade in trades:
                             # 累加交易量（使用notional value）
@@ -2223,17 +2563,51 @@ async def get_news_trading_status():
         }
 
 
-def load_submitted_coins():
+# 用户提交币种的默认档案模板（静态部分在模块加载时构建一次）
+_DEFAULT_COMMUNITY_PROFILE_TEMPLATE = {
+    "description": "",
+    "twitter": "",
+    "background": {
+        "total_funding": "Community Submission",
+        "track": "Community Token",
+    },
+    "project_type": ProjectType.NORMAL,
+    "current_stage": ProjectStage.ON_CHAIN,
+    "next_stage": ProjectStage.CEX_ALPHA,
+    "stage_progress": {
+        "completed": [],
+        "current": ProjectStage.ON_CHAIN.value,
+        "upcoming": "CEX Listing"
+    },
+    "upside_potential": {
+        "market_position": "Community submitted token",
+        "narrative": "User-generated content",
+        "catalysts": ["Community support", "Platform listings"],
+        "risk_factors": ["Community submission - DYOR"],
+        "target_multiplier": "TBD"
+    },
+    "trading_platforms": [TradingPlatform.HYPERLIQUID],
+    "news_sources": [NewsSource.BINANCE_SPOT, NewsSource.BINANCE_FUTURES],
+}
+
+
+def _read_submissions_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+async def load_submitted_coins():
     """启动时加载用户提交的币种到SUPPORTED_COINS和COIN_PROFILES"""
     import json
-    from news_trading.coin_profiles import COIN_PROFILES, ProjectType, ProjectStage, TradingPlatform, NewsSource
+    from news_trading.coin_profiles import COIN_PROFILES, CoinProfile
     from news_trading.config import SUPPORTED_COINS
     
     submissions_file = "coin_submissions.json"
     
     try:
-        with open(submissions_file, 'r') as f:
-            submissions = json.load(f)
+        # 在线程池中读取文件，避免阻塞事件循环；一次性解码
+        data = await asyncio.to_thread(_read_submissions_file, submissions_file)
+        submissions = orjson.loads(data) if orjson else json.loads(data)
         
         if not submissions:
             logger.info("📋 未发现用户提交的币种")
@@ -2249,48 +2623,29 @@ def load_submitted_coins():
             
             # 添加到SUPPORTED_COINS（如果不存在）
             if symbol not in SUPPORTED_COINS:
-                SUPPORTED_COINS.append(symbol)
+                SUPPORTED_COINS.add(symbol)
                 logger.info(f"  ✅ [{symbol}] 已添加到监控列表")
             
-            # 如果COIN_PROFILES中不存在，创建基本配置
+            # 如果COIN_PROFILES中不存在，基于模板创建基本配置
             if symbol not in COIN_PROFILES:
-                # 简化的配置，避免重复submit_coin_full的逻辑
-                COIN_PROFILES[symbol] = {
+                name = submission.get('name', symbol)
+                COIN_PROFILES[symbol] = CoinProfile.from_dict({
+                    **_DEFAULT_COMMUNITY_PROFILE_TEMPLATE,
                     "name": symbol,
-                    "full_name": submission.get('name', symbol),
-                    "description": f"Community submitted: {submission.get('name', symbol)}",
+                    "full_name": name,
+                    "description": f"Community submitted: {name}",
                     "twitter": submission.get('twitter', ''),
-                    "background": {
-                        "total_funding": "Community Submission",
-                        "track": "Community Token",
-                    },
-                    "project_type": ProjectType.NORMAL,
-                    "current_stage": ProjectStage.ON_CHAIN,
-                    "next_stage": ProjectStage.CEX_ALPHA,
-                    "stage_progress": {
-                        "completed": [],
-                        "current": ProjectStage.ON_CHAIN.value,
-                        "upcoming": "CEX Listing"
-                    },
                     "stage_links": {},
-                    "upside_potential": {
-                        "market_position": "Community submitted token",
-                        "narrative": "User-generated content",
-                        "catalysts": ["Community support", "Platform listings"],
-                        "risk_factors": ["Community submission - DYOR"],
-                        "target_multiplier": "TBD"
-                    },
-                    "trading_platforms": [TradingPlatform.HYPERLIQUID],
-                    "news_sources": [NewsSource.BINANCE_SPOT, NewsSource.BINANCE_FUTURES],
-                    "why_monitor": f"Community submitted: {submission.get('name', symbol)}"
-                }
+                    "why_monitor": f"Community submitted: {name}"
+                })
                 logger.info(f"  ✅ [{symbol}] 已添加到币种配置")
         
         logger.info(f"✅ 已加载用户提交的币种，当前监控: {len(SUPPORTED_COINS)} 个\n")
         
     except FileNotFoundError:
         logger.info("📋 首次启动，未发现coin_submissions.json")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # json.JSONDecodeError 与 orjson.JSONDecodeError 均是 ValueError 的子类
         logger.error(f"❌ 解析coin_submissions.json失败: {e}")
     except Exception as e:
         logger.error(f"❌ 加载用户提交币种失败: {e}")
@@ -2306,10 +2661,11 @@ async def preload_coin_configs():
     start_time = time.time()
     success_count = 0
     
-    for coin in SUPPORTED_COINS:
+    # 遍历快照：await 期间可能有新币种提交加入集合
+    for coin in sorted(SUPPORTED_COINS):
         try:
             # 预加载精度配置（会自动缓存）
-            precision_config = PrecisionConfig.get_hyperliquid_precision(coin)
+            precision_config = await PrecisionConfig.get_hyperliquid_precision_async(coin)
             success_count += 1
             logger.info(f"  ✅ [{coin}] 精度配置已缓存")
         except Exception as e:
@@ -2325,7 +2681,38 @@ async def preload_coin_configs():
 
 # ================== Alpha Hunter API ==================
 
-@app.post("/api/alpha_hunter/approve_agent")
+_account_from_key = eth_account.Account.from_key
+
+# 用户 Hyperliquid 客户端池（LRU），key 为私钥哈希，避免重复初始化 SDK 且不以明文私钥为键
+_HL_USER_CLIENT_MAX = 256
+_hl_user_clients: "OrderedDict[str, HyperliquidClient]" = OrderedDict()
+_hl_user_clients_lock = asyncio.Lock()
+
+
+async def _get_user_hl_client(private_key: str) -> HyperliquidClient:
+    """获取（或创建并缓存）指定私钥对应的 Hyperliquid 客户端"""
+    key = hashlib.blake2b(private_key.encode(), digest_size=16).hexdigest()
+    async with _hl_user_clients_lock:
+        client = _hl_user_clients.get(key)
+        if client is not None:
+            _hl_user_clients.move_to_end(key)
+            return client
+        
+        client = await asyncio.to_thread(HyperliquidClient, private_key, settings.hyperliquid_testnet)
+        _hl_user_clients[key] = client
+        if len(_hl_user_clients) > _HL_USER_CLIENT_MAX:
+            _hl_user_clients.popitem(last=False)
+        return client
+
+
+# approve_agent 结果短期缓存，key: (用户地址, agent_name)；前端重试时不再重复授权
+_approve_agent_cache = TTLCache(maxsize=64, ttl=120)
+# 最近已在 Hyperliquid 完成授权的 Agent，key: (用户地址, agent_name, agent地址)，value: 授权时的 nonce
+_recent_agent_approvals = TTLCache(maxsize=256, ttl=120)
+# 已被 Hyperliquid 接受的 approveAgent nonce，key: (用户地址, nonce)；重放请求在本地直接拒绝
+_used_approval_nonces = TTLCache(maxsize=10_000, ttl=86400)
+
+@app.post("/api/alpha_hunter/approve_agent", response_class=FastJSONResponse)
 async def approve_agent_for_user(request: dict):
     """
     为用户生成并授权 Agent（调用 Hyperliquid approve_agent）
@@ -2350,39 +2737,48 @@ async def approve_agent_for_user(request: dict):
         if not user_private_key:
             return {"status": "error", "message": "缺少用户私钥"}
         
+        user_address = _account_from_key(user_private_key).address
+        cache_key = (user_address.lower(), agent_name)
+        cached = _approve_agent_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️ 复用最近的 Agent 授权结果: {cached['agent_address']}")
+            return cached
+        
         # 创建用户的 Hyperliquid 客户端
-        user_client = HyperliquidClient(user_private_key, settings.hyperliquid_testnet)
+        user_client = await _get_user_hl_client(user_private_key)
         
         # 调用 approve_agent
         logger.info(f"🔑 调用 Hyperliquid approve_agent for {agent_name}...")
         approve_result, agent_private_key = await user_client.approve_agent(agent_name)
         
         if approve_result.get("status") != "ok":
+            _approve_agent_cache.pop(cache_key, None)
             return {
                 "status": "error",
                 "message": f"Hyperliquid approve_agent 失败: {approve_result}"
             }
         
         # 获取 Agent 地址
-        import eth_account
-        agent_account = eth_account.Account.from_key(agent_private_key)
+        agent_account = _account_from_key(agent_private_key)
         agent_address = agent_account.address
         
         logger.info(f"✅ Agent 授权成功: {agent_address}")
         
-        return {
+        result = {
             "status": "ok",
             "agent_address": agent_address,
             "agent_private_key": agent_private_key,
             "user_address": user_client.account.address
         }
+        _approve_agent_cache.set(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"❌ approve_agent_for_user 失败: {e}")
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/derive_address")
+@app.post("/api/alpha_hunter/derive_address", response_class=FastJSONResponse)
 async def derive_address_from_private_key(request: dict):
     """
     从私钥推导以太坊地址
@@ -2399,14 +2795,12 @@ async def derive_address_from_private_key(request: dict):
             return {"status": "error", "message": "缺少 private_key"}
         
         # 使用 eth_account 从私钥推导地址
-        from eth_account import Account
-        
         # 移除 '0x' 前缀（如果存在）
         if private_key.startswith('0x'):
             private_key = private_key[2:]
         
         # 从私钥创建账户对象
-        account = Account.from_key('0x' + private_key)
+        account = _account_from_key('0x' + private_key)
         address = account.address
         
         logger.info(f"✅ 从私钥推导地址: {address}")
@@ -2421,11 +2815,83 @@ async def derive_address_from_private_key(request: dict):
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/register")
-async def register_alpha_hunter(request: dict):
+def _split_eip712_sig(signature: str) -> dict:
+    """将65字节的 hex 签名拆分为 Hyperliquid API 需要的 {r, s, v}"""
+    sig_bytes = bytes.fromhex(signature[2:] if signature.startswith('0x') else signature)
+    return {
+        "r": '0x' + sig_bytes[:32].hex(),
+        "s": '0x' + sig_bytes[32:64].hex(),
+        "v": sig_bytes[64]
+    }
+
+
+# Hyperliquid approveAgent 的 EIP-712 类型定义（与 SDK 的 user-signed action 一致）
+_APPROVE_AGENT_EIP712_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "HyperliquidTransaction:ApproveAgent": [
+        {"name": "hyperliquidChain", "type": "string"},
+        {"name": "agentAddress", "type": "address"},
+        {"name": "agentName", "type": "string"},
+        {"name": "nonce", "type": "uint64"},
+    ],
+}
+
+
+def _recover_approve_agent_signer(action: dict, signature_obj: dict) -> str:
+    """从 approveAgent 的 EIP-712 签名恢复签名者地址"""
+    typed_data = {
+        "types": _APPROVE_AGENT_EIP712_TYPES,
+        "primaryType": "HyperliquidTransaction:ApproveAgent",
+        "domain": {
+            "name": "HyperliquidSignTransaction",
+            "version": "1",
+            "chainId": int(action["signatureChainId"], 16),
+            "verifyingContract": "0x0000000000000000000000000000000000000000",
+        },
+        "message": action,
+    }
+    signable = encode_typed_data(full_message=typed_data)
+    v, r, s = signature_obj["v"], int(signature_obj["r"], 16), int(signature_obj["s"], 16)
+    
+    if coincurve is not None:
+        # EIP-191 摘要：keccak(0x19 || version || header || body)，只用 SignableMessage 的公开字段
+        digest = keccak(b"\x19" + signable.version + signable.header + signable.body)
+        sig = r.to_bytes(32, "big") + s.to_bytes(32, "big") + bytes([v - 27 if v >= 27 else v])
+        public_key = coincurve.PublicKey.from_signature_and_message(sig, digest, hasher=None)
+        return to_checksum_address(keccak(public_key.format(compressed=False)[1:])[-20:])
+    
+    return eth_account.Account.recover_message(signable, vrs=(v, r, s))
+
+
+class RegisterAlphaHunterRequest(BaseModel):
+    """Alpha Hunter 注册请求"""
+    # 必填字符串不允许为空（与原 all([...]) 校验一致，空值在请求校验阶段即被拒绝）
+    user_address: str = Field(min_length=1)
+    agent_private_key: str = Field(min_length=1)
+    agent_address: str = Field(min_length=1)
+    agent_name: str = "alpha_hunter"
+    monitored_coins: List[str] = []
+    margin_per_coin: Dict[str, float] = {}
+    nonce: int
+    signature: str = Field(min_length=1)
+    signature_chain_id: str = "0xa4b1"  # 默认 Arbitrum One
+
+
+_register_flight = SingleFlight()
+
+
+@app.post("/api/alpha_hunter/register", response_class=FastJSONResponse)
+async def register_alpha_hunter(request: RegisterAlphaHunterRequest):
     """
     注册 Alpha Hunter 用户（用户已在前端用 MetaMask 签名 EIP-712 approve_agent 消息）
     
+    同一 (用户地址, nonce) 的并发重复提交合并为一次处理，所有调用方共享同一结果
+    
     Expected JSON:
     {
         "user_address": "0x...",
@@ -2438,112 +2904,150 @@ async def register_alpha_hunter(request: dict):
         "signature": "0x..."     # MetaMask EIP-712 签名（hex string）
     }
     """
+    return await _register_flight.do(
+        (request.user_address.lower(), request.nonce),
+        lambda: _register_alpha_hunter(request)
+    )
+
+
+async def _register_alpha_hunter(request: RegisterAlphaHunterRequest):
+    """注册 Alpha Hunter 用户的实际处理流程"""
     try:
-        user_address = request.get("user_address")
-        agent_private_key = request.get("agent_private_key")
-        agent_address = request.get("agent_address")
-        agent_name = request.get("agent_name", "alpha_hunter")
-        monitored_coins = request.get("monitored_coins", [])
-        margin_per_coin = request.get("margin_per_coin", {})
-        nonce = request.get("nonce")
-        signature = request.get("signature")
-        signature_chain_id = request.get("signature_chain_id", "0xa4b1")  # 默认 Arbitrum One
-        
-        if not all([user_address, agent_private_key, agent_address, nonce, signature]):
-            return {"status": "error", "message": "缺少必要参数"}
-        
-        logger.info(f"🔐 收到 Alpha Hunter 注册请求:")
-        logger.info(f"   用户地址: {user_address}")
-        logger.info(f"   Agent地址: {agent_address}")
-        logger.info(f"   Agent名称: {agent_name}")
-        logger.info(f"   签名 ChainId: {signature_chain_id}")
-        logger.info(f"   签名: {signature[:20]}...")
-        
-        # Step 1: 调用 Hyperliquid API 提交 approve_agent 请求
-        logger.info(f"📡 Step 1: 提交 approve_agent 到 Hyperliquid API...")
-        
-        import httpx
-        
-        # 构造 Hyperliquid approve_agent action（按照 SDK 的字段顺序）
-        action = {
-            "type": "approveAgent",
-            "agentAddress": agent_address,
-            "agentName": agent_name,
-            "nonce": nonce,
-            "signatureChainId": signature_chain_id,  # 使用用户实际签名的 chainId
-            "hyperliquidChain": "Mainnet" if not settings.hyperliquid_testnet else "Testnet"
-        }
-        
-        # 解析签名（hex string -> {r, s, v}）
-        sig_hex = signature[2:] if signature.startswith('0x') else signature
-        sig_r = '0x' + sig_hex[:64]
-        sig_s = '0x' + sig_hex[64:128]
-        sig_v = int(sig_hex[128:130], 16)
-        
-        signature_obj = {
-            "r": sig_r,
-            "s": sig_s,
-            "v": sig_v
-        }
-        
-        # 构造 Hyperliquid API 请求
-        hyperliquid_url = "https://api.hyperliquid-testnet.xyz/exchange" if settings.hyperliquid_testnet else "https://api.hyperliquid.xyz/exchange"
-        
-        # 构造完整的 API 请求（与 SDK 格式一致）
-        payload = {
-            "action": action,
-            "nonce": nonce,
-            "signature": signature_obj,
-            "vaultAddress": None,
-            "expiresAfter": None  # 默认 None，与 SDK 一致
-        }
-        
-        # 添加 HTTP headers，指定签名者地址
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        logger.info(f"   Hyperliquid URL: {hyperliquid_url}")
-        logger.info(f"   User Address: {user_address}")
-        logger.info(f"   Agent Address: {agent_address}")
-        logger.info(f"   Payload: {payload}")
+        # 必填字段与类型已由 RegisterAlphaHunterRequest 校验
+        user_address = request.user_address
+        agent_private_key = request.agent_private_key
+        agent_address = request.agent_address
+        agent_name = request.agent_name
+        monitored_coins = request.monitored_coins
+        margin_per_coin = request.margin_per_coin
+        nonce = request.nonce
+        signature = request.signature
+        signature_chain_id = request.signature_chain_id
+        
+        logger.info(
+            "🔐 收到 Alpha Hunter 注册请求: user=%s agent=%s name=%s chain_id=%s",
+            user_address, agent_address, agent_name, signature_chain_id
+        )
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(hyperliquid_url, json=payload, headers=headers)
-            result = response.json()
+        # Agent 私钥必须对应所授权的 Agent 地址，否则授权与实际下单的不是同一个 Agent
+        if _account_from_key(agent_private_key).address.lower() != agent_address.lower():
+            return {"status": "error", "message": "agent_private_key 与 agent_address 不匹配"}
         
-        logger.info(f"   Response: {result}")
+        # Step 2 的本地准备（创建 Agent 客户端、校验余额）不依赖授权结果，与 Step 1 并发执行
+        prepare_task = asyncio.create_task(alpha_hunter.prepare_user(
+            user_address=user_address,
+            agent_private_key=agent_private_key,
+            monitored_coins=monitored_coins,
+            margin_per_coin=margin_per_coin
+        ))
         
-        if result.get("status") != "ok":
-            return {
-                "status": "error",
-                "message": f"Hyperliquid approve_agent 失败: {result}"
+        # Step 1: 调用 Hyperliquid API 提交 approve_agent 请求（同一 Agent 近期已授权则跳过）
+        approval_key = (user_address.lower(), agent_name, agent_address.lower())
+        nonce_key = (user_address.lower(), nonce)
+        try:
+            # 重放检查对所有路径生效（包括近期已授权的快捷路径）
+            if nonce_key in _used_approval_nonces:
+                prepare_task.cancel()
+                return {"status": "error", "message": "nonce already used"}
+            
+            # 构造 Hyperliquid approve_agent action（按照 SDK 的字段顺序）
+            action = {
+                "type": "approveAgent",
+                "agentAddress": agent_address,
+                "agentName": agent_name,
+                "nonce": nonce,
+                "signatureChainId": signature_chain_id,  # 使用用户实际签名的 chainId
+                "hyperliquidChain": _HL_CHAIN
             }
-        
-        logger.info(f"✅ Step 1: Hyperliquid approve_agent 成功!")
+            
+            # 解析签名（hex string -> {r, s, v}）
+            signature_obj = _split_eip712_sig(signature)
+            
+            approved_nonce = _recent_agent_approvals.get(approval_key)
+            if approved_nonce is not None:
+                # 快捷路径不经过 Hyperliquid 验签，必须在本地确认是用户本人对新 nonce 的签名
+                if nonce <= approved_nonce:
+                    prepare_task.cancel()
+                    return {"status": "error", "message": "nonce is not newer than the approved one"}
+                try:
+                    signer = await asyncio.to_thread(_recover_approve_agent_signer, action, signature_obj)
+                except Exception as e:
+                    prepare_task.cancel()
+                    return {"status": "error", "message": f"签名校验失败: {e}"}
+                if signer.lower() != user_address.lower():
+                    prepare_task.cancel()
+                    return {
+                        "status": "error",
+                        "message": f"签名者 {signer} 与用户地址 {user_address} 不一致"
+                    }
+                _used_approval_nonces.set(nonce_key, True)
+                logger.info(f"♻️ Step 1: Agent 近期已授权，跳过 Hyperliquid approve_agent")
+            else:
+                logger.info(f"📡 Step 1: 提交 approve_agent 到 Hyperliquid API...")
+                
+                # 本地预校验签名者，明显无效的签名不再发往 Hyperliquid
+                try:
+                    signer = await asyncio.to_thread(_recover_approve_agent_signer, action, signature_obj)
+                except Exception as e:
+                    signer = None
+                    logger.warning(f"⚠️ 本地签名预校验跳过: {e}")
+                if signer is not None and signer.lower() != user_address.lower():
+                    prepare_task.cancel()
+                    return {
+                        "status": "error",
+                        "message": f"签名者 {signer} 与用户地址 {user_address} 不一致"
+                    }
+                
+                # 构造完整的 API 请求（与 SDK 格式一致）
+                payload = {
+                    "action": action,
+                    "nonce": nonce,
+                    "signature": signature_obj,
+                    "vaultAddress": None,
+                    "expiresAfter": None  # 默认 None，与 SDK 一致
+                }
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("   Hyperliquid URL: %s/exchange payload=%r", _HL_API_URL, payload)
+                
+                async with app.state.hl_session.post("/exchange", json=payload, headers=_HL_JSON_HEADERS) as response:
+                    body = await response.read()
+                result = orjson.loads(body) if orjson is not None else json.loads(body)
+                
+                logger.debug("   Response: %r", result)
+                
+                if result.get("status") != "ok":
+                    prepare_task.cancel()
+                    return {
+                        "status": "error",
+                        "message": f"Hyperliquid approve_agent 失败: {result}"
+                    }
+                
+                _recent_agent_approvals.set(approval_key, nonce)
+                _used_approval_nonces.set(nonce_key, True)
+                logger.info(f"✅ Step 1: Hyperliquid approve_agent 成功!")
+        except BaseException:
+            prepare_task.cancel()
+            raise
         
         # Step 2: 注册到本地 Alpha Hunter 系统
         logger.info(f"📝 Step 2: 注册到本地系统...")
         
-        result = await alpha_hunter.register_user(
-            user_address=user_address,
-            agent_private_key=agent_private_key,
-            monitored_coins=monitored_coins,
-            margin_per_coin=margin_per_coin
-        )
+        prepared = await prepare_task
+        if prepared.get("status") != "ok":
+            return prepared
+        result = alpha_hunter.commit_prepared(prepared)
         
         logger.info(f"✅ Step 2: 本地注册成功!")
         
         return result
-        
+    
     except Exception as e:
-        logger.error(f"❌ register_alpha_hunter 失败: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"❌ register_alpha_hunter 失败: {e}")
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/start")
+@app.post("/api/alpha_hunter/start", response_class=FastJSONResponse)
 async def start_alpha_hunter(request: dict):
     """开始 Alpha Hunter 监控"""
     try:
@@ -2559,7 +3063,7 @@ async def start_alpha_hunter(request: dict):
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/add_coin")
+@app.post("/api/alpha_hunter/add_coin", response_class=FastJSONResponse)
 async def add_coin_to_alpha_hunter(request: dict):
     """为已注册用户添加新的监控币种"""
     try:
@@ -2582,7 +3086,7 @@ async def add_coin_to_alpha_hunter(request: dict):
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/stop")
+@app.post("/api/alpha_hunter/stop", response_class=FastJSONResponse)
 async def stop_alpha_hunter(request: dict):
     """停止 Alpha Hunter 监控"""
     try:
@@ -2598,7 +3102,7 @@ async def stop_alpha_hunter(request: dict):
         return {"status": "error", "message": str(e)}
 
 
-@app.get("/api/alpha_hunter/status")
+@app.get("/api/alpha_hunter/status", response_class=FastJSONResponse)
 async def get_alpha_hunter_status(user_address: str):
     """获取 Alpha Hunter 用户状态"""
     try:
@@ -2610,7 +3114,7 @@ async def get_alpha_hunter_status(user_address: str):
         return {"status": "error", "message": str(e)}
 
 
-@app.get("/api/alpha_hunter/positions")
+@app.get("/api/alpha_hunter/positions", response_class=FastJSONResponse)
 async def get_alpha_hunter_positions(user_address: str):
     """获取用户在 Hyperliquid 上的持仓信息"""
     try:
@@ -2674,7 +3178,7 @@ async def get_alpha_hunter_positions(user_address: str):
         return {"status": "error", "message": str(e)}
 
 
-@app.post("/api/alpha_hunter/close_position")
+@app.post("/api/alpha_hunter/close_position", response_class=FastJSONResponse)
 async def close_alpha_hunter_position(request: Request):
     """平仓用户在 Hyperliquid 上的持仓"""
     try:
@@ -2731,7 +3235,7 @@ async def close_alpha_hunter_position(request: Request):
         return {"status": "error", "message": str(e)}
 
 
-@app.get("/api/alpha_hunter/global_stats")
+@app.get("/api/alpha_hunter/global_stats", response_class=FastJSONResponse)
 async def get_alpha_hunter_global_stats():
     """获取Alpha Hunter全局统计数据"""
     try:
@@ -2757,7 +3261,7 @@ async def get_alpha_hunter_global_stats():
                 account_info = await agent_client.get_account_info()
                 
                 # 计算用户授权资金：所有币种的保证金总和
-                user_margin = sum(float(v) for v in user_config.margin_per_coin.values())
+                user_margin = user_config.total_margin
                 total_volume += user_margin
                 
                 # 计算用户总收益：所有持仓的未实现盈亏
@@ -2798,20 +3302,28 @@ if __name__ == "__main__":
     logger.info(f"🎯 共识规则: 每组至少{settings.consensus_min_votes}个AI同意")
     logger.info(f"🌐 前端页面: http://localhost:{settings.api_port}/")
     
-    # 1. 加载用户提交的币种
-    load_submitted_coins()
-    
-    # 2. 预加载币种配置
-    import asyncio
-    asyncio.run(preload_coin_configs())
+    # 用户提交币种加载、币种配置预加载和 Alpha Hunter 初始化
+    # 均在 @app.on_event("startup") 中完成（需要事件循环已启动）
     
-    # 3. Alpha Hunter 会在 @app.on_event("startup") 中自动初始化
-    # 不需要在这里初始化，因为此时事件循环还未启动
+    # 优先使用 uvloop 事件循环和 httptools HTTP 解析器（未安装时回退到默认实现）
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    logger.info(f"⚡ 事件循环: {loop_impl}, HTTP解析器: {http_impl}")
     
     uvicorn.run(
         app,
         host=settings.api_host,
         port=settings.api_port,
+        loop=loop_impl,
+        http=http_impl,
         log_level="info"
     )
 
@@ -3,21 +3,100 @@ Alpha Hunter - 用户授权的自动交易代理
 允许用户授权 AI Agent 在 Hyperliquid 上进行自动交易
 """
 import asyncio
+import hashlib
+import html
 import logging
 import json
-from typing import Dict, List, Optional, Any
+import re
+import time
+import weakref
+from collections import Counter, defaultdict
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 
+from bs4 import BeautifulSoup
+
 from trading.hyperliquid.client import HyperliquidClient
 from config.settings import settings
 from news_trading.news_analyzer import NewsAnalyzer
+from utils.rate_limiter import AsyncRateLimiter
+from utils.singleflight import SingleFlight
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# 发送给 AI 的新闻正文最大长度
+_MAX_NEWS_LENGTH = 2048
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Hyperliquid 请求被限流（429）时的重试等待时间（秒）
+_HL_RETRY_DELAYS = (2, 5, 15)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """判断异常是否为 Hyperliquid 限流错误（只看 HTTP 状态码，不匹配错误文本）"""
+    # SDK 的 ClientError 带 status_code；aiohttp 异常带 status；requests 的 HTTPError 带 response
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429
+
+
+# 解析前原始正文的最大长度（超长正文只取开头，规整后本来也只保留 _MAX_NEWS_LENGTH）
+_MAX_RAW_NEWS_LENGTH = 64 * 1024
+# 超过该长度的 HTML 正文放到线程中解析，避免阻塞事件循环
+_THREAD_PARSE_THRESHOLD = 8 * 1024
+# 规整结果缓存，key: 原始正文的 SHA-1 摘要（不持有原文，同一新闻重复推送时直接复用结果）
+_normalized_news_cache = TTLCache(maxsize=1024, ttl=600)
+
+
+def _strip_news(content: str) -> str:
+    """去除 HTML 标签、合并空白并截断"""
+    if "<" in content:
+        content = BeautifulSoup(content, "html.parser").get_text(" ")
+    return _WHITESPACE_RE.sub(" ", html.unescape(content)).strip()[:_MAX_NEWS_LENGTH]
+
+
+async def _normalize_news(content: str) -> str:
+    """
+    规整新闻正文：去除 HTML 标签、合并空白并截断（按内容摘要缓存）
+    
+    Args:
+        content: 原始新闻内容
+    
+    Returns:
+        规整后的新闻正文
+    """
+    content = content[:_MAX_RAW_NEWS_LENGTH]
+    key = hashlib.sha1(content.encode()).digest()
+    normalized = _normalized_news_cache.get(key)
+    if normalized is not None:
+        return normalized
+    
+    if len(content) > _THREAD_PARSE_THRESHOLD and "<" in content:
+        normalized = await asyncio.to_thread(_strip_news, content)
+    else:
+        normalized = _strip_news(content)
+    _normalized_news_cache.set(key, normalized)
+    return normalized
+
 
 class AlphaHunterConfig:
     """Alpha Hunter 配置"""
     
+    __slots__ = (
+        "user_address",
+        "short_addr",
+        "agent_private_key",
+        "monitored_coins",
+        "monitored_coin_set",
+        "margin_per_coin",
+        "total_margin",
+        "leverage_range",
+        "created_at",
+        "is_active",
+    )
+    
     def __init__(
         self,
         user_address: str,
@@ -27,12 +106,23 @@ class AlphaHunterConfig:
         leverage_range: tuple = (10, 50),  # 杠杆范围
     ):
         self.user_address = user_address
+        self.short_addr = user_address[:10]  # 日志展示用的地址前缀
         self.agent_private_key = agent_private_key
-        self.monitored_coins = monitored_coins
-        self.margin_per_coin = margin_per_coin
+        self.monitored_coins = monitored_coins  # 保持添加顺序，用于展示
+        self.monitored_coin_set: Set[str] = set(monitored_coins)  # 用于成员判断
+        self.margin_per_coin = {coin: float(margin) for coin, margin in margin_per_coin.items()}  # 入口处统一转为数字
+        self.total_margin = sum(self.margin_per_coin.values())  # 保证金总额（随添加币种增量更新）
         self.leverage_range = leverage_range
         self.created_at = datetime.now()
         self.is_active = False
+    
+    def add_coin(self, coin: str, margin: float):
+        """添加监控币种"""
+        self.monitored_coins.append(coin)
+        self.monitored_coin_set.add(coin)
+        margin = float(margin)
+        self.margin_per_coin[coin] = margin
+        self.total_margin += margin
 
 
 class AlphaHunter:
@@ -41,30 +131,66 @@ class AlphaHunter:
     def __init__(self):
         self.configs: Dict[str, AlphaHunterConfig] = {}  # user_address -> config
         self.agent_clients: Dict[str, HyperliquidClient] = {}  # user_address -> client
+        self._coin_subscribers: Dict[str, Set[str]] = defaultdict(set)  # coin -> 监控该币种的用户地址
+        self._active_users: Set[str] = set()  # 已激活监控的用户地址
+        self._active_coin_refcount: Counter = Counter()  # coin -> 监控该币种的活跃用户数
         self.news_analyzer: Optional[NewsAnalyzer] = None
         self.is_running = False
+        self._trade_sem = asyncio.Semaphore(settings.alpha_hunter_concurrency or 16)  # 新闻触发时的并发交易上限
+        self._analysis_cache = TTLCache(maxsize=256, ttl=60)  # 新闻 AI 分析结果（同一新闻1分钟内重复推送时复用）
+        self._analysis_flight = SingleFlight()
+        self._balance_cache = TTLCache(maxsize=1024, ttl=1.0)  # user_address -> 可提取余额（短期复用，避免连续操作重复查询）
+        self._balance_flight = SingleFlight()
+        self._hl_limiter = AsyncRateLimiter(rate=20, period=1.0)  # 所有用户共用的 Hyperliquid 请求速率上限
+        # (user_address, coin) -> 下单锁；弱引用字典，没有交易在执行时条目自动回收，不随用户/币种累积
+        self._user_coin_locks: "weakref.WeakValueDictionary[Tuple[str, str], asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._recent_fills = TTLCache(maxsize=4096, ttl=30)  # (user_address, coin) -> 最近成交（30秒冷却）
         
     async def initialize(self):
-        """初始化 Alpha Hunter"""
-        try:
-            # 初始化 Grok AI（用于新闻分析）
-            from ai_models.grok_trader import GrokTrader
-            grok_ai = GrokTrader(
-                api_key=settings.grok_api_key,
-                model=settings.grok_model
-            )
-            
-            # 初始化新闻分析器
-            self.news_analyzer = NewsAnalyzer(
-                ai_trader=grok_ai,
-                ai_name="grok",
-                min_confidence=60.0
-            )
-            logger.info("✅ Alpha Hunter 初始化成功")
-            
-        except Exception as e:
-            logger.error(f"❌ Alpha Hunter 初始化失败: {e}")
-            raise
+        """初始化 Alpha Hunter（新闻分析器在首次收到新闻触发时才创建）"""
+        logger.info("✅ Alpha Hunter 初始化成功")
+    
+    def _get_news_analyzer(self) -> Optional[NewsAnalyzer]:
+        """
+        获取新闻分析器（首次调用时创建 Grok AI 与分析器，只提供状态查询的部署无需创建）
+        
+        Returns:
+            新闻分析器，创建失败时返回 None
+        """
+        if self.news_analyzer is None:
+            try:
+                # 初始化 Grok AI（用于新闻分析）
+                from ai_models.grok_trader import GrokTrader
+                grok_ai = GrokTrader(
+                    api_key=settings.grok_api_key,
+                    model=settings.grok_model
+                )
+                
+                # 初始化新闻分析器
+                self.news_analyzer = NewsAnalyzer(
+                    ai_trader=grok_ai,
+                    ai_name="grok",
+                    min_confidence=60.0
+                )
+                logger.info("✅ Alpha Hunter 新闻分析器已创建")
+                
+            except Exception as e:
+                logger.error(f"❌ Alpha Hunter 新闻分析器创建失败: {e}")
+        return self.news_analyzer
+    
+    async def shutdown(self):
+        """关闭所有用户 Agent 客户端及新闻分析 AI 的 HTTP 会话"""
+        if self.news_analyzer is not None:
+            try:
+                await self.news_analyzer.ai_trader.close_session()
+            except Exception as e:
+                logger.warning(f"⚠️  关闭新闻分析 AI 会话失败: {e}")
+        
+        for agent_client in self.agent_clients.values():
+            try:
+                await agent_client.close_session()
+            except Exception as e:
+                logger.warning(f"⚠️  关闭 Agent 客户端会话失败: {e}")
     
     async def register_user(
         self,
@@ -81,10 +207,41 @@ class AlphaHunter:
             agent_private_key: Agent 私钥（由前端生成并授权）
             monitored_coins: 监控的币种列表
             margin_per_coin: 每个币种的保证金配置
-            
+        
         Returns:
             注册结果
         """
+        prepared = await self.prepare_user(
+            user_address=user_address,
+            agent_private_key=agent_private_key,
+            monitored_coins=monitored_coins,
+            margin_per_coin=margin_per_coin
+        )
+        if prepared.get("status") != "ok":
+            return prepared
+        return self.commit_prepared(prepared)
+    
+    async def prepare_user(
+        self,
+        user_address: str,
+        agent_private_key: str,
+        monitored_coins: List[str],
+        margin_per_coin: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """
+        准备用户注册（创建 Agent 客户端并校验余额），不写入用户配置
+        
+        可与 Hyperliquid approve_agent 请求并发执行，授权成功后再调用 commit_prepared 生效
+        
+        Args:
+            user_address: 用户主账户地址
+            agent_private_key: Agent 私钥（由前端生成并授权）
+            monitored_coins: 监控的币种列表
+            margin_per_coin: 每个币种的保证金配置
+        
+        Returns:
+            准备结果（status 为 ok 时包含 config / agent_client 等待提交的数据）
+        """
         try:
             logger.info(f"📝 注册 Alpha Hunter 用户: {user_address[:10]}...")
             
@@ -104,38 +261,65 @@ class AlphaHunter:
             )
             
             # 验证账户余额
-            account_info = await agent_client.get_account_info()
-            balance = float(account_info.get("withdrawable", 0))
+            balance = await self._get_cached_balance(user_address, agent_client)
             logger.info(f"💰 用户账户余额: {balance} USDC")
             
-            # 验证保证金配置（确保所有值都是数字类型）
-            total_margin = sum(float(v) for v in margin_per_coin.values())
+            # 验证保证金配置（创建配置时已统一转为数字）
+            total_margin = config.total_margin
             if total_margin > balance:
                 return {
                     "status": "error",
                     "message": f"保证金总额 ({total_margin} USDC) 超过账户余额 ({balance} USDC)"
                 }
             
-            # 保存配置
-            self.configs[user_address] = config
-            self.agent_clients[user_address] = agent_client
-            
-            logger.info(f"✅ 用户注册成功: {user_address[:10]}...")
-            logger.info(f"   监控币种: {monitored_coins}")
-            logger.info(f"   保证金配置: {margin_per_coin}")
-            
             return {
                 "status": "ok",
-                "user_address": user_address,
-                "monitored_coins": monitored_coins,
+                "config": config,
+                "agent_client": agent_client,
                 "total_margin": total_margin,
                 "balance": balance
             }
-            
+        
         except Exception as e:
             logger.error(f"❌ 注册用户失败: {e}")
             return {"status": "error", "message": str(e)}
     
+    def commit_prepared(self, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        提交 prepare_user 的结果，使用户配置生效
+        
+        Args:
+            prepared: prepare_user 返回的成功结果
+        
+        Returns:
+            注册结果
+        """
+        config = prepared["config"]
+        user_address = config.user_address
+        
+        # 重新注册时先移除旧配置的订阅索引（新配置需要重新激活）
+        old_config = self.configs.get(user_address)
+        if old_config:
+            self._deactivate(user_address, old_config)
+            self._unsubscribe(user_address, old_config.monitored_coin_set)
+        
+        # 保存配置
+        self.configs[user_address] = config
+        self._subscribe(user_address, config.monitored_coin_set)
+        self.agent_clients[user_address] = prepared["agent_client"]
+        
+        logger.info(f"✅ 用户注册成功: {config.short_addr}...")
+        logger.info(f"   监控币种: {config.monitored_coins}")
+        logger.info(f"   保证金配置: {config.margin_per_coin}")
+        
+        return {
+            "status": "ok",
+            "user_address": user_address,
+            "monitored_coins": config.monitored_coins,
+            "total_margin": prepared["total_margin"],
+            "balance": prepared["balance"]
+        }
+    
     async def add_monitored_coin(
         self,
         user_address: str,
@@ -160,7 +344,7 @@ class AlphaHunter:
                 return {"status": "error", "message": "用户未注册，请先完成 Approve & Start"}
             
             # 检查币种是否已存在
-            if coin in config.monitored_coins:
+            if coin in config.monitored_coin_set:
                 return {"status": "error", "message": f"{coin} 已在监控列表中"}
             
             # 获取账户余额
@@ -168,12 +352,11 @@ class AlphaHunter:
             if not agent_client:
                 return {"status": "error", "message": "Agent 客户端未找到"}
             
-            account_info = await agent_client.get_account_info()
-            balance = float(account_info.get("withdrawable", 0))
+            balance = await self._get_cached_balance(user_address, agent_client)
             
             # 计算新的总保证金
-            current_total_margin = sum(float(v) for v in config.margin_per_coin.values())
-            new_total_margin = current_total_margin + margin
+            margin = float(margin)
+            new_total_margin = config.total_margin + margin
             
             if new_total_margin > balance:
                 return {
@@ -182,10 +365,12 @@ class AlphaHunter:
                 }
             
             # 添加币种
-            config.monitored_coins.append(coin)
-            config.margin_per_coin[coin] = margin
+            config.add_coin(coin, margin)
+            self._subscribe(user_address, (coin,))
+            if user_address in self._active_users:
+                self._active_coin_refcount[coin] += 1
             
-            logger.info(f"✅ 用户 {user_address[:10]}... 添加监控币种: {coin} (保证金: {margin} USDC)")
+            logger.info(f"✅ 用户 {config.short_addr}... 添加监控币种: {coin} (保证金: {margin} USDC)")
             logger.info(f"   当前监控币种: {config.monitored_coins}")
             logger.info(f"   总保证金: {new_total_margin} USDC / {balance} USDC")
             
@@ -201,6 +386,67 @@ class AlphaHunter:
             logger.error(f"❌ 添加监控币种失败: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def _get_cached_balance(
+        self,
+        user_address: str,
+        agent_client: HyperliquidClient,
+        ttl: float = 1.0
+    ) -> float:
+        """
+        获取用户可提取余额（ttl 秒内复用，同一用户的并发查询只请求一次）
+        
+        Args:
+            user_address: 用户地址
+            agent_client: 用户的 Agent 客户端
+            ttl: 缓存有效期（秒）
+        
+        Returns:
+            可提取余额（USDC）
+        """
+        balance = self._balance_cache.get(user_address)
+        if balance is not None:
+            return balance
+        
+        async def fetch_balance():
+            account_info = await self._hl_call(agent_client.get_account_info)
+            balance = float(account_info.get("withdrawable", 0))
+            self._balance_cache.set(user_address, balance, ttl=ttl)
+            return balance
+        
+        return await self._balance_flight.do(user_address, fetch_balance)
+    
+    def _subscribe(self, user_address: str, coins):
+        """将用户加入币种订阅索引"""
+        for coin in coins:
+            self._coin_subscribers[coin].add(user_address)
+    
+    def _unsubscribe(self, user_address: str, coins):
+        """将用户移出币种订阅索引"""
+        for coin in coins:
+            subscribers = self._coin_subscribers.get(coin)
+            if subscribers is None:
+                continue
+            subscribers.discard(user_address)
+            if not subscribers:
+                del self._coin_subscribers[coin]
+    
+    def _activate(self, user_address: str, config: AlphaHunterConfig):
+        """标记用户为活跃，并计入其监控币种的活跃用户数（重复调用无副作用）"""
+        if user_address in self._active_users:
+            return
+        self._active_users.add(user_address)
+        self._active_coin_refcount.update(config.monitored_coin_set)
+    
+    def _deactivate(self, user_address: str, config: AlphaHunterConfig):
+        """取消用户的活跃状态，并扣减其监控币种的活跃用户数（重复调用无副作用）"""
+        if user_address not in self._active_users:
+            return
+        self._active_users.discard(user_address)
+        for coin in config.monitored_coin_set:
+            self._active_coin_refcount[coin] -= 1
+            if self._active_coin_refcount[coin] <= 0:
+                del self._active_coin_refcount[coin]
+    
     async def start_monitoring(self, user_address: str) -> Dict[str, Any]:
         """开始监控（激活 Alpha Hunter）"""
         try:
@@ -209,9 +455,10 @@ class AlphaHunter:
                 return {"status": "error", "message": "用户未注册"}
             
             config.is_active = True
+            self._activate(user_address, config)
             self.is_running = True
             
-            logger.info(f"🚀 Alpha Hunter 开始监控: {user_address[:10]}...")
+            logger.info(f"🚀 Alpha Hunter 开始监控: {config.short_addr}...")
             
             return {
                 "status": "ok",
@@ -231,13 +478,13 @@ class AlphaHunter:
                 return {"status": "error", "message": "用户未注册"}
             
             config.is_active = False
+            self._deactivate(user_address, config)
             
             # 检查是否还有其他活跃用户
-            active_users = [c for c in self.configs.values() if c.is_active]
-            if not active_users:
+            if not self._active_users:
                 self.is_running = False
             
-            logger.info(f"⏸️  Alpha Hunter 停止监控: {user_address[:10]}...")
+            logger.info(f"⏸️  Alpha Hunter 停止监控: {config.short_addr}...")
             
             return {"status": "ok", "message": "Alpha Hunter 已停止"}
             
@@ -260,57 +507,169 @@ class AlphaHunter:
             news_source: 新闻来源
             
         Returns:
-            所有用户的交易结果列表
+            所有用户的交易结果列表（按完成先后排列）
+        """
+        return [
+            result
+            async for result in self.stream_news_trigger(coin_symbol, news_content, news_source)
+        ]
+    
+    async def stream_news_trigger(
+        self,
+        coin_symbol: str,
+        news_content: str,
+        news_source: str
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        results = []
+        处理新闻触发的交易，每个用户的交易完成后立即产出结果（不必等待最慢的用户）
+        
+        Args:
+            coin_symbol: 币种符号
+            news_content: 新闻内容
+            news_source: 新闻来源
+            
+        Yields:
+            单个用户的交易结果
+        """
+        # 没有活跃用户监控该币种时直接返回（大多数新闻属于这种情况）
+        if not self.is_running or coin_symbol not in self._active_coin_refcount:
+            return
         
         try:
-            # 遍历所有活跃用户
-            for user_address, config in self.configs.items():
-                if not config.is_active:
-                    continue
-                
-                # 检查用户是否监控该币种
-                if coin_symbol not in config.monitored_coins:
-                    continue
+            # 收集所有需要交易的活跃用户（通过币种订阅索引直接定位，无需遍历全部用户）
+            users = []
+            for user_address in self._coin_subscribers[coin_symbol] & self._active_users:
+                config = self.configs[user_address]
                 
                 # 获取该币种的保证金配置
                 margin = config.margin_per_coin.get(coin_symbol, 0)
                 if margin <= 0:
-                    logger.warning(f"⚠️  {user_address[:10]}... 未配置 {coin_symbol} 的保证金，跳过")
+                    logger.warning(f"⚠️  {config.short_addr}... 未配置 {coin_symbol} 的保证金，跳过")
                     continue
                 
                 logger.info(f"📢 Alpha Hunter 处理新闻触发:")
-                logger.info(f"   用户: {user_address[:10]}...")
+                logger.info(f"   用户: {config.short_addr}...")
                 logger.info(f"   币种: {coin_symbol}")
                 logger.info(f"   保证金: {margin} USDC")
                 
-                # 调用 AI 分析
-                result = await self._execute_trade_for_user(
+                users.append((user_address, margin))
+            
+            if not users:
+                return
+            
+            # AI 决策只取决于币种和新闻内容，每条新闻只分析一次，所有用户共用
+            # （正文先规整再分析，减少提示词长度，规整后的内容同时作为缓存键）
+            analysis_result, ai_duration = await self._analyze_news(
+                coin_symbol, await _normalize_news(news_content), news_source
+            )
+            
+            # 所有用户并发执行（受信号量限制），按完成先后产出结果
+            # 调用方提前停止迭代时已下发的交易继续执行，不会被取消
+            tasks = [
+                asyncio.ensure_future(self._sem_wrap(self._dispatch_trade(
                     user_address=user_address,
                     coin_symbol=coin_symbol,
-                    news_content=news_content,
-                    news_source=news_source,
-                    margin=margin
-                )
-                
-                results.append(result)
-            
-            return results
+                    margin=margin,
+                    analysis_result=analysis_result,
+                    ai_duration=ai_duration
+                )))
+                for user_address, margin in users
+            ]
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
             
         except Exception as e:
             logger.error(f"❌ handle_news_trigger 失败: {e}")
-            return []
+    
+    async def _dispatch_trade(self, user_address: str, **kwargs) -> Dict[str, Any]:
+        """为单个用户执行交易，异常转换为错误结果"""
+        try:
+            return await self._execute_trade_for_user(user_address=user_address, **kwargs)
+        except Exception as e:
+            logger.error(f"❌ {self.configs[user_address].short_addr}... 交易执行异常: {e}")
+            return {
+                "status": "error",
+                "user_address": user_address,
+                "message": str(e)
+            }
+    
+    async def _analyze_news(
+        self,
+        coin_symbol: str,
+        news_content: str,
+        news_source: str
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        调用 Grok AI 分析新闻（同一新闻短时间内重复推送时复用结果，并发推送只分析一次）
+        
+        Returns:
+            (分析结果, 分析耗时秒数)，复用缓存时耗时为 0
+        """
+        news_analyzer = self._get_news_analyzer()
+        if not news_analyzer:
+            return {"error": "NewsAnalyzer 未初始化"}, 0.0
+        
+        key = hashlib.sha1(f"{coin_symbol}\n{news_content}".encode("utf-8")).hexdigest()
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️ 复用 {coin_symbol} 新闻的 AI 分析结果")
+            return cached, 0.0
+        
+        async def run_analysis():
+            ai_start_time = time.monotonic()
+            analysis_result = await news_analyzer.analyze_with_grok(
+                coin_symbol=coin_symbol,
+                news_content=news_content,
+                news_source=news_source
+            )
+            ai_duration = time.monotonic() - ai_start_time
+            
+            # 只缓存成功的分析结果，失败时下一次推送重新分析
+            if analysis_result and "error" not in analysis_result:
+                self._analysis_cache.set(key, analysis_result)
+            return analysis_result, ai_duration
+        
+        # 多个新闻源几乎同时推送同一条新闻时，后到的请求等待进行中的分析结果
+        if self._analysis_flight.in_flight(key):
+            logger.info(f"⏳ {coin_symbol} 新闻正在分析中，等待共用结果")
+        return await self._analysis_flight.do(key, run_analysis)
+    
+    async def _hl_call(self, coro_factory, retries: int = len(_HL_RETRY_DELAYS)):
+        """
+        按共用速率上限调用 Hyperliquid 接口，被限流时按退避时间重试
+        
+        Args:
+            coro_factory: 无参协程工厂（每次重试重新创建协程）
+            retries: 限流后的最大重试次数
+        
+        Returns:
+            接口调用结果
+        """
+        for attempt in range(retries + 1):
+            async with self._hl_limiter:
+                try:
+                    return await coro_factory()
+                except Exception as e:
+                    if attempt >= retries or not _is_rate_limited(e):
+                        raise
+                    delay = _HL_RETRY_DELAYS[min(attempt, len(_HL_RETRY_DELAYS) - 1)]
+            logger.warning(f"⚠️  Hyperliquid 请求被限流，{delay}s 后重试 ({attempt + 1}/{retries})")
+            await asyncio.sleep(delay)
+    
+    async def _sem_wrap(self, coro):
+        """在并发上限内执行协程"""
+        async with self._trade_sem:
+            return await coro
     
     async def _execute_trade_for_user(
         self,
         user_address: str,
         coin_symbol: str,
-        news_content: str,
-        news_source: str,
-        margin: float
+        margin: float,
+        analysis_result: Optional[Dict[str, Any]],
+        ai_duration: float
     ) -> Dict[str, Any]:
-        """为单个用户执行交易"""
+        """为单个用户执行交易（使用本条新闻共用的 AI 分析结果）"""
         try:
             # 获取 Agent 客户端
             agent_client = self.agent_clients.get(user_address)
@@ -321,29 +680,11 @@ class AlphaHunter:
                     "message": "Agent 客户端未找到"
                 }
             
-            # 调用 Grok AI 分析
-            if not self.news_analyzer:
-                return {
-                    "status": "error",
-                    "user_address": user_address,
-                    "message": "NewsAnalyzer 未初始化"
-                }
-            
-            ai_start_time = datetime.now()
-            
-            analysis_result = await self.news_analyzer.analyze_with_grok(
-                coin_symbol=coin_symbol,
-                news_content=news_content,
-                news_source=news_source
-            )
-            
-            ai_duration = (datetime.now() - ai_start_time).total_seconds()
-            
             if not analysis_result or "error" in analysis_result:
                 return {
                     "status": "error",
                     "user_address": user_address,
-                    "message": f"AI 分析失败: {analysis_result.get('error', 'Unknown')}"
+                    "message": f"AI 分析失败: {(analysis_result or {}).get('error', 'Unknown')}"
                 }
             
             decision = analysis_result.get("decision", "HOLD")
@@ -367,14 +708,35 @@ class AlphaHunter:
                     "ai_duration": ai_duration
                 }
             
+            # 同一用户同一币种同时只允许一笔交易，成交后冷却30秒（多家交易所联合上币时新闻几乎同时到达）
+            pair = (user_address, coin_symbol)
+            lock = self._user_coin_locks.setdefault(pair, asyncio.Lock())
+            if lock.locked() or pair in self._recent_fills:
+                reason = "already_in_flight" if lock.locked() else "cooldown"
+                logger.info(f"⏭️  {self.configs[user_address].short_addr}... {coin_symbol} 已有交易在执行或刚成交，跳过 ({reason})")
+                return {
+                    "status": "skipped",
+                    "reason": reason,
+                    "user_address": user_address,
+                    "coin": coin_symbol,
+                    "decision": decision,
+                    "confidence": confidence,
+                    "ai_duration": ai_duration
+                }
+            
             # 执行交易
-            trade_result = await self._place_order(
-                agent_client=agent_client,
-                coin_symbol=coin_symbol,
-                decision=decision,
-                leverage=leverage,
-                margin=margin
-            )
+            async with lock:
+                trade_result = await self._place_order(
+                    agent_client=agent_client,
+                    coin_symbol=coin_symbol,
+                    decision=decision,
+                    leverage=leverage,
+                    margin=margin
+                )
+                if trade_result.get("status") == "ok":
+                    # 下单后余额已变化，丢弃缓存
+                    self._balance_cache.pop(user_address)
+                    self._recent_fills.set(pair, True)
             
             return {
                 "status": "ok",
@@ -406,8 +768,12 @@ class AlphaHunter:
     ) -> Dict[str, Any]:
         """使用 Agent 客户端下单"""
         try:
-            # 获取市场价格
-            market_data = await agent_client.get_market_data(coin_symbol)
+            # 获取市场价格与设置杠杆互不依赖，并发执行
+            # （逐仓模式，与上次设置相同时客户端直接跳过；SDK 调用为同步签名请求，放到线程中执行）
+            market_data, _ = await asyncio.gather(
+                self._hl_call(lambda: agent_client.get_market_data(coin_symbol)),
+                self._hl_call(lambda: asyncio.to_thread(agent_client.update_leverage, coin_symbol, leverage, False))
+            )
             if not market_data:
                 return {"status": "error", "message": "无法获取市场数据"}
             
@@ -420,11 +786,8 @@ class AlphaHunter:
             # 确定方向
             is_buy = decision == "BUY"
             
-            # 设置杠杆（逐仓模式）
-            await agent_client.update_leverage(coin_symbol, leverage, is_cross=False)
-            
             # 市价单开仓
-            order_result = await agent_client.place_order(
+            order_result = await self._hl_call(lambda: agent_client.place_order(
                 symbol=coin_symbol,
                 side="buy" if is_buy else "sell",
                 price=current_price,
@@ -432,7 +795,7 @@ class AlphaHunter:
                 leverage=leverage,
                 order_type="market",
                 reduce_only=False
-            )
+            ))
             
             logger.info(f"✅ Alpha Hunter 订单执行成功:")
             logger.info(f"   币种: {coin_symbol}")
@@ -465,16 +828,12 @@ class AlphaHunter:
             "monitored_coins": config.monitored_coins,
             "margin_per_coin": config.margin_per_coin,
             "is_active": config.is_active,
-            "created_at": config.created_at.isoformat()
+            "created_at": config.created_at  # 由接口的 JSON 序列化器输出 ISO 格式（orjson 原生支持 datetime）
         }
     
     def get_all_active_coins(self) -> List[str]:
         """获取所有活跃用户监控的币种（去重）"""
-        all_coins = set()
-        for config in self.configs.values():
-            if config.is_active:
-                all_coins.update(config.monitored_coins)
-        return list(all_coins)
+        return list(self._active_coin_refcount)
 
 
 # 全局实例
@@ -2,9 +2,13 @@
 币种配置档案
 为每个监控的币种提供详细信息
 """
-from typing import Dict, List
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from enum import Enum
 
+from news_trading.config import SUPPORTED_COINS
+
 
 class TradingPlatform(Enum):
     """交易平台"""
@@ -44,13 +48,144 @@ class ProjectStage(Enum):
     CEX_LISTING = "CEX Spot Listing"    # 交易所现货
 
 
+@dataclass(frozen=True, slots=True)
+class Background:
+    """项目背景"""
+    total_funding: str
+    track: str
+    lead_investors: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class StageProgress:
+    """阶段进度"""
+    completed: Tuple[str, ...]
+    current: str
+    upcoming: str
+
+
+@dataclass(frozen=True, slots=True)
+class UpsidePotential:
+    """上涨潜力"""
+    market_position: str
+    narrative: str
+    catalysts: Tuple[str, ...]
+    risk_factors: Tuple[str, ...]
+    target_multiplier: str
+
+
+@dataclass(frozen=True, slots=True)
+class CoinProfile:
+    """
+    币种档案（只读）
+    
+    嵌套段落同为 dataclass，orjson / jsonable_encoder 均可直接序列化
+    """
+    name: str
+    full_name: str
+    description: str
+    twitter: str
+    background: Background
+    project_type: ProjectType
+    current_stage: ProjectStage
+    next_stage: ProjectStage
+    stage_progress: StageProgress
+    stage_links: Dict[str, List[Dict]]
+    upside_potential: UpsidePotential
+    trading_platforms: Tuple[TradingPlatform, ...]
+    news_sources: Tuple[NewsSource, ...]
+    why_monitor: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CoinProfile":
+        """由字典构建档案（用户提交的币种仍以字典形式拼装）"""
+        progress = data["stage_progress"]
+        upside = data["upside_potential"]
+        return cls(
+            name=data["name"],
+            full_name=data["full_name"],
+            description=data.get("description", ""),
+            twitter=data.get("twitter", ""),
+            background=Background(**data["background"]),
+            project_type=data["project_type"],
+            current_stage=data["current_stage"],
+            next_stage=data["next_stage"],
+            stage_progress=StageProgress(
+                completed=tuple(progress["completed"]),
+                current=progress["current"],
+                upcoming=progress["upcoming"]
+            ),
+            stage_links=data.get("stage_links", {}),
+            upside_potential=UpsidePotential(
+                market_position=upside["market_position"],
+                narrative=upside["narrative"],
+                catalysts=tuple(upside["catalysts"]),
+                risk_factors=tuple(upside["risk_factors"]),
+                target_multiplier=upside["target_multiplier"]
+            ),
+            trading_platforms=tuple(data["trading_platforms"]),
+            news_sources=tuple(data["news_sources"]),
+            why_monitor=data.get("why_monitor", "")
+        )
+    
+    # 兼容旧的字典式访问 profile["name"] / profile.get("twitter", "")
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
 # 币种配置档案（清空默认币种，从零开始）
-COIN_PROFILES: Dict[str, Dict] = {
+COIN_PROFILES: Dict[str, CoinProfile] = {
     # 用户提交的币种会自动添加到这里
 }
 
 
-def get_coin_profile(coin_symbol: str) -> Dict:
+# 新币种的默认档案（模块加载时构建一次，按币种只替换名称字段）
+_DEFAULT_PROFILE = CoinProfile(
+    name="",
+    full_name="",
+    description="Monitoring for listing announcements",
+    twitter="",
+    background=Background(
+        total_funding="Unknown",
+        track="To be determined"
+    ),
+    project_type=ProjectType.NORMAL,
+    current_stage=ProjectStage.ON_CHAIN,
+    next_stage=ProjectStage.CEX_ALPHA,
+    stage_progress=StageProgress(
+        completed=(),
+        current="Awaiting data",
+        upcoming="To be determined"
+    ),
+    stage_links={},
+    upside_potential=UpsidePotential(
+        market_position="To be analyzed",
+        narrative="Awaiting market data",
+        catalysts=("Exchange listings",),
+        risk_factors=("Insufficient data",),
+        target_multiplier="To be determined"
+    ),
+    trading_platforms=(
+        TradingPlatform.HYPERLIQUID,
+        TradingPlatform.ASTER
+    ),
+    news_sources=(
+        NewsSource.BINANCE_SPOT,
+        NewsSource.BINANCE_FUTURES,
+        NewsSource.UPBIT,
+        NewsSource.USER_SUBMIT
+    ),
+    why_monitor="New listing opportunity. Monitoring for price discovery and momentum."
+)
+
+
+def get_coin_profile(coin_symbol: str) -> CoinProfile:
     """
     获取币种档案
     
@@ -58,57 +193,25 @@ def get_coin_profile(coin_symbol: str) -> Dict:
         coin_symbol: 币种符号（如 "MON"）
     
     Returns:
-        币种档案字典，如果不存在则返回默认档案
+        币种档案，如果不存在则返回默认档案
     """
-    coin_upper = coin_symbol.upper()
-    
-    if coin_upper in COIN_PROFILES:
-        return COIN_PROFILES[coin_upper]
+    # 档案键均为大写，符号已是大写时直接命中，无需 upper()
+    profile = COIN_PROFILES.get(coin_symbol) or COIN_PROFILES.get(coin_symbol.upper())
+    if profile is not None:
+        return profile
     
-    # 默认档案（用于新币种）
-    return {
-        "name": coin_symbol,
-        "full_name": f"{coin_symbol} Token",
-        "description": "Monitoring for listing announcements",
-        "twitter": "",
-        "background": {
-            "total_funding": "Unknown",
-            "track": "To be determined",
-        },
-        "project_type": ProjectType.NORMAL,
-        "current_stage": ProjectStage.ON_CHAIN,
-        "next_stage": ProjectStage.CEX_ALPHA,
-        "stage_progress": {
-            "completed": [],
-            "current": "Awaiting data",
-            "upcoming": "To be determined"
-        },
-        "stage_links": {},
-        "upside_potential": {
-            "market_position": "To be analyzed",
-            "narrative": "Awaiting market data",
-            "catalysts": ["Exchange listings"],
-            "risk_factors": ["Insufficient data"],
-            "target_multiplier": "To be determined"
-        },
-        "trading_platforms": [
-            TradingPlatform.HYPERLIQUID,
-            TradingPlatform.ASTER
-        ],
-        "news_sources": [
-            NewsSource.BINANCE_SPOT,
-            NewsSource.BINANCE_FUTURES,
-            NewsSource.UPBIT,
-            NewsSource.USER_SUBMIT
-        ],
-        "why_monitor": "New listing opportunity. Monitoring for price discovery and momentum."
-    }
+    return _default_profile(coin_symbol)
+
+
+@lru_cache(maxsize=512)
+def _default_profile(coin_symbol: str) -> CoinProfile:
+    """默认档案（用于新币种）：只替换名称字段，嵌套段落与模板共用；按币种缓存"""
+    return replace(_DEFAULT_PROFILE, name=coin_symbol, full_name=f"{coin_symbol} Token")
 
 
 def get_all_monitored_coins() -> List[str]:
-    """获取所有配置的币种列表"""
-    from news_trading.config import SUPPORTED_COINS
-    return SUPPORTED_COINS
+    """获取所有配置的币种列表（排序后的副本，调用方无法改动内部集合）"""
+    return sorted(SUPPORTED_COINS)
 
 
 def get_platform_name(platform: TradingPlatform) -> str:
@@ -2,7 +2,8 @@
 消息驱动交易配置
 News-Based Trading Configuration
 """
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional, Pattern, Set
 from enum import Enum
 
 
@@ -28,20 +29,22 @@ class MessageSource(Enum):
 # 清空默认币种，用户添加币种后会自动填充
 COIN_MAPPING = {}
 
-# 支持交易的币种列表（用于过滤）
+# 币种名匹配正则（所有映射键的并集，长名优先），映射变化时置空，下次查询时重建
+_coin_pattern: Optional[Pattern] = None
+
+# 支持交易的币种集合（用于过滤，成员判断 O(1)）
 # 从环境变量读取，如果未配置则使用所有映射的币种
-def _get_supported_coins():
+def _get_supported_coins() -> Set[str]:
     """从环境变量或配置文件获取支持的币种"""
     from config.settings import settings
     
     # 如果环境变量中配置了币种，使用环境变量
     if hasattr(settings, 'allowed_trading_symbols') and settings.allowed_trading_symbols:
         # 环境变量格式: "MON,MEGA,PING"
-        env_coins = [coin.strip().upper() for coin in settings.allowed_trading_symbols.split(',')]
-        return env_coins
+        return {coin.strip().upper() for coin in settings.allowed_trading_symbols.split(',')}
     
     # 否则使用所有映射的币种
-    return list(set(COIN_MAPPING.values()))
+    return set(COIN_MAPPING.values())
 
 SUPPORTED_COINS = _get_supported_coins()
 
@@ -129,14 +132,22 @@ def get_coin_symbol(message_text: str) -> str:
     Returns:
         Hyperliquid交易对符号，如 "MON"，未找到返回None
     """
-    message_upper = message_text.upper()
-    
-    # 遍历映射表查找匹配
-    for key, value in COIN_MAPPING.items():
-        if key in message_upper:
-            return value
+    if not COIN_MAPPING:
+        return None
     
-    return None
+    # 一次正则扫描匹配所有币种名（不再逐个映射键做子串查找）
+    match = _get_coin_pattern().search(message_text.upper())
+    return COIN_MAPPING[match.group(0)] if match else None
+
+
+def _get_coin_pattern() -> Pattern:
+    """获取币种名匹配正则（按需构建）"""
+    global _coin_pattern
+    if _coin_pattern is None:
+        # 长名优先，同一位置 MEGAETH 优先于 MEGA
+        names = sorted(COIN_MAPPING, key=len, reverse=True)
+        _coin_pattern = re.compile("|".join(map(re.escape, names)))
+    return _coin_pattern
 
 
 def is_supported_coin(symbol: str) -> bool:
@@ -146,13 +157,19 @@ def is_supported_coin(symbol: str) -> bool:
 
 def add_coin_mapping(message_name: str, hl_symbol: str):
     """动态添加币种映射"""
+    global _coin_pattern
     COIN_MAPPING[message_name.upper()] = hl_symbol.upper()
-    if hl_symbol.upper() not in SUPPORTED_COINS:
-        SUPPORTED_COINS.append(hl_symbol.upper())
+    _coin_pattern = None
+    SUPPORTED_COINS.add(hl_symbol.upper())
 
 
 def remove_coin_mapping(message_name: str):
     """移除币种映射"""
-    if message_name.upper() in COIN_MAPPING:
-        del COIN_MAPPING[message_name.upper()]
+    global _coin_pattern
+    hl_symbol = COIN_MAPPING.pop(message_name.upper(), None)
+    if hl_symbol is not None:
+        _coin_pattern = None
+        # 没有其他消息名映射到该交易对时，一并移出支持列表
+        if hl_symbol not in COIN_MAPPING.values():
+            SUPPORTED_COINS.discard(hl_symbol)
 
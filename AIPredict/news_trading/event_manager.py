@@ -11,22 +11,28 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 订阅队列容量：消费跟不上、积压超过该值的订阅者会被断开
+SUBSCRIBER_QUEUE_SIZE = 256
+
 
 class EventManager:
     """事件管理器 - SSE推送"""
     
-    def __init__(self, max_history: int = 50):
+    def __init__(self, max_history: int = 50, max_replay: int = 10):
         """
         初始化事件管理器
         
         Args:
             max_history: 保留的历史事件数量
+            max_replay: 新订阅者连接时回放的最近事件数量
         """
         self.subscribers = []  # 订阅者列表
         self.event_history = deque(maxlen=max_history)  # 事件历史
+        self._recent_frames = deque(maxlen=max_replay)  # 最近事件的SSE帧（已序列化）
+        self._recent_sse = ""  # 最近事件SSE帧拼接结果，供新订阅者一次性回放
         
     def add_subscriber(self, queue: asyncio.Queue):
-        """添加订阅者"""
+        """添加订阅者（队列需有容量上限，如 asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)）"""
         self.subscribers.append(queue)
         logger.info(f"📡 新订阅者加入，当前订阅数: {len(self.subscribers)}")
         
@@ -36,9 +42,13 @@ class EventManager:
             self.subscribers.remove(queue)
             logger.info(f"📡 订阅者离开，当前订阅数: {len(self.subscribers)}")
     
-    async def push_event(self, event_type: str, data: Dict[str, Any]):
+    def is_subscribed(self, queue: asyncio.Queue) -> bool:
+        """订阅者是否仍在推送列表中（积压过多时会被移除）"""
+        return queue in self.subscribers
+    
+    def push_event(self, event_type: str, data: Dict[str, Any]):
         """
-        推送事件到所有订阅者
+        推送事件到所有订阅者（非阻塞，慢消费者不会拖住其他订阅者）
         
         Args:
             event_type: 事件类型 (monitor_started, ai_analysis, trade_opened, etc.)
@@ -52,14 +62,16 @@ class EventManager:
         
         # 添加到历史
         self.event_history.append(event)
+        self._recent_frames.append(f"data: {json.dumps(event)}\n\n")
+        self._recent_sse = "".join(self._recent_frames)
         
-        # 推送给所有订阅者
+        # 推送给所有订阅者，队列已满视为死连接
         dead_subscribers = []
         for queue in self.subscribers:
             try:
-                await queue.put(event)
-            except Exception as e:
-                logger.warning(f"⚠️  推送事件失败: {e}")
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(f"⚠️  订阅者积压 {queue.qsize()} 条事件，断开连接")
                 dead_subscribers.append(queue)
         
         # 清理死连接
@@ -71,6 +83,10 @@ class EventManager:
     def get_history(self) -> List[Dict]:
         """获取历史事件"""
         return list(self.event_history)
+    
+    def get_recent_sse(self) -> str:
+        """获取最近事件的SSE帧（已拼接，可直接写入响应）"""
+        return self._recent_sse
 
 
 # 全局事件管理器实例
@@ -8,6 +8,8 @@ Logo Configuration - URLs for tokens, platforms, AI models, and news sources
 - 代币: /web/images/coins/{coin_symbol}.png
 - 消息来源: /web/images/news_sources/{source_name}.png
 """
+from functools import lru_cache
+
 
 # 代币Logo（本地路径）
 # ✅ 已添加的logo文件
@@ -51,36 +53,48 @@ NEWS_SOURCE_LOGOS = {
 }
 
 
+def _svg_placeholder(text: str, bg: str, font_size: int = 24) -> str:
+    """生成SVG占位符（data URI，替代被墙的placeholder.com）"""
+    return f"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='64' height='64'%3E%3Crect width='64' height='64' fill='%23{bg}'/%3E%3Ctext x='50%25' y='50%25' dominant-baseline='middle' text-anchor='middle' font-size='{font_size}' fill='white'%3E{text}%3C/text%3E%3C/svg%3E"
+
+
+# 文字固定的占位符在模块加载时生成一次
+_PLATFORM_SVG = _svg_placeholder("P", "48bb78")
+_AI_SVG = _svg_placeholder("AI", "764ba2", 20)
+_NEWS_SVG = _svg_placeholder("N", "667eea")
+
+
+@lru_cache(maxsize=1024)
 def get_coin_logo(symbol: str) -> str:
-    """获取代币Logo URL"""
+    """获取代币Logo URL（结果按符号缓存，修改COIN_LOGOS请走set_coin_logo）"""
     symbol_upper = symbol.upper()
     if symbol_upper in COIN_LOGOS:
         return COIN_LOGOS[symbol_upper]
-    # 返回SVG占位符而不是placeholder.com（被墙）
-    text = symbol_upper[:2]
-    return f"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='64' height='64'%3E%3Crect width='64' height='64' fill='%23667eea'/%3E%3Ctext x='50%25' y='50%25' dominant-baseline='middle' text-anchor='middle' font-size='24' fill='white'%3E{text}%3C/text%3E%3C/svg%3E"
+    return _svg_placeholder(symbol_upper[:2], "667eea")
+
+
+def set_coin_logo(symbol: str, logo_path: str):
+    """登记代币Logo并清空get_coin_logo的缓存"""
+    COIN_LOGOS[symbol.upper()] = logo_path
+    get_coin_logo.cache_clear()
 
 
 def get_platform_logo(platform_name: str) -> str:
     """获取平台Logo URL"""
     if platform_name in PLATFORM_LOGOS:
         return PLATFORM_LOGOS[platform_name]
-    # 返回SVG占位符
-    return f"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='64' height='64'%3E%3Crect width='64' height='64' fill='%2348bb78'/%3E%3Ctext x='50%25' y='50%25' dominant-baseline='middle' text-anchor='middle' font-size='24' fill='white'%3EP%3C/text%3E%3C/svg%3E"
+    return _PLATFORM_SVG
 
 
 def get_ai_model_logo(model_name: str) -> str:
     """获取AI模型Logo URL"""
     if model_name in AI_MODEL_LOGOS:
         return AI_MODEL_LOGOS[model_name]
-    # 返回SVG占位符
-    return f"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='64' height='64'%3E%3Crect width='64' height='64' fill='%23764ba2'/%3E%3Ctext x='50%25' y='50%25' dominant-baseline='middle' text-anchor='middle' font-size='20' fill='white'%3EAI%3C/text%3E%3C/svg%3E"
+    return _AI_SVG
 
 
 def get_news_source_logo(source_name: str) -> str:
     """获取消息来源Logo URL"""
     if source_name in NEWS_SOURCE_LOGOS:
         return NEWS_SOURCE_LOGOS[source_name]
-    # 返回SVG占位符
-    return f"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='64' height='64'%3E%3Crect width='64' height='64' fill='%23667eea'/%3E%3Ctext x='50%25' y='50%25' dominant-baseline='middle' text-anchor='middle' font-size='24' fill='white'%3EN%3C/text%3E%3C/svg%3E"
-
+    return _NEWS_SVG
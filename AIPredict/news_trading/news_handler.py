@@ -95,7 +95,7 @@ class NewsTradeHandler:
         logger.info(f"🤖 准备让 {len(self.analyzers)} 个AI分析...")
         
         # 🚀 推送事件：检测到新币
-        await event_manager.push_event("coin_detected", {
+        event_manager.push_event("coin_detected", {
             "coin": coin,
             "source": message.source,
             "ai_count": len(self.analyzers)
@@ -158,7 +158,7 @@ class NewsTradeHandler:
                 logger.info(f"⏭️  [{ai_name}] 决定不交易 {coin}")
                 
                 # 推送事件：AI 决定不交易
-                await event_manager.push_event("ai_decision", {
+                event_manager.push_event("ai_decision", {
                     "ai_name": ai_name,
                     "coin": coin,
                     "decision": "skip",
@@ -175,7 +175,7 @@ class NewsTradeHandler:
             )
             
             # 推送事件：AI 决策完成
-            await event_manager.push_event("ai_decision", {
+            event_manager.push_event("ai_decision", {
                 "ai_name": ai_name,
                 "coin": coin,
                 "decision": strategy.direction,
@@ -264,7 +264,7 @@ class NewsTradeHandler:
             )
             
             # 🚀 推送事件：AI分析完成
-            await event_manager.push_event("ai_analysis", {
+            event_manager.push_event("ai_analysis", {
                 "ai": ai_name,
                 "coin": coin,
                 "decision": strategy.direction,
@@ -396,7 +396,7 @@ class NewsTradeHandler:
             logger.info(f"✅ [{ai_name}] 订单成功: {result}")
             
             # 8. 推送事件：交易开仓成功
-            await event_manager.push_event("trade_opened", {
+            event_manager.push_event("trade_opened", {
                 "ai": ai_name,
                 "coin": coin,
                 "direction": strategy.direction,
@@ -9,6 +9,9 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# 只读取页面前 512KB：标题与 meta 描述都在 <head> 中，无需下载/解析整页
+MAX_SCRAPE_BYTES = 512 * 1024
+
 
 async def scrape_url_content(url: str) -> Optional[str]:
     """
@@ -38,18 +41,28 @@ async def scrape_url_content(url: str) -> Optional[str]:
         }
         
         async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(url, headers=headers)
-            
-            # 接受200和202状态码
-            if response.status_code not in [200, 202]:
-                logger.warning(f"⚠️  URL返回状态码 {response.status_code}，尝试从URL推断")
-                return _infer_from_url(url)
+            async with client.stream("GET", url, headers=headers) as response:
+                # 接受200和202状态码
+                if response.status_code not in [200, 202]:
+                    logger.warning(f"⚠️  URL返回状态码 {response.status_code}，尝试从URL推断")
+                    return _infer_from_url(url)
+                
+                # 流式读取，达到上限后停止下载
+                chunks = []
+                received = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received >= MAX_SCRAPE_BYTES:
+                        break
+                
+                html = b"".join(chunks)[:MAX_SCRAPE_BYTES].decode(response.charset_encoding or "utf-8", errors="replace")
             
             # 解析HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # 检查是否是WAF挑战页面
-            if len(response.text) < 5000 and ('gokuProps' in response.text or 'challenge' in response.text.lower()):
+            if len(html) < 5000 and ('gokuProps' in html or 'challenge' in html.lower()):
                 logger.warning("⚠️  检测到WAF保护，尝试从URL推断")
                 return _infer_from_url(url)
             
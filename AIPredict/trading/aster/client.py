@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 class AsterClient(BaseExchangeClient):
     """Aster 交易客户端 - 基于 AsterDex Futures API V3"""
     
+    # 所有 Aster 客户端共用的 HTTP 会话（同一主机复用连接池，避免每个客户端各自握手）
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    
     def __init__(self, private_key: str, testnet: bool = True):
         """
         初始化 Aster 客户端
@@ -56,7 +59,7 @@ class AsterClient(BaseExchangeClient):
         # 这里默认使用同一个地址，实际使用时需要配置正确的 signer
         self.signer = account.address
         
-        # 会话管理
+        # 会话管理（使用类级共享会话）
         self.session: Optional[aiohttp.ClientSession] = None
         
         logger.info(f"✅ Aster 客户端初始化成功")
@@ -70,10 +73,15 @@ class AsterClient(BaseExchangeClient):
         return "Aster"
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """获取或创建 aiohttp 会话"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
+        """获取共享的 aiohttp 会话（不存在或已关闭时创建）"""
+        session = AsterClient._shared_session
+        if session is None or session.closed:
+            # 保持长连接，避免每次请求重新握手
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=600)
+            session = aiohttp.ClientSession(connector=connector)
+            AsterClient._shared_session = session
+        self.session = session
+        return session
     
     def _trim_dict(self, my_dict: Dict) -> Dict:
         """转换字典值为字符串（AsterDex 要求）"""
@@ -570,9 +578,7 @@ class AsterClient(BaseExchangeClient):
                 return {"status": "err", "response": result}
             
         except Exception as e:
-            logger.error(f"[Aster] ❌ 下单失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"[Aster] ❌ 下单失败: {e}")
             return {"status": "err", "response": str(e)}
     
     async def cancel_order(self, coin: str, order_id: str) -> Dict:
@@ -667,7 +673,13 @@ class AsterClient(BaseExchangeClient):
             return []
     
     async def close_session(self):
-        """关闭会话"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """释放会话引用（共享会话由 close_shared_session 统一关闭）"""
+        self.session = None
+    
+    @classmethod
+    async def close_shared_session(cls):
+        """关闭所有 Aster 客户端共用的会话"""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
             logger.info("[Aster] ✅ 会话已关闭")
+        cls._shared_session = None
@@ -138,27 +138,15 @@ class AutoTrader:
             if not has_position:
                 return await self._open_position(coin, 'long', confidence, reasoning, current_price, balance)
             elif self.positions[coin]['side'] == 'short':
-                # 先平空仓
-                await self._close_position(coin, current_price, "反向信号")
-                # 平仓后重新获取余额
-                account_info = await self.client.get_account_info()
-                new_balance = float(account_info.get('marginSummary', {}).get('accountValue', balance))
-                logger.info(f"   平仓后余额更新: ${balance:.2f} → ${new_balance:.2f}")
-                # 再开多仓
-                return await self._open_position(coin, 'long', confidence, reasoning, current_price, new_balance)
+                # 先平空仓，再开多仓
+                return await self._reverse_position(coin, 'long', confidence, reasoning, current_price, balance)
         
         elif decision == TradingDecision.STRONG_SELL or decision == TradingDecision.SELL:
             if not has_position:
                 return await self._open_position(coin, 'short', confidence, reasoning, current_price, balance)
             elif self.positions[coin]['side'] == 'long':
-                # 先平多仓
-                await self._close_position(coin, current_price, "反向信号")
-                # 平仓后重新获取余额
-                account_info = await self.client.get_account_info()
-                new_balance = float(account_info.get('marginSummary', {}).get('accountValue', balance))
-                logger.info(f"   平仓后余额更新: ${balance:.2f} → ${new_balance:.2f}")
-                # 再开空仓
-                return await self._open_position(coin, 'short', confidence, reasoning, current_price, new_balance)
+                # 先平多仓，再开空仓
+                return await self._reverse_position(coin, 'short', confidence, reasoning, current_price, balance)
         
         elif decision == TradingDecision.HOLD:
             logger.debug(f"💤 AI 建议观望")
@@ -166,7 +154,7 @@ class AutoTrader:
         
         return None
     
-    async def _open_position(
+    async def _reverse_position(
         self,
         coin: str,
         side: str,
@@ -176,165 +164,392 @@ class AutoTrader:
         balance: float
     ) -> Optional[Dict]:
         """
-        开仓
+        反向信号：平掉旧仓后按新方向开仓
+        平仓单（Ioc）可能单独失败，开仓单只在平仓成功后再提交，不与平仓单合并批量下单
         
         Args:
             coin: 币种
-            side: 方向 ('long' 或 'short')
+            side: 新仓位方向 ('long' 或 'short')
             confidence: 信心度
             reasoning: 决策理由
             current_price: 当前价格
             balance: 账户余额
-            
+        
         Returns:
-            交易结果
+            开仓交易结果
         """
         try:
-            # 🎯 动态杠杆策略：根据AI信心度调整杠杆（2-5x）
-            # 信心度50% -> 2x, 信心度100% -> 5x (线性映射)
-            leverage = 2.0 + ((confidence - 50.0) / 50.0) * (self.max_leverage - 2.0)
-            leverage = max(2.0, min(leverage, self.max_leverage))  # 确保在2x-5x范围内
-            
-            # 📊 计算保证金（根据信心度线性插值：50%->min_margin, 100%->max_margin）
-            # 信心度越高，使用的保证金越多
-            margin_by_confidence = self.min_margin + ((confidence - 50) / 50.0) * (self.max_margin - self.min_margin)
-            
-            # 限制在配置的最大保证金范围内
-            margin = min(margin_by_confidence, self.max_margin)
-            
-            # 确保满足最小保证金要求
-            if margin < self.min_margin:
-                margin = self.min_margin
-                logger.info(f"   ⚠️  保证金已调整至最小值: ${margin:.2f}")
-            
-            # 检查余额是否充足
-            if margin > balance:
-                logger.warning(f"⚠️  保证金${margin:.2f}超过账户余额${balance:.2f}，无法开仓")
+            close_plan = await self._plan_close_order(coin, current_price, "反向信号")
+            if close_plan is None:
+                return await self._open_position(coin, side, confidence, reasoning, current_price, balance)
+            
+            close_result = await self.client.place_order(**close_plan['order_params'])
+            if self._record_close(coin, close_plan, current_price, "反向信号", close_result) is None:
+                # 旧仓未平掉时不开新仓，内部持仓与交易所保持一致
+                logger.error(f"❌ 反向信号平仓失败，放弃开新仓: {coin}")
                 return None
             
-            # 💰 计算仓位价值 = 保证金 × 杠杆倍数
-            position_value = margin * leverage
-            
-            # 📉 计算数量（币的数量）
-            size = position_value / current_price
+            # 账户价值已包含未实现盈亏，平仓前后基本一致，无需平仓后再查询一次
+            new_balance = close_plan['account_value'] or balance
+            logger.info(f"   平仓后余额更新: ${balance:.2f} → ${new_balance:.2f}")
             
-            # 确保满足最小交易单位
-            if size < 0.0001:
-                logger.warning(f"⚠️  仓位太小，无法开仓: {size:.6f} {coin}")
+            return await self._open_position(coin, side, confidence, reasoning, current_price, new_balance)
+        
+        except Exception as e:
+            logger.exception(f"❌ 反向开仓失败: {e}")
+            return None
+    
+    def _plan_open_order(
+        self,
+        coin: str,
+        side: str,
+        confidence: float,
+        reasoning: str,
+        current_price: float,
+        balance: float
+    ) -> Optional[Dict]:
+        """
+        计算开仓参数（动态杠杆 + 保证金），不下单
+        
+        Returns:
+            开仓计划（下单参数及仓位信息），不满足开仓条件时返回 None
+        """
+        # 🎯 动态杠杆策略：根据AI信心度调整杠杆（2-5x）
+        # 信心度50% -> 2x, 信心度100% -> 5x (线性映射)
+        leverage = 2.0 + ((confidence - 50.0) / 50.0) * (self.max_leverage - 2.0)
+        leverage = max(2.0, min(leverage, self.max_leverage))  # 确保在2x-5x范围内
+        
+        # 📊 计算保证金（根据信心度线性插值：50%->min_margin, 100%->max_margin）
+        # 信心度越高，使用的保证金越多
+        margin_by_confidence = self.min_margin + ((confidence - 50) / 50.0) * (self.max_margin - self.min_margin)
+        
+        # 限制在配置的最大保证金范围内
+        margin = min(margin_by_confidence, self.max_margin)
+        
+        # 确保满足最小保证金要求
+        if margin < self.min_margin:
+            margin = self.min_margin
+            logger.info(f"   ⚠️  保证金已调整至最小值: ${margin:.2f}")
+        
+        # 检查余额是否充足
+        if margin > balance:
+            logger.warning(f"⚠️  保证金${margin:.2f}超过账户余额${balance:.2f}，无法开仓")
+            return None
+        
+        # 💰 计算仓位价值 = 保证金 × 杠杆倍数
+        position_value = margin * leverage
+        
+        # 📉 计算数量（币的数量）
+        size = position_value / current_price
+        
+        # 确保满足最小交易单位
+        if size < 0.0001:
+            logger.warning(f"⚠️  仓位太小，无法开仓: {size:.6f} {coin}")
+            return None
+        
+        logger.info("=" * 60)
+        logger.info(f"📈 开{'多' if side == 'long' else '空'}仓 (AI动态杠杆策略)")
+        logger.info(f"   币种: {coin}")
+        logger.info(f"   价格: ${current_price:,.2f}")
+        logger.info(f"   信心度: {confidence:.1f}%")
+        logger.info(f"   🎯 AI决策杠杆: {leverage:.2f}x (基于信心度)")
+        logger.info(f"   💰 保证金: ${margin:.2f}")
+        logger.info(f"   📊 仓位价值: ${position_value:.2f} (保证金 × 杠杆)")
+        logger.info(f"   🔢 数量: {size:.5f} {coin}")
+        logger.info(f"   💡 理由: {reasoning[:100]}...")
+        logger.info("=" * 60)
+        
+        # 下单（市价单）
+        is_buy = (side == 'long')
+        
+        # 注意：Hyperliquid 使用市价单需要特殊处理
+        # 这里使用略微偏离市场价的限价单来模拟市价单
+        order_price = current_price * 1.001 if is_buy else current_price * 0.999
+        
+        # 准备下单参数（传入AI计算的杠杆）
+        order_params = {
+            "coin": coin,
+            "is_buy": is_buy,
+            "size": size,
+            "price": order_price,
+            "order_type": "Limit",
+            "reduce_only": False
+        }
+        
+        # 如果客户端支持杠杆设置，传入杠杆参数
+        if hasattr(self.client, 'update_leverage'):
+            # Aster: 1-125x, Hyperliquid: 1-50x
+            # 使用更宽松的上限以兼容不同平台
+            max_platform_leverage = 125
+            leverage_int = max(2, min(int(round(leverage)), max_platform_leverage))  # 最小2x
+            order_params["leverage"] = leverage_int
+            platform_name = getattr(self.client, 'platform_name', 'Platform')
+            logger.info(f"   🎯 传递{platform_name}杠杆参数: {leverage_int}x (原始: {leverage:.2f}x)")
+            logger.info(f"   💰 预期保证金: ${margin:.2f}")
+            logger.info(f"   📊 预期仓位价值: ${position_value:.2f}")
+        
+        return {
+            'side': side,
+            'size': size,
+            'margin': margin,
+            'leverage': leverage,
+            'position_value': position_value,
+            'order_params': order_params
+        }
+    
+    def _record_open(
+        self,
+        coin: str,
+        plan: Dict,
+        confidence: float,
+        reasoning: str,
+        current_price: float,
+        order_result: Dict
+    ) -> Optional[Dict]:
+        """检查开仓订单结果并记录持仓和交易"""
+        side = plan['side']
+        size = plan['size']
+        position_value = plan['position_value']
+        
+        # 检查订单是否成功（适配官方SDK返回格式）
+        if order_result.get('status') == 'err':
+            error_msg = order_result.get('response', 'Unknown error')
+            logger.error(f"❌ 订单被拒绝: {error_msg}")
+            logger.error(f"   请检查 Hyperliquid 账户状态和余额")
+            return None
+        
+        # 检查订单详细状态
+        order_id = 'unknown'
+        if order_result.get('status') == 'ok':
+            response = order_result.get('response', {})
+            data = response.get('data', {})
+            statuses = data.get('statuses', [])
+            
+            if statuses and 'error' in statuses[0]:
+                error_msg = statuses[0]['error']
+                logger.error(f"❌ 订单失败: {error_msg}")
+                logger.error(f"   订单详情: {order_result}")
                 return None
             
-            logger.info("=" * 60)
-            logger.info(f"📈 开{'多' if side == 'long' else '空'}仓 (AI动态杠杆策略)")
-            logger.info(f"   币种: {coin}")
-            logger.info(f"   价格: ${current_price:,.2f}")
-            logger.info(f"   信心度: {confidence:.1f}%")
-            logger.info(f"   🎯 AI决策杠杆: {leverage:.2f}x (基于信心度)")
-            logger.info(f"   💰 保证金: ${margin:.2f}")
-            logger.info(f"   📊 仓位价值: ${position_value:.2f} (保证金 × 杠杆)")
-            logger.info(f"   🔢 数量: {size:.5f} {coin}")
-            logger.info(f"   💡 理由: {reasoning[:100]}...")
-            logger.info("=" * 60)
-            
-            # 下单（市价单）
-            is_buy = (side == 'long')
+            logger.info(f"✅ 订单已提交: {statuses}")
             
-            # 注意：Hyperliquid 使用市价单需要特殊处理
-            # 这里使用略微偏离市场价的限价单来模拟市价单
-            order_price = current_price * 1.001 if is_buy else current_price * 0.999
+            # 提取订单ID（适配官方SDK格式）
+            if statuses:
+                status = statuses[0]
+                if 'filled' in status:
+                    order_id = status['filled'].get('oid', 'unknown')
+                elif 'resting' in status:
+                    order_id = status['resting'].get('oid', 'unknown')
+        
+        # 记录持仓（持仓与交易记录共用同一时间）
+        now = datetime.now()
+        self.positions[coin] = {
+            'side': side,
+            'entry_price': current_price,
+            'size': size,
+            'position_value': position_value,
+            'margin': plan['margin'],
+            'leverage': plan['leverage'],
+            'entry_time': now,
+            'confidence': confidence,
+            'reasoning': reasoning,
+            'order_id': order_id
+        }
+        
+        # 记录交易
+        trade_record = {
+            'time': now.isoformat(),
+            'coin': coin,
+            'action': 'open',
+            'side': side,
+            'price': current_price,
+            'size': size,
+            'value': position_value,
+            'confidence': confidence,
+            'reasoning': reasoning,
+            'order_result': order_result
+        }
+        self.trades.append(trade_record)
+        self.daily_trade_count += 1
+        
+        logger.info(f"✅ 开仓成功: {side.upper()} {size:.5f} {coin} @ ${current_price:,.2f}")
+        
+        return trade_record
+    
+    async def _open_position(
+        self,
+        coin: str,
+        side: str,
+        confidence: float,
+        reasoning: str,
+        current_price: float,
+        balance: float
+    ) -> Optional[Dict]:
+        """
+        开仓
+        
+        Args:
+            coin: 币种
+            side: 方向 ('long' 或 'short')
+            confidence: 信心度
+            reasoning: 决策理由
+            current_price: 当前价格
+            balance: 账户余额
+        
+        Returns:
+            交易结果
+        """
+        try:
+            plan = self._plan_open_order(coin, side, confidence, reasoning, current_price, balance)
+            if plan is None:
+                return None
             
-            # 准备下单参数（传入AI计算的杠杆）
-            order_params = {
+            order_result = await self.client.place_order(**plan['order_params'])
+            return self._record_open(coin, plan, confidence, reasoning, current_price, order_result)
+        
+        except Exception as e:
+            logger.exception(f"❌ 开仓失败: {e}")
+            return None
+    
+    async def _plan_close_order(
+        self,
+        coin: str,
+        current_price: float,
+        reason: str
+    ) -> Optional[Dict]:
+        """
+        按交易所实际持仓计算平仓参数，不下单
+        
+        Returns:
+            平仓计划（下单参数、盈亏及平仓前账户价值），交易所无持仓时返回 None
+        """
+        position = self.positions[coin]
+        
+        # 🔑 关键修复：从交易所获取实际持仓数量
+        logger.info(f"🔍 获取 {coin} 在交易所的实际持仓数量...")
+        account_info = await self.client.get_account_info()
+        actual_size = None
+        
+        for asset_pos in account_info.get('assetPositions', []):
+            if asset_pos['position']['coin'] == coin:
+                szi = float(asset_pos['position']['szi'])
+                actual_size = abs(szi)
+                actual_side = 'long' if szi > 0 else 'short'
+                
+                # 验证方向是否一致
+                if actual_side != position['side']:
+                    logger.warning(f"⚠️  持仓方向不一致！系统记录: {position['side']}, 实际: {actual_side}")
+                
+                logger.info(f"✅ 交易所实际持仓: {actual_size:.8f} {coin}")
+                break
+        
+        if actual_size is None:
+            logger.error(f"❌ 交易所无 {coin} 持仓，但系统有记录！")
+            logger.warning(f"⚠️  清理系统内的无效持仓记录")
+            del self.positions[coin]
+            return None
+        
+        # 使用交易所的实际数量（避免精度导致残余）
+        close_size = actual_size
+        
+        # 计算盈亏（使用实际数量）
+        if position['side'] == 'long':
+            pnl = (current_price - position['entry_price']) * close_size
+        else:  # short
+            pnl = (position['entry_price'] - current_price) * close_size
+        
+        pnl_pct = (pnl / (position['entry_price'] * close_size)) * 100 if close_size > 0 else 0
+        
+        logger.info("=" * 60)
+        logger.info(f"📉 平{'多' if position['side'] == 'long' else '空'}仓")
+        logger.info(f"   币种: {coin}")
+        logger.info(f"   开仓价: ${position['entry_price']:,.2f}")
+        logger.info(f"   平仓价: ${current_price:,.2f}")
+        logger.info(f"   系统记录数量: {position['size']:.8f} {coin}")
+        logger.info(f"   实际平仓数量: {close_size:.8f} {coin} ✅")
+        logger.info(f"   盈亏: ${pnl:+.2f} ({pnl_pct:+.2f}%)")
+        logger.info(f"   原因: {reason}")
+        logger.info("=" * 60)
+        
+        # 下单平仓（反向操作）
+        is_buy = (position['side'] == 'short')  # 平空仓需要买入
+        order_price = current_price * 1.001 if is_buy else current_price * 0.999
+        
+        return {
+            'position': position,
+            'close_size': close_size,
+            'pnl': pnl,
+            'pnl_pct': pnl_pct,
+            'account_value': float(account_info.get('marginSummary', {}).get('accountValue', 0)),
+            'order_params': {
                 "coin": coin,
                 "is_buy": is_buy,
-                "size": size,
+                "size": close_size,  # 使用交易所实际数量
                 "price": order_price,
                 "order_type": "Limit",
-                "reduce_only": False
-            }
-            
-            # 如果客户端支持杠杆设置，传入杠杆参数
-            if hasattr(self.client, 'update_leverage'):
-                # Aster: 1-125x, Hyperliquid: 1-50x
-                # 使用更宽松的上限以兼容不同平台
-                max_platform_leverage = 125
-                leverage_int = max(2, min(int(round(leverage)), max_platform_leverage))  # 最小2x
-                order_params["leverage"] = leverage_int
-                platform_name = getattr(self.client, 'platform_name', 'Platform')
-                logger.info(f"   🎯 传递{platform_name}杠杆参数: {leverage_int}x (原始: {leverage:.2f}x)")
-                logger.info(f"   💰 预期保证金: ${margin:.2f}")
-                logger.info(f"   📊 预期仓位价值: ${position_value:.2f}")
-            
-            order_result = await self.client.place_order(**order_params)
-            
-            # 检查订单是否成功（适配官方SDK返回格式）
-            if order_result.get('status') == 'err':
-                error_msg = order_result.get('response', 'Unknown error')
-                logger.error(f"❌ 订单被拒绝: {error_msg}")
-                logger.error(f"   请检查 Hyperliquid 账户状态和余额")
-                return None
-            
-            # 检查订单详细状态
-            if order_result.get('status') == 'ok':
-                response = order_result.get('response', {})
-                data = response.get('data', {})
-                statuses = data.get('statuses', [])
-                
-                if statuses and 'error' in statuses[0]:
-                    error_msg = statuses[0]['error']
-                    logger.error(f"❌ 订单失败: {error_msg}")
-                    logger.error(f"   订单详情: {order_result}")
-                    return None
-                
-                logger.info(f"✅ 订单已提交: {statuses}")
-                
-                # 提取订单ID（适配官方SDK格式）
-                order_id = 'unknown'
-                if statuses:
-                    status = statuses[0]
-                    if 'filled' in status:
-                        order_id = status['filled'].get('oid', 'unknown')
-                    elif 'resting' in status:
-                        order_id = status['resting'].get('oid', 'unknown')
-            
-            # 记录持仓
-            self.positions[coin] = {
-                'side': side,
-                'entry_price': current_price,
-                'size': size,
-                'position_value': position_value,
-                'margin': margin,
-                'leverage': leverage,
-                'entry_time': datetime.now(),
-                'confidence': confidence,
-                'reasoning': reasoning,
-                'order_id': order_id
-            }
-            
-            # 记录交易
-            trade_record = {
-                'time': datetime.now().isoformat(),
-                'coin': coin,
-                'action': 'open',
-                'side': side,
-                'price': current_price,
-                'size': size,
-                'value': position_value,
-                'confidence': confidence,
-                'reasoning': reasoning,
-                'order_result': order_result
+                "reduce_only": True  # 只减仓
             }
-            self.trades.append(trade_record)
-            self.daily_trade_count += 1
-            
-            logger.info(f"✅ 开仓成功: {side.upper()} {size:.5f} {coin} @ ${current_price:,.2f}")
-            
-            return trade_record
-            
-        except Exception as e:
-            logger.error(f"❌ 开仓失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        }
+    
+    def _record_close(
+        self,
+        coin: str,
+        plan: Dict,
+        current_price: float,
+        reason: str,
+        order_result: Dict
+    ) -> Optional[Dict]:
+        """检查平仓订单结果并记录交易、移除持仓"""
+        position = plan['position']
+        close_size = plan['close_size']
+        pnl = plan['pnl']
+        
+        # 检查订单是否成功
+        if order_result.get('status') == 'err':
+            error_msg = order_result.get('response', 'Unknown error')
+            logger.error(f"❌ 平仓订单被拒绝: {error_msg}")
+            logger.error(f"   请检查 Hyperliquid 账户状态和持仓")
             return None
+        
+        # 检查订单详细状态
+        if order_result.get('status') == 'ok':
+            response = order_result.get('response', {})
+            data = response.get('data', {})
+            statuses = data.get('statuses', [])
+            
+            if statuses and 'error' in statuses[0]:
+                error_msg = statuses[0]['error']
+                logger.error(f"❌ 平仓订单失败: {error_msg}")
+                logger.error(f"   订单详情: {order_result}")
+                logger.warning(f"⚠️  系统持仓与交易所不同步，保留内部持仓记录")
+                return None
+        
+        # 记录交易（使用实际平仓数量）
+        now = datetime.now()
+        trade_record = {
+            'time': now.isoformat(),
+            'coin': coin,
+            'action': 'close',
+            'side': position['side'],
+            'entry_price': position['entry_price'],
+            'exit_price': current_price,
+            'size': close_size,  # 使用实际平仓数量
+            'pnl': pnl,
+            'pnl_pct': plan['pnl_pct'],
+            'reason': reason,
+            'hold_time': (now - position['entry_time']).total_seconds(),
+            'order_result': order_result
+        }
+        self.trades.append(trade_record)
+        self.daily_trade_count += 1
+        self.daily_pnl += pnl
+        
+        # 移除持仓
+        del self.positions[coin]
+        
+        logger.info(f"✅ 平仓成功: {position['side'].upper()} {close_size:.8f} {coin}, 盈亏: ${pnl:+.2f}")
+        
+        return trade_record
     
     async def _close_position(
         self,
@@ -349,7 +564,7 @@ class AutoTrader:
             coin: 币种
             current_price: 当前价格
             reason: 平仓原因
-            
+        
         Returns:
             交易结果
         """
@@ -358,117 +573,15 @@ class AutoTrader:
             return None
         
         try:
-            position = self.positions[coin]
-            
-            # 🔑 关键修复：从交易所获取实际持仓数量
-            logger.info(f"🔍 获取 {coin} 在交易所的实际持仓数量...")
-            account_info = await self.client.get_account_info()
-            actual_size = None
-            
-            for asset_pos in account_info.get('assetPositions', []):
-                if asset_pos['position']['coin'] == coin:
-                    szi = float(asset_pos['position']['szi'])
-                    actual_size = abs(szi)
-                    actual_side = 'long' if szi > 0 else 'short'
-                    
-                    # 验证方向是否一致
-                    if actual_side != position['side']:
-                        logger.warning(f"⚠️  持仓方向不一致！系统记录: {position['side']}, 实际: {actual_side}")
-                    
-                    logger.info(f"✅ 交易所实际持仓: {actual_size:.8f} {coin}")
-                    break
-            
-            if actual_size is None:
-                logger.error(f"❌ 交易所无 {coin} 持仓，但系统有记录！")
-                logger.warning(f"⚠️  清理系统内的无效持仓记录")
-                del self.positions[coin]
+            plan = await self._plan_close_order(coin, current_price, reason)
+            if plan is None:
                 return None
             
-            # 使用交易所的实际数量（避免精度导致残余）
-            close_size = actual_size
-            
-            # 计算盈亏（使用实际数量）
-            if position['side'] == 'long':
-                pnl = (current_price - position['entry_price']) * close_size
-            else:  # short
-                pnl = (position['entry_price'] - current_price) * close_size
-            
-            pnl_pct = (pnl / (position['entry_price'] * close_size)) * 100 if close_size > 0 else 0
-            
-            logger.info("=" * 60)
-            logger.info(f"📉 平{'多' if position['side'] == 'long' else '空'}仓")
-            logger.info(f"   币种: {coin}")
-            logger.info(f"   开仓价: ${position['entry_price']:,.2f}")
-            logger.info(f"   平仓价: ${current_price:,.2f}")
-            logger.info(f"   系统记录数量: {position['size']:.8f} {coin}")
-            logger.info(f"   实际平仓数量: {close_size:.8f} {coin} ✅")
-            logger.info(f"   盈亏: ${pnl:+.2f} ({pnl_pct:+.2f}%)")
-            logger.info(f"   原因: {reason}")
-            logger.info("=" * 60)
-            
-            # 下单平仓（反向操作）
-            is_buy = (position['side'] == 'short')  # 平空仓需要买入
-            order_price = current_price * 1.001 if is_buy else current_price * 0.999
-            
-            order_result = await self.client.place_order(
-                coin=coin,
-                is_buy=is_buy,
-                size=close_size,  # 使用交易所实际数量
-                price=order_price,
-                order_type="Limit",
-                reduce_only=True  # 只减仓
-            )
-            
-            # 检查订单是否成功
-            if order_result.get('status') == 'err':
-                error_msg = order_result.get('response', 'Unknown error')
-                logger.error(f"❌ 平仓订单被拒绝: {error_msg}")
-                logger.error(f"   请检查 Hyperliquid 账户状态和持仓")
-                return None
-            
-            # 检查订单详细状态
-            if order_result.get('status') == 'ok':
-                response = order_result.get('response', {})
-                data = response.get('data', {})
-                statuses = data.get('statuses', [])
-                
-                if statuses and 'error' in statuses[0]:
-                    error_msg = statuses[0]['error']
-                    logger.error(f"❌ 平仓订单失败: {error_msg}")
-                    logger.error(f"   订单详情: {order_result}")
-                    logger.warning(f"⚠️  系统持仓与交易所不同步，保留内部持仓记录")
-                    return None
-            
-            # 记录交易（使用实际平仓数量）
-            trade_record = {
-                'time': datetime.now().isoformat(),
-                'coin': coin,
-                'action': 'close',
-                'side': position['side'],
-                'entry_price': position['entry_price'],
-                'exit_price': current_price,
-                'size': close_size,  # 使用实际平仓数量
-                'pnl': pnl,
-                'pnl_pct': pnl_pct,
-                'reason': reason,
-                'hold_time': (datetime.now() - position['entry_time']).total_seconds(),
-                'order_result': order_result
-            }
-            self.trades.append(trade_record)
-            self.daily_trade_count += 1
-            self.daily_pnl += pnl
-            
-            # 移除持仓
-            del self.positions[coin]
-            
-            logger.info(f"✅ 平仓成功: {position['side'].upper()} {close_size:.8f} {coin}, 盈亏: ${pnl:+.2f}")
-            
-            return trade_record
-            
+            order_result = await self.client.place_order(**plan['order_params'])
+            return self._record_close(coin, plan, current_price, reason, order_result)
+        
         except Exception as e:
-            logger.error(f"❌ 平仓失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ 平仓失败: {e}")
             return None
     
     def get_position_info(self, coin: str) -> Optional[Dict]:
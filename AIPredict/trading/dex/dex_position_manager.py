@@ -213,9 +213,7 @@ class DEXPositionManager:
             return True
             
         except Exception as e:
-            logger.error(f"❌ [{coin}] 执行卖出异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ [{coin}] 执行卖出异常: {e}")
             return False
     
     def _print_position_summary(self, coin: str):
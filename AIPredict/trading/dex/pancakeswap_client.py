@@ -316,9 +316,7 @@ class PancakeSwapClient(BaseDEXClient):
                 }
                 
         except Exception as e:
-            logger.error(f"❌ Swap交易失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Swap交易失败: {e}")
             return {
                 "status": "error",
                 "message": str(e),
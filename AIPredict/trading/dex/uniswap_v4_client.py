@@ -321,9 +321,7 @@ class UniswapV4Client(BaseDEXClient):
                 }
                 
         except Exception as e:
-            logger.error(f"❌ Swap交易失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Swap交易失败: {e}")
             return {
                 "status": "error",
                 "message": str(e),
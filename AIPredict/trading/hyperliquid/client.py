@@ -9,6 +9,7 @@ from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
 from hyperliquid.utils import constants
 import eth_account
+from requests.adapters import HTTPAdapter
 from eth_account.signers.local import LocalAccount
 
 from trading.base_client import BaseExchangeClient
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 class HyperliquidClient(BaseExchangeClient):
     """Hyperliquid 交易客户端（官方SDK版本）"""
     
+    # 查询接口（Info）不依赖账户，同一网络的所有客户端共用一个实例和连接池
+    _shared_infos: Dict[str, Info] = {}
+    
     def __init__(self, private_key: str, testnet: bool = True):
         """
         初始化 Hyperliquid 客户端
@@ -41,13 +45,14 @@ class HyperliquidClient(BaseExchangeClient):
         else:
             base_url = constants.MAINNET_API_URL
         
-        # 初始化 Info（查询）和 Exchange（交易）
-        self.info = Info(base_url, skip_ws=True)
+        # 初始化 Info（查询，共用）和 Exchange（交易）
+        self.info = self._get_shared_info(base_url)
         self.exchange = Exchange(
             wallet=None,  # 使用私钥
             base_url=base_url,
             account_address=None  # SDK会从私钥推导
         )
+        self._mount_pool(self.exchange.session)
         
         # 从私钥设置账户
         from eth_account import Account
@@ -56,6 +61,9 @@ class HyperliquidClient(BaseExchangeClient):
         self.exchange.wallet = account
         self.exchange.account_address = self.address
         
+        # 已生效的杠杆设置 {coin: (杠杆倍数, 是否全仓)}，相同设置不再重复签名提交
+        self._leverage_settings: Dict[str, Tuple[int, bool]] = {}
+        
         logger.info(f"✅ Hyperliquid 客户端初始化成功")
         logger.info(f"   地址: {self.address}")
         logger.info(f"   网络: {'测试网' if testnet else '主网'}")
@@ -73,6 +81,27 @@ class HyperliquidClient(BaseExchangeClient):
         """异步上下文管理器退出"""
         pass
     
+    @staticmethod
+    def _mount_pool(session):
+        """扩大 SDK requests 会话的连接池（并发线程调用时复用长连接，避免连接池满后反复握手）"""
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    
+    @classmethod
+    def _get_shared_info(cls, base_url: str) -> Info:
+        """获取指定网络共用的 Info 实例（首次调用时创建）"""
+        info = cls._shared_infos.get(base_url)
+        if info is None:
+            info = Info(base_url, skip_ws=True)
+            cls._mount_pool(info.session)
+            cls._shared_infos[base_url] = info
+        return info
+    
+    async def close_session(self):
+        """关闭交易会话（共用的 Info 会话保持打开）"""
+        self.exchange.session.close()
+    
     async def get_account_info(self) -> Dict:
         """
         获取账户信息（异步优化：避免阻塞事件循环）
@@ -90,6 +119,30 @@ class HyperliquidClient(BaseExchangeClient):
             logger.error(f"获取账户信息失败: {e}")
             return {}
     
+    async def batch_get_account_info(self, addresses: List[str]) -> Dict[str, Dict]:
+        """
+        批量获取多个地址的账户信息（地址去重后并发查询）
+        
+        Args:
+            addresses: 账户地址列表
+            
+        Returns:
+            {地址: 账户信息}，查询失败的地址不在结果中
+        """
+        unique_addresses = list(dict.fromkeys(addresses))
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.info.user_state, address) for address in unique_addresses),
+            return_exceptions=True
+        )
+        
+        accounts = {}
+        for address, result in zip(unique_addresses, results):
+            if isinstance(result, Exception):
+                logger.error(f"获取账户信息失败 ({address}): {result}")
+                continue
+            accounts[address] = result
+        return accounts
+    
     def get_max_leverage(self, coin: str) -> int:
         """
         获取币种的最大杠杆
@@ -127,9 +180,11 @@ class HyperliquidClient(BaseExchangeClient):
             市场数据（包含 maxLeverage）
         """
         try:
-            # 获取所有市场数据
-            all_mids = self.info.all_mids()
-            meta = self.info.meta()
+            # 并发获取所有币种中间价和详细的市场上下文（同步SDK调用放入线程池，避免阻塞事件循环）
+            all_mids, meta_and_asset_ctxs = await asyncio.gather(
+                asyncio.to_thread(self.info.all_mids),
+                asyncio.to_thread(self.info.meta_and_asset_ctxs)
+            )
             
             # 查找指定币种
             if coin not in all_mids:
@@ -137,9 +192,6 @@ class HyperliquidClient(BaseExchangeClient):
             
             current_price = float(all_mids[coin])
             
-            # 获取详细的市场上下文
-            meta_and_asset_ctxs = self.info.meta_and_asset_ctxs()
-            
             # 查找币种索引和最大杠杆
             asset_index = None
             max_leverage = 1
@@ -191,7 +243,7 @@ class HyperliquidClient(BaseExchangeClient):
             订单簿数据 {"bids": [[price, size], ...], "asks": [[price, size], ...]}
         """
         try:
-            l2_snapshot = self.info.l2_snapshot(coin)
+            l2_snapshot = await asyncio.to_thread(self.info.l2_snapshot, coin)
             # l2_snapshot 格式: {"levels": [[{"px": price, "sz": size, "n": count},...], [...]]}
             levels = l2_snapshot.get('levels', [[], []])
             
@@ -204,9 +256,7 @@ class HyperliquidClient(BaseExchangeClient):
                 "asks": asks
             }
         except Exception as e:
-            logger.error(f"获取订单簿失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"获取订单簿失败: {e}")
             return {"bids": [], "asks": []}
     
     async def get_recent_trades(self, coin: str, limit: int = 20) -> List[Dict]:
@@ -222,7 +272,7 @@ class HyperliquidClient(BaseExchangeClient):
         """
         try:
             # 使用官方SDK的 recent_trades 方法
-            trades = self.info.recent_trades(coin)
+            trades = await asyncio.to_thread(self.info.recent_trades, coin)
             if not trades:
                 return []
             
@@ -245,14 +295,23 @@ class HyperliquidClient(BaseExchangeClient):
             is_cross: 是否全仓模式 (True=全仓, False=逐仓)
             
         Returns:
-            更新结果
+            更新结果（与上次成功设置相同时直接返回，不发送请求）
         """
+        if self._leverage_settings.get(coin) == (leverage, is_cross):
+            logger.debug(f"杠杆未变化，跳过更新: {coin} -> {leverage}x")
+            return {"status": "ok", "response": {"type": "default"}}
+        
         try:
             # 使用官方SDK的 update_leverage 方法
             result = self.exchange.update_leverage(leverage, coin, is_cross)
+            if isinstance(result, dict) and result.get("status") == "ok":
+                self._leverage_settings[coin] = (leverage, is_cross)
+            else:
+                self._leverage_settings.pop(coin, None)
             logger.info(f"✅ 杠杆已更新: {coin} -> {leverage}x ({'全仓' if is_cross else '逐仓'})")
             return result
         except Exception as e:
+            self._leverage_settings.pop(coin, None)
             logger.error(f"❌ 更新杠杆失败: {e}")
             raise
     
@@ -407,15 +466,95 @@ class HyperliquidClient(BaseExchangeClient):
                 if attempt < max_retries - 1:
                     continue
                 else:
-                    logger.error(f"❌ 所有重试均失败")
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    logger.exception(f"❌ 所有重试均失败")
                     return {"status": "err", "response": str(e)}
         
         # 如果所有重试都失败
         logger.error(f"❌ 订单最终失败，已尝试 {max_retries} 次")
         return {"status": "err", "response": f"All {max_retries} attempts failed. Last error: {last_error}"}
     
+    async def bulk_place_orders(self, orders: List[Dict]) -> List[Dict]:
+        """
+        批量下单（多个订单合并为一次签名、一次请求，如反向信号的平仓+开仓）
+        
+        Args:
+            orders: 订单参数列表，字段同 place_order（coin, is_buy, size, price, order_type, reduce_only, leverage），price 必填
+            
+        Returns:
+            与 orders 一一对应的订单结果（格式同 place_order）
+        """
+        results: List[Optional[Dict]] = [None] * len(orders)
+        order_requests = []
+        request_indices = []
+        for i, order in enumerate(orders):
+            coin = order["coin"]
+            reduce_only = order.get("reduce_only", False)
+            
+            # 如果指定了杠杆，先设置杠杆；设置失败的开仓单不进入批量请求，直接返回错误
+            leverage = order.get("leverage")
+            if leverage is not None and not reduce_only:
+                try:
+                    leverage_result = await asyncio.to_thread(self.update_leverage, coin, leverage, True)
+                    if not isinstance(leverage_result, dict) or leverage_result.get("status") != "ok":
+                        raise RuntimeError(leverage_result)
+                except Exception as e:
+                    logger.error(f"❌ 设置杠杆失败，跳过该订单: {coin} {leverage}x - {e}")
+                    results[i] = {"status": "err", "response": f"设置杠杆失败: {e}"}
+                    continue
+            
+            # 精度处理/参数校验失败只影响该订单（如开仓数量取整后为0），不能连带拒绝同批的平仓单
+            try:
+                size_rounded, _ = precision_config.format_hyperliquid_quantity(
+                    coin, order["size"], round_down=(not reduce_only)
+                )
+                price_rounded, _ = precision_config.format_hyperliquid_price(coin, order["price"])
+                is_valid, error_msg = precision_config.validate_hyperliquid_order(coin, size_rounded, price_rounded)
+            except Exception as e:
+                is_valid, error_msg = False, str(e)
+            if not is_valid:
+                logger.error(f"❌ 订单参数验证失败，跳过该订单: {coin} - {error_msg}")
+                results[i] = {"status": "err", "response": f"订单参数验证失败: {error_msg}"}
+                continue
+            
+            # 平仓单和市价单使用 Ioc，限价开仓单使用 Gtc（与 place_order 一致）
+            if reduce_only or order.get("order_type", "Limit") != "Limit":
+                order_type_param = {"limit": {"tif": "Ioc"}}
+            else:
+                order_type_param = {"limit": {"tif": "Gtc"}}
+            
+            order_requests.append({
+                "coin": coin,
+                "is_buy": order["is_buy"],
+                "sz": size_rounded,
+                "limit_px": price_rounded,
+                "order_type": order_type_param,
+                "reduce_only": reduce_only
+            })
+            request_indices.append(i)
+        
+        if not order_requests:
+            return results
+        
+        try:
+            bulk_result = await asyncio.to_thread(self.exchange.bulk_orders, order_requests)
+        except Exception as e:
+            logger.error(f"❌ 批量下单异常: {e}")
+            bulk_result = {"status": "err", "response": str(e)}
+        
+        logger.info(f"📝 官方SDK批量订单结果: {bulk_result}")
+        
+        if bulk_result.get('status') != 'ok':
+            for i in request_indices:
+                results[i] = bulk_result
+            return results
+        
+        # 按订单拆分 statuses，保持与单笔下单相同的结果格式
+        response = bulk_result.get('response', {})
+        statuses = response.get('data', {}).get('statuses', [])
+        for j, i in enumerate(request_indices):
+            results[i] = {"status": "ok", "response": {"type": response.get('type', 'order'), "data": {"statuses": statuses[j:j + 1]}}}
+        return results
+    
     async def cancel_order(self, coin: str, order_id) -> Dict:
         """
         取消订单
@@ -485,9 +624,7 @@ class HyperliquidClient(BaseExchangeClient):
             logger.info(f"📊 从 Hyperliquid 获取了 {len(fills)} 条历史成交记录")
             return fills
         except Exception as e:
-            logger.error(f"获取历史成交失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"获取历史成交失败: {e}")
             return []
     
     async def get_candles(self, coin: str, interval: str = "15m", lookback: int = 100, timeout: int = 30) -> List[Dict]:
@@ -612,20 +749,20 @@ class HyperliquidClient(BaseExchangeClient):
             else:
                 base_url = constants.MAINNET_API_URL
             
-            # 初始化 Info 和 Exchange
-            info = Info(base_url, skip_ws=True)
+            # 初始化 Exchange（Info 使用同一网络共用的实例）
             exchange = Exchange(
                 wallet=agent_account,
                 base_url=base_url,
                 account_address=account_address  # 关键：设置主账户地址
             )
+            HyperliquidClient._mount_pool(exchange.session)
             
             # 创建 client 实例
             client = HyperliquidClient(agent_private_key, testnet)
             
             # 替换为 Agent 的 exchange 实例
+            client.exchange.session.close()
             client.exchange = exchange
-            client.info = info
             
             logger.info(f"✅ Agent 客户端创建成功")
             
@@ -4,7 +4,7 @@ K线数据管理器
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from collections import deque
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,9 @@ class KlineManager:
         self.klines: deque = deque(maxlen=max_klines)
         self.current_kline: Dict = None
         self.last_update_time: datetime = None
+        # 已完成K线的版本号（新K线完成时递增），用于缓存 prompt 文本
+        self._version = 0
+        self._prompt_cache: Dict[int, Tuple[int, str]] = {}
         
     def update_price(self, price: float, volume: float = 0):
         """
@@ -46,6 +49,7 @@ class KlineManager:
             if self.current_kline is not None:
                 # 保存完成的K线
                 self.klines.append(self.current_kline.copy())
+                self._version += 1
                 logger.info(f"📊 K线完成: {self.current_kline['time'].strftime('%H:%M')} "
                            f"O:{self.current_kline['open']:.0f} H:{self.current_kline['high']:.0f} "
                            f"L:{self.current_kline['low']:.0f} C:{self.current_kline['close']:.0f}")
@@ -164,6 +168,17 @@ class KlineManager:
         Returns:
             格式化的字符串
         """
+        # 只使用已完成的K线，K线未变化时直接复用上次的格式化结果
+        cached = self._prompt_cache.get(max_rows)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        
+        text = self._format_for_prompt(max_rows)
+        self._prompt_cache[max_rows] = (self._version, text)
+        return text
+    
+    def _format_for_prompt(self, max_rows: int) -> str:
+        """生成K线 prompt 文本"""
         klines = self.get_klines(max_rows)
         
         if len(klines) == 0:
@@ -2,8 +2,11 @@
 多平台交易管理器
 同时管理多个交易平台，执行相同的交易决策并对比收益
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
 from datetime import datetime
 from ai_models.base_ai import TradingDecision
 from trading.base_client import BaseExchangeClient
@@ -13,6 +16,14 @@ from utils.redis_manager import redis_manager
 logger = logging.getLogger(__name__)
 
 
+def _trade_time_ms(trade: Dict) -> Optional[int]:
+    """解析交易时间为毫秒时间戳（无法解析时返回 None）"""
+    try:
+        return int(datetime.fromisoformat(trade["time"]).timestamp() * 1000)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 class PlatformTrader:
     """单个平台的交易器"""
     
@@ -65,8 +76,21 @@ class PlatformTrader:
             try:
                 historical_trades = redis_manager.get_trades(group_name, self.name)
                 if historical_trades:
+                    # 入库时计算毫秒时间戳（交易按时间顺序存储，供 /api/chart 二分查找）
+                    # 时间无法解析的交易仍计入统计，沿用前一笔的时间戳保持有序，并标记为不在图表中展示
+                    invalid_count = 0
+                    last_time_ms = 0
+                    for trade in historical_trades:
+                        time_ms = _trade_time_ms(trade)
+                        if time_ms is None:
+                            invalid_count += 1
+                            trade["time_invalid"] = True
+                            time_ms = last_time_ms
+                        trade["time_ms"] = last_time_ms = time_ms
                     self.stats["trades"] = historical_trades
                     logger.info(f"[{self.name}] 📚 从Redis恢复 {len(historical_trades)} 笔历史交易记录")
+                    if invalid_count:
+                        logger.warning(f"[{self.name}] ⚠️ {invalid_count} 笔历史交易时间无法解析，不在图表中展示")
             except Exception as e:
                 logger.error(f"[{self.name}] ❌ 恢复历史交易记录失败: {e}")
     
@@ -106,7 +130,8 @@ class PlatformTrader:
         if result:
             trade_record = {
                 **result,
-                "platform": self.client.platform_name
+                "platform": self.client.platform_name,
+                "time_ms": _trade_time_ms(result) or int(time.time() * 1000)
             }
             self.stats["trades"].append(trade_record)
             self.stats["total_trades"] = len([t for t in self.stats["trades"] if t.get('action') == 'close'])
@@ -148,7 +173,8 @@ class MultiPlatformTrader:
     def __init__(self):
         """初始化多平台交易管理器"""
         self.platform_traders: Dict[str, PlatformTrader] = {}
-        self.decision_history: List[Dict] = []
+        self.decision_history: Deque[Dict] = deque(maxlen=100)  # 最近100条决策（含各平台下单结果）
+        self.total_decisions = 0
     
     def add_platform(self, client: BaseExchangeClient, name: str = None):
         """
@@ -211,7 +237,6 @@ class MultiPlatformTrader:
         }
         
         # 并行执行（可选：也可以顺序执行）
-        import asyncio
         tasks = []
         for name, trader in self.platform_traders.items():
             tasks.append(trader.execute_decision(coin, decision, confidence, reasoning, current_price, group_name))
@@ -224,13 +249,17 @@ class MultiPlatformTrader:
             decision_record["results"][name] = result
         
         self.decision_history.append(decision_record)
+        self.total_decisions += 1
         
         return results
     
+    def has_open_positions(self) -> bool:
+        """任一平台是否持有仓位"""
+        return any(trader.auto_trader.positions for trader in self.platform_traders.values())
+    
     async def update_all_stats(self):
-        """更新所有平台的统计数据"""
-        for trader in self.platform_traders.values():
-            await trader.update_stats()
+        """并发更新所有平台的统计数据"""
+        await asyncio.gather(*(trader.update_stats() for trader in self.platform_traders.values()))
     
     def get_comparison_stats(self) -> Dict:
         """
@@ -242,7 +271,7 @@ class MultiPlatformTrader:
         comparison = {
             "platforms": [],
             "summary": {
-                "total_decisions": len(self.decision_history),
+                "total_decisions": self.total_decisions,
                 "best_platform": None,
                 "worst_platform": None,
                 "avg_roi": 0.0
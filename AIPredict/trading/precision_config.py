@@ -3,9 +3,12 @@
 
 统一管理不同交易所、不同币种的精度要求
 """
+import asyncio
 from decimal import Decimal
 from typing import Dict, Tuple
 
+from utils.singleflight import SingleFlight
+
 
 class PrecisionConfig:
     """精度配置管理器"""
@@ -50,6 +53,9 @@ class PrecisionConfig:
         }
     }
     
+    # 动态精度查询的并发合并器（同一币种同时只发起一次查询）
+    _precision_flight = SingleFlight()
+    
     @classmethod
     def get_aster_precision(cls, coin: str) -> Dict:
         """
@@ -159,6 +165,26 @@ class PrecisionConfig:
         # 失败时返回 BTC 配置
         return cls.HYPERLIQUID_PRECISION["BTC"]
     
+    @classmethod
+    async def get_hyperliquid_precision_async(cls, coin: str) -> Dict:
+        """
+        获取Hyperliquid平台的精度配置（异步版本）
+        
+        缓存未命中时在线程池中查询，同一币种的并发请求只发起一次查询
+        
+        Args:
+            coin: 币种符号（如 BTC, ETH）
+            
+        Returns:
+            精度配置字典
+        """
+        if coin in cls.HYPERLIQUID_PRECISION:
+            return cls.HYPERLIQUID_PRECISION[coin]
+        
+        return await cls._precision_flight.do(
+            coin, lambda: asyncio.to_thread(cls.get_hyperliquid_precision, coin)
+        )
+    
     @classmethod
     def format_aster_quantity(cls, coin: str, quantity: float, round_down: bool = True) -> Tuple[float, str]:
         """
@@ -0,0 +1,41 @@
+"""
+异步限流工具（令牌桶）
+限制单位时间内的调用次数，超出时排队等待而不是直接失败
+"""
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """异步令牌桶限流器"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        """
+        Args:
+            rate: 每个周期允许的调用次数（同时也是突发上限）
+            period: 周期长度（秒）
+        """
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """获取一个令牌（令牌不足时等待补充）"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated_at) * self.rate / self.period)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -2,6 +2,7 @@
 Redis 数据管理器
 用于存储和获取余额历史数据
 """
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -24,6 +25,15 @@ try:
 except ImportError:
     HAS_FAKEREDIS = False
 
+# 余额快照体积大且读写频繁，优先使用 orjson 编解码（解析失败同样抛出 json.JSONDecodeError 的子类）
+try:
+    import orjson
+    _dumps_snapshot = orjson.dumps
+    _loads_snapshot = orjson.loads
+except ImportError:
+    _dumps_snapshot = json.dumps
+    _loads_snapshot = json.loads
+
 
 class RedisManager:
     """Redis 数据管理器"""
@@ -74,13 +84,17 @@ class RedisManager:
         except:
             return False
     
-    def save_balance_snapshot(self, accounts: List[Dict]):
+    async def save_balance_snapshot(self, accounts: List[Dict]):
         """
-        保存余额快照
+        保存余额快照（Redis I/O 在线程池中执行，不阻塞事件循环）
         
         Args:
             accounts: 账户列表，每个账户包含 group, platform, balance, pnl, roi
         """
+        await asyncio.to_thread(self._save_balance_snapshot, accounts)
+    
+    def _save_balance_snapshot(self, accounts: List[Dict]):
+        """保存余额快照（同步实现）"""
         if not self.is_connected():
             logger.warning("Redis 未连接，跳过保存余额快照")
             return
@@ -92,24 +106,28 @@ class RedisManager:
                 "accounts": accounts
             }
             
-            # 使用 LPUSH 添加到列表头部（最新数据在前）
+            # 写入、裁剪、过期三条命令合并为一次 pipeline 往返
             key = "balance_history"
-            self.redis_client.lpush(key, json.dumps(snapshot))
+            pipe = self.redis_client.pipeline(transaction=False)
+            
+            # 使用 LPUSH 添加到列表头部（最新数据在前）
+            pipe.lpush(key, _dumps_snapshot(snapshot))
             
             # 限制列表长度（保留最近 10000 个数据点，约 34.7 天的数据，5秒一个点）
-            self.redis_client.ltrim(key, 0, 9999)
+            pipe.ltrim(key, 0, 9999)
             
             # 设置过期时间
-            self.redis_client.expire(key, settings.balance_history_ttl)
+            pipe.expire(key, settings.balance_history_ttl)
+            pipe.execute()
             
             logger.debug(f"💾 已保存余额快照: {len(accounts)} 个账户")
             
         except Exception as e:
             logger.error(f"保存余额快照失败: {e}")
     
-    def get_balance_history(self, limit: int = -1) -> List[Dict]:
+    async def get_balance_history(self, limit: int = -1) -> List[Dict]:
         """
-        获取余额历史
+        获取余额历史（Redis I/O 和 JSON 解析在线程池中执行，不阻塞事件循环）
         
         Args:
             limit: 返回最近的N条记录，-1表示返回所有记录
@@ -117,6 +135,10 @@ class RedisManager:
         Returns:
             余额历史列表，按时间倒序（最新的在前）
         """
+        return await asyncio.to_thread(self._get_balance_history, limit)
+    
+    def _get_balance_history(self, limit: int) -> List[Dict]:
+        """获取余额历史（同步实现）"""
         if not self.is_connected():
             logger.warning("Redis 未连接，返回空历史")
             return []
@@ -132,7 +154,7 @@ class RedisManager:
             history = []
             for item in raw_data:
                 try:
-                    snapshot = json.loads(item)
+                    snapshot = _loads_snapshot(item)
                     history.append(snapshot)
                 except json.JSONDecodeError as e:
                     logger.error(f"解析余额快照失败: {e}")
@@ -251,6 +273,43 @@ class RedisManager:
         except Exception as e:
             logger.error(f"追加 {model_name} 响应失败: {e}")
     
+    def get_ai_decision(self, key: str) -> Optional[Dict]:
+        """
+        获取缓存的 AI 决策
+        
+        Args:
+            key: 行情快照哈希
+            
+        Returns:
+            决策数据，未命中或已过期返回None
+        """
+        if not self.redis_client:
+            return None
+        
+        try:
+            raw = self.redis_client.get(f"ai_decision:{key}")
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.error(f"获取AI决策缓存失败: {e}")
+            return None
+    
+    def save_ai_decision(self, key: str, decision: Dict, ttl: int = 60):
+        """
+        缓存 AI 决策（短期有效）
+        
+        Args:
+            key: 行情快照哈希
+            decision: 决策数据
+            ttl: 过期时间（秒）
+        """
+        if not self.redis_client:
+            return
+        
+        try:
+            self.redis_client.setex(f"ai_decision:{key}", ttl, json.dumps(decision))
+        except Exception as e:
+            logger.error(f"缓存AI决策失败: {e}")
+    
     def save_trade(self, group_name: str, platform_name: str, trade: Dict):
         """
         保存单笔交易记录
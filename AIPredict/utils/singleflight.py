@@ -0,0 +1,45 @@
+"""
+请求合并（single-flight）工具
+同一 key 的并发调用只真正执行一次，其余调用方等待并共享同一结果
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """按 key 合并并发请求"""
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行（或加入正在执行的）请求
+        
+        Args:
+            key: 请求的合并键（如币种符号）
+            fn: 无参协程工厂，仅在当前没有同 key 请求在途时调用
+        
+        Returns:
+            fn 的返回值（异常同样会传递给所有等待方）
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+        
+        # shield：单个调用方被取消时不影响其他等待方
+        return await asyncio.shield(task)
+    
+    def _done(self, key: Hashable, task: asyncio.Task):
+        """请求完成后移除在途记录"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 标记异常已被读取，避免所有等待方都被取消时出现 "never retrieved" 警告
+        if not task.cancelled():
+            task.exception()
+    
+    def in_flight(self, key: Hashable) -> bool:
+        """检查指定 key 是否有请求在途"""
+        return key in self._inflight
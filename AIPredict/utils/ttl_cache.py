@@ -0,0 +1,53 @@
+"""
+带过期时间的内存缓存工具
+条目在 ttl 秒后失效，超过 maxsize 时淘汰最早写入的条目
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """简单的进程内 TTL 缓存"""
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0):
+        """
+        Args:
+            maxsize: 最大条目数
+            ttl: 条目有效期（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """读取未过期的条目，不存在或已过期时返回 default"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """写入条目（可单独指定有效期）"""
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """移除条目（用于出错时主动失效）"""
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()